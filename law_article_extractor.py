@@ -1,106 +1,216 @@
+import os
 import re
-from typing import List, Dict
+import multiprocessing
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, List, Dict, Sequence
 
+from law_name_dictionary import LawNameDictionary
 
-def extract_law_articles(text: str) -> List[Dict[str, str]]:
+
+# 접두 문자: 법령명 앞에 올 수 있는 문자 (문서 시작 또는 공백/따옴표/괄호/파이프)
+_PREFIX = r"""[\s"'\(\[|]"""
+_ARTICLE_SUFFIX = r"\s*(?:\[[^\]]*\]\s*)*제\s*(\d+)\s*조"
+
+# 법령명 앞부분(한글+공백)의 최대 길이. 제한이 없으면 문장부호 없이 한글과 공백만
+# 이어지는 텍스트(메뉴, 표 등)에서 시작 위치마다 끝까지 훑어 시간이 제곱으로 늘어남
+# (긴 공식 법령명도 40자 안팎이므로 여유 있게 잡음)
+_MAX_LAW_NAME_LENGTH = 60
+# 법령명은 줄을 넘지 않으므로 줄바꿈은 포함하지 않음 (메뉴 항목이 법령명에 붙지 않도록)
+_LAW_NAME_RUN = rf"[가-힣 \t\u00a0\u3000]{{1,{_MAX_LAW_NAME_LENGTH}}}"
+
+# (법령명 패턴, 접두 문자 필요 여부) - 순서가 우선순위 (같은 위치에서는 앞의 패턴 우선)
+_LAW_ARTICLE_PATTERNS = [
+    (rf"({_LAW_NAME_RUN}법률\s*시행규칙)", True),
+    (rf"({_LAW_NAME_RUN}법률\s*시행령)", True),
+    (rf"({_LAW_NAME_RUN}법\s*시행규칙)", True),
+    (rf"({_LAW_NAME_RUN}법\s*시행령)", True),
+    (rf"({_LAW_NAME_RUN}법)", True),
+    (r"([가-힣]+조례)", True),
+    (r"([가-힣]+규칙)", True),
+    (r"부칙", False),
+]
+
+
+def _compile_law_article_pattern(at_cursor: bool) -> re.Pattern:
+    """
+    모든 법령 패턴을 하나의 정규식으로 합칩니다.
+    각 대안은 (?P<p{i}>...) 그룹으로 감싸 어떤 패턴이 매칭되었는지 lastgroup으로 구분합니다.
+
+    Args:
+        at_cursor: True이면 접두 문자를 생략할 수 있는 패턴을 만듭니다.
+            (이전 매칭 직후 위치에서 '^'가 매칭되던 기존 동작을 재현하기 위함)
+    """
+    alternatives = []
+    for i, (name_pattern, needs_prefix) in enumerate(_LAW_ARTICLE_PATTERNS):
+        if needs_prefix:
+            prefix = f"(?:|{_PREFIX})" if at_cursor else f"(?:^|{_PREFIX})"
+        else:
+            prefix = ""
+        alternatives.append(f"(?P<p{i}>{prefix}{name_pattern}{_ARTICLE_SUFFIX})")
+    return re.compile("|".join(alternatives), re.IGNORECASE)
+
+
+_LAW_ARTICLE_RE = _compile_law_article_pattern(at_cursor=False)
+_LAW_ARTICLE_AT_CURSOR_RE = _compile_law_article_pattern(at_cursor=True)
+
+# 사전 모드: 법령명 바로 뒤에 오는 조문번호 (「건축법」처럼 닫는 괄호/따옴표 허용)
+_ARTICLE_AFTER_NAME_RE = re.compile(r"""[」』"'\)]?""" + _ARTICLE_SUFFIX)
+
+
+def _clean_law_name(
+    match: re.Match, pattern_index: int, group: int
+) -> tuple[str, str]:
+    """매칭 결과에서 법령명과 조문번호를 정리하여 반환 (group: 대안을 감싼 그룹 번호)"""
+    if pattern_index < 5:
+        law_name = match.group(group + 1).strip()
+        # '조문정보' 등 불필요한 앞 단어 사전 제거
+        law_name = re.sub(r"^(조문정보|연계정보|\d+\.|\s+)+", "", law_name)
+        # 맨 앞에 한글이 아닌 부분 제거
+        law_name = re.sub(r"^[^가-힣]+", "", law_name)
+        # 모든 법령명 매치 찾기 (end()가 가장 큰 매치)
+        all_matches = list(
+            re.finditer(
+                r"([가-힣]{2,}\s*)+(법률\s*시행규칙|법률\s*시행령|법\s*시행규칙|법\s*시행령|법)",
+                law_name,
+            )
+        )
+        if all_matches:
+            last_match = max(all_matches, key=lambda m: m.end())
+            law_name = law_name[: last_match.end()].strip()
+            # 한글 2자 이상으로 시작하는 부분만 남기기
+            m2 = re.search(r"[가-힣]{2,}.*", law_name)
+            if m2:
+                law_name = m2.group(0).strip()
+        return law_name, match.group(group + 2)
+
+    if _LAW_ARTICLE_PATTERNS[pattern_index][0] == "부칙":
+        return "부칙", match.group(group + 1)
+
+    raw_name = match.group(group + 1)
+    law_name = raw_name.strip() if raw_name else ""
+    article_num = match.group(group + 2)
+    # 이하 후처리 동일
+    cleaned = re.sub(r"\[[^\]]*\]", "", match.group(0))
+    m = re.search(r"(.+?)제\s*\d+\s*조", cleaned)
+    if m:
+        temp_law_name = m.group(1).strip()
+        law_match = re.search(
+            r"([가-힣\s]*(?:법률|법)\s*(?:시행규칙|시행령))$", temp_law_name
+        )
+        if law_match:
+            law_name = law_match.group(1).strip()
+        else:
+            law_match2 = re.search(r"([가-힣\s]*(?:법|법률))$", temp_law_name)
+            if law_match2:
+                law_name = law_match2.group(1).strip()
+            else:
+                law_name = temp_law_name
+    else:
+        law_name = re.sub(r"^[^가-힣]+|[^가-힣\s]+$", "", law_name).strip()
+    return law_name, article_num
+
+
+def _extract_with_dictionary(
+    text: str, law_names: LawNameDictionary
+) -> List[Dict[str, str]]:
+    """법령명 사전으로 '제N조' 앞의 가장 긴 공식 법령명을 한 번의 순회로 찾기"""
+    found_articles = []
+    seen_keys = set()
+    # 공백을 제외하고 읽은 문자들의 원문 위치
+    char_positions = []
+    state = 0
+    pos = 0
+
+    while pos < len(text):
+        char = text[pos]
+        if char.isspace():
+            pos += 1
+            continue
+
+        char_positions.append(pos)
+        state = law_names.step(state, char)
+        longest = law_names.longest_match(state)
+        pos += 1
+        if longest is None:
+            continue
+
+        name_length, law_name = longest
+        start = char_positions[-name_length]
+        # 법령명 앞이 한글이면 더 긴 단어의 일부이므로 무시 (예: "도시건축법")
+        if start > 0 and "가" <= text[start - 1] <= "힣":
+            continue
+
+        match = _ARTICLE_AFTER_NAME_RE.match(text, pos)
+        if match is None:
+            continue
+
+        article_num = match.group(1)
+        end = match.end()
+        article_key = f"{law_name}_{article_num}"
+        if article_key not in seen_keys:
+            seen_keys.add(article_key)
+            found_articles.append(
+                {
+                    "law_name": law_name,
+                    "article_num": article_num,
+                    "key": article_key,
+                    "full_text": text[start:end],
+                    "start_pos": start,
+                    "end_pos": end,
+                }
+            )
+
+        # 조문번호 이후부터 다시 검색
+        state = 0
+        pos = end
+
+    return found_articles
+
+
+def extract_law_articles(
+    text: str, law_names: LawNameDictionary | None = None
+) -> List[Dict[str, str]]:
     """
     텍스트에서 법령+조항 번호 쌍을 찾아냅니다.
+    모든 패턴을 합친 정규식으로 문서를 한 번만 앞에서부터 훑으며,
+    start_pos/end_pos는 문서 전체 기준의 절대 위치입니다.
     Args:
         text: 분석할 텍스트
+        law_names: 법령명 사전. 주어지면 정규식 대신 사전에 있는 공식 법령명만 인식
+            (부칙은 법령명이 아니므로 추출하지 않음)
     Returns:
         찾아진 법령+조항 정보 리스트
     """
     if not text:
         return []
 
-    patterns = [
-        r'(?:^|[\s"\'\(\[|])([가-힣\s]+법률\s*시행규칙)\s*(?:\[[^\]]*\]\s*)*제\s*(\d+)\s*조',
-        r'(?:^|[\s"\'\(\[|])([가-힣\s]+법률\s*시행령)\s*(?:\[[^\]]*\]\s*)*제\s*(\d+)\s*조',
-        r'(?:^|[\s"\'\(\[|])([가-힣\s]+법\s*시행규칙)\s*(?:\[[^\]]*\]\s*)*제\s*(\d+)\s*조',
-        r'(?:^|[\s"\'\(\[|])([가-힣\s]+법\s*시행령)\s*(?:\[[^\]]*\]\s*)*제\s*(\d+)\s*조',
-        r'(?:^|[\s"\'\(\[|])([가-힣\s]+법)\s*(?:\[[^\]]*\]\s*)*제\s*(\d+)\s*조',
-        r'(?:^|[\s"\'\(\[|])([가-힣]+조례)\s*(?:\[[^\]]*\]\s*)*제\s*(\d+)\s*조',
-        r'(?:^|[\s"\'\(\[|])([가-힣]+규칙)\s*(?:\[[^\]]*\]\s*)*제\s*(\d+)\s*조',
-        r"부칙\s*(?:\[[^\]]*\]\s*)*제\s*(\d+)\s*조",
-    ]
+    if law_names is not None:
+        return _extract_with_dictionary(text, law_names)
 
     found_articles = []
-    used_ranges = []
-    remaining_text = text
-
-    while remaining_text:
-        best_match = None
-        best_pattern_index = -1
-
-        # 모든 패턴에서 첫 번째 매칭을 찾아서 가장 앞에 있는 것을 선택
-        for i, pattern in enumerate(patterns):
-            match = re.search(pattern, remaining_text, re.IGNORECASE)
-            if match:
-                if best_match is None or match.start() < best_match.start():
-                    best_match = match
-                    best_pattern_index = i
-
-        if best_match is None:
+    seen_keys = set()
+    pos = 0
+
+    while pos < len(text):
+        # 직전 매칭 바로 다음 위치에서는 접두 문자 없이도 매칭 허용
+        match = _LAW_ARTICLE_AT_CURSOR_RE.match(text, pos) if pos else None
+        if match is None:
+            match = _LAW_ARTICLE_RE.search(text, pos)
+        if match is None:
             break
 
-        pattern = patterns[best_pattern_index]
-        match = best_match
+        # 매칭된 대안의 번호와 그 대안을 감싼 그룹 번호
+        pattern_key = match.lastgroup
+        law_name, article_num = _clean_law_name(
+            match, int(pattern_key[1:]), match.re.groupindex[pattern_key]
+        )
         start, end = match.start(), match.end()
 
-        # 이미 추출된 범위와 겹치면 무시
-        if any(not (end <= r[0] or start >= r[1]) for r in used_ranges):
-            remaining_text = remaining_text[end:]
-            continue
-
-        # 패턴별 그룹 조합
-        if pattern in patterns[:5]:
-            law_name = match.group(1).strip()
-            # '조문정보' 등 불필요한 앞 단어 사전 제거
-            law_name = re.sub(r"^(조문정보|연계정보|\d+\.|\s+)+", "", law_name)
-            # 맨 앞에 한글이 아닌 부분 제거
-            law_name = re.sub(r"^[^가-힣]+", "", law_name)
-            # 모든 법령명 매치 찾기 (end()가 가장 큰 매치)
-            all_matches = list(
-                re.finditer(
-                    r"([가-힣]{2,}\s*)+(법률\s*시행규칙|법률\s*시행령|법\s*시행규칙|법\s*시행령|법)",
-                    law_name,
-                )
-            )
-            if all_matches:
-                last_match = max(all_matches, key=lambda m: m.end())
-                law_name = law_name[: last_match.end()].strip()
-                # 한글 2자 이상으로 시작하는 부분만 남기기
-                m2 = re.search(r"[가-힣]{2,}.*", law_name)
-                if m2:
-                    law_name = m2.group(0).strip()
-            article_num = match.group(2)
-        elif pattern.startswith("부칙"):
-            law_name = "부칙"
-            article_num = match.group(1)
-        else:
-            law_name = match.group(1).strip() if match.group(1) else ""
-            article_num = match.group(2)
-            # 이하 후처리 동일
-            cleaned = re.sub(r"\[[^\]]*\]", "", match.group(0))
-            m = re.search(r"(.+?)제\s*\d+\s*조", cleaned)
-            if m:
-                temp_law_name = m.group(1).strip()
-                law_match = re.search(
-                    r"([가-힣\s]*(?:법률|법)\s*(?:시행규칙|시행령))$", temp_law_name
-                )
-                if law_match:
-                    law_name = law_match.group(1).strip()
-                else:
-                    law_match2 = re.search(r"([가-힣\s]*(?:법|법률))$", temp_law_name)
-                    if law_match2:
-                        law_name = law_match2.group(1).strip()
-                    else:
-                        law_name = temp_law_name
-            else:
-                law_name = re.sub(r"^[^가-힣]+|[^가-힣\s]+$", "", law_name).strip()
-
         article_key = f"{law_name}_{article_num}"
-        if not any(article["key"] == article_key for article in found_articles):
+        if article_key not in seen_keys:
+            seen_keys.add(article_key)
             found_articles.append(
                 {
                     "law_name": law_name,
@@ -111,12 +221,10 @@ def extract_law_articles(text: str) -> List[Dict[str, str]]:
                     "end_pos": end,
                 }
             )
-            used_ranges.append((start, end))
 
         # 처리한 부분 이후부터 다시 검색
-        remaining_text = remaining_text[end:]
+        pos = end
 
-    found_articles.sort(key=lambda x: x["start_pos"])
     return found_articles
 
 
@@ -198,7 +306,9 @@ def extract_referenced_articles(
 
 
 def extract_all_articles_with_references(
-    text: str, current_law_name: str | None = None
+    text: str,
+    current_law_name: str | None = None,
+    law_names: LawNameDictionary | None = None,
 ) -> Dict[str, List[Dict[str, str]]]:
     """
     텍스트에서 직접 언급된 법령 조항과 참조 조항을 모두 추출합니다.
@@ -206,11 +316,12 @@ def extract_all_articles_with_references(
     Args:
         text: 분석할 텍스트
         current_law_name: 현재 법령명 (참조 해석용)
+        law_names: 법령명 사전 (extract_law_articles 참고)
     Returns:
         직접 언급된 조항과 참조 조항을 포함한 딕셔너리
     """
     # 직접 언급된 법령 조항 추출
-    direct_articles = extract_law_articles(text)
+    direct_articles = extract_law_articles(text, law_names)
 
     # 참조 조항 추출 (현재 법령명이 있는 경우)
     referenced_articles = []
@@ -222,3 +333,133 @@ def extract_all_articles_with_references(
         "referenced_articles": referenced_articles,
         "all_articles": direct_articles + referenced_articles,
     }
+
+
+def _extract_law_articles_item(
+    text: str, law_names: LawNameDictionary | None
+) -> List[Dict[str, str]]:
+    return extract_law_articles(text, law_names)
+
+
+def _extract_all_articles_item(
+    item: tuple, law_names: LawNameDictionary | None
+) -> Dict[str, List[Dict[str, str]]]:
+    text, current_law_name = item
+    return extract_all_articles_with_references(text, current_law_name, law_names)
+
+
+# 프로세스 풀 작업자가 쓰는 법령명 사전 (작업마다 보내지 않고 initializer로 한 번만 전달)
+# 작업자 프로세스에서만 설정되며, 현재 프로세스에서 처리할 때는 사전을 직접 넘김
+_worker_law_names: LawNameDictionary | None = None
+
+
+def _init_worker(law_names: LawNameDictionary | None):
+    global _worker_law_names
+    _worker_law_names = law_names
+
+
+def _run_in_worker(extract: Callable, item):
+    return extract(item, _worker_law_names)
+
+
+def _run_batch(
+    extract: Callable,
+    items: List,
+    law_names: LawNameDictionary | None,
+    max_workers: int | None,
+    chunksize: int | None,
+    min_batch_size: int,
+) -> List:
+    """items를 프로세스 풀에 나눠 extract(item, law_names)로 처리 (입력 순서대로 결과 반환)"""
+    max_workers = max_workers or os.process_cpu_count() or 1
+    if len(items) < min_batch_size or max_workers <= 1:
+        # 적은 입력은 프로세스를 띄우는 비용이 더 큼
+        return [extract(item, law_names) for item in items]
+
+    max_workers = min(max_workers, len(items))
+    if chunksize is None:
+        # 작업자마다 4묶음 정도 돌아가게 해서 IPC 횟수를 줄이면서 부하도 고르게 분산
+        chunksize = max(1, len(items) // (max_workers * 4))
+    try:
+        # 실행 중인 앱에는 스레드(to_thread 작업자, DNS 조회 등)가 있어 fork는 안전하지 않음
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(law_names,),
+        ) as executor:
+            return list(
+                executor.map(
+                    partial(_run_in_worker, extract), items, chunksize=chunksize
+                )
+            )
+    except (BrokenProcessPool, OSError) as e:
+        # 프로세스를 만들 수 없는 환경이면 현재 프로세스에서 처리
+        print(f"⚠️  프로세스 풀을 쓸 수 없어 현재 프로세스에서 추출합니다: {e}")
+        return [extract(item, law_names) for item in items]
+
+
+def extract_law_articles_batch(
+    texts: Sequence[str],
+    law_names: LawNameDictionary | None = None,
+    max_workers: int | None = None,
+    chunksize: int | None = None,
+    min_batch_size: int = 32,
+) -> List[List[Dict[str, str]]]:
+    """
+    여러 문서에서 법령+조항 번호 쌍을 여러 프로세스로 나눠 찾습니다.
+
+    정규식 추출은 CPU 작업이라 GIL 때문에 스레드로는 빨라지지 않으므로,
+    대량의 크롤링 페이지는 프로세스 풀에 chunksize개씩 묶어서 보냅니다.
+
+    Args:
+        texts: 분석할 텍스트 리스트
+        law_names: 법령명 사전 (extract_law_articles 참고, 작업자마다 한 번만 전달)
+        max_workers: 프로세스 수 (기본값: 이 프로세스가 쓸 수 있는 CPU 수)
+        chunksize: 한 번에 작업자에게 보낼 문서 수 (기본값: 작업자당 약 4묶음)
+        min_batch_size: 문서가 이보다 적으면 프로세스 풀 없이 현재 프로세스에서 처리
+    Returns:
+        texts와 같은 순서의 extract_law_articles 결과 리스트
+    """
+    return _run_batch(
+        _extract_law_articles_item,
+        list(texts),
+        law_names,
+        max_workers,
+        chunksize,
+        min_batch_size,
+    )
+
+
+def extract_all_articles_with_references_batch(
+    texts: Sequence[str],
+    current_law_names: Sequence[str | None] | str | None = None,
+    law_names: LawNameDictionary | None = None,
+    max_workers: int | None = None,
+    chunksize: int | None = None,
+    min_batch_size: int = 32,
+) -> List[Dict[str, List[Dict[str, str]]]]:
+    """
+    여러 문서에서 직접 언급된 조항과 참조 조항을 여러 프로세스로 나눠 추출합니다.
+
+    Args:
+        texts: 분석할 텍스트 리스트
+        current_law_names: 문서별 현재 법령명 리스트 (하나만 주면 모든 문서에 적용)
+        law_names: 법령명 사전 (extract_law_articles 참고)
+        max_workers, chunksize, min_batch_size: extract_law_articles_batch 참고
+    Returns:
+        texts와 같은 순서의 extract_all_articles_with_references 결과 리스트
+    """
+    texts = list(texts)
+    if current_law_names is None or isinstance(current_law_names, str):
+        current_law_names = [current_law_names] * len(texts)
+    elif len(current_law_names) != len(texts):
+        raise ValueError("current_law_names와 texts의 길이가 다릅니다.")
+    return _run_batch(
+        _extract_all_articles_item,
+        list(zip(texts, current_law_names)),
+        law_names,
+        max_workers,
+        chunksize,
+        min_batch_size,
+    )
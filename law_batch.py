@@ -0,0 +1,224 @@
+import os
+import json
+import time
+import asyncio
+from typing import Any, Dict, List, Optional, Set
+
+from law_search_integrated import LawSearchIntegrated
+
+
+def load_questions(path: str) -> List[Dict[str, str]]:
+    """
+    JSONL 질문 파일 읽기
+
+    한 줄에 {"id": ..., "question": ...} 하나 ("question" 대신 "query"도 허용).
+    id가 없으면 줄 번호를 id로 쓰고, 같은 id가 여러 번 나오면 처음 것만 사용합니다.
+    """
+    questions = []
+    seen: Set[str] = set()
+    with open(path, encoding="utf-8") as f:
+        for line_num, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                item = json.loads(line)
+            except json.JSONDecodeError as e:
+                print(f"⚠️  {path}:{line_num} JSON 오류로 건너뜀: {e}")
+                continue
+            question = item.get("question") or item.get("query")
+            if not question:
+                print(f"⚠️  {path}:{line_num} 질문이 없어 건너뜀")
+                continue
+            qid = str(item.get("id", line_num))
+            if qid in seen:
+                continue
+            seen.add(qid)
+            questions.append({"id": qid, "question": question})
+    return questions
+
+
+def load_finished_ids(path: str, retry_failed: bool = False) -> Set[str]:
+    """
+    이전 실행의 결과 파일에서 이미 처리한 질문 id를 읽습니다.
+
+    중단되어 마지막 줄이 반쯤 쓰인 경우 그 줄을 잘라내서 이어쓰기가 깨지지 않게 합니다.
+
+    Args:
+        path: 결과 JSONL 파일
+        retry_failed: True이면 실패한 질문은 다시 처리하도록 제외
+    Returns:
+        건너뛸 질문 id 집합
+    """
+    finished: Set[str] = set()
+    if not os.path.exists(path):
+        return finished
+
+    valid_end = 0
+    with open(path, "rb") as f:
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                break
+            valid_end += len(line)
+            if record.get("success") or not retry_failed:
+                finished.add(record["id"])
+
+    if valid_end < os.path.getsize(path):
+        print(f"⚠️  결과 파일의 불완전한 마지막 줄을 잘라냅니다: {path}")
+        with open(path, "r+b") as f:
+            f.truncate(valid_end)
+    return finished
+
+
+async def run_batch(
+    input_path: str,
+    output_path: str,
+    workers: int = 4,
+    domains: List[str] | None = None,
+    num_results: int = 5,
+    retry_failed: bool = False,
+    searcher: Optional[LawSearchIntegrated] = None,
+) -> Dict[str, int]:
+    """
+    JSONL 질문 파일을 동시에 처리해 결과를 JSONL로 이어씁니다.
+
+    모든 질문이 LawSearchIntegrated 하나를 공유하므로 브라우저, HTTP 세션,
+    OpenAI 클라이언트, 검색/페이지/조문/답변 캐시를 질문마다 새로 만들지 않습니다.
+    결과는 질문이 끝나는 대로 한 줄씩 기록(flush)하므로, 중단된 뒤 같은 명령을
+    다시 실행하면 결과 파일에 있는 질문은 건너뛰고 이어서 처리합니다.
+
+    Args:
+        input_path: 질문 JSONL 파일
+        output_path: 결과 JSONL 파일 (없으면 생성, 있으면 이어쓰기)
+        workers: 동시에 처리할 질문 수
+        domains: 검색할 도메인 리스트
+        num_results: 질문별 검색 결과 수
+        retry_failed: 이전 실행에서 실패한 질문도 다시 처리
+            (결과 파일에 새 줄로 추가되며, 같은 id는 마지막 줄이 최종 결과)
+        searcher: 공유할 검색기 (없으면 만들어서 끝나면 정리)
+    Returns:
+        {"total", "skipped", "succeeded", "failed"} 처리 통계
+    Raises:
+        ValueError: workers가 1보다 작은 경우
+    """
+    if workers < 1:
+        raise ValueError(f"workers는 1 이상이어야 합니다: {workers}")
+
+    questions = load_questions(input_path)
+    finished = load_finished_ids(output_path, retry_failed)
+    todo = [q for q in questions if q["id"] not in finished]
+    stats = {
+        "total": len(questions),
+        "skipped": len(questions) - len(todo),
+        "succeeded": 0,
+        "failed": 0,
+    }
+    print(
+        f"📦 배치 시작: 질문 {len(questions)}개 "
+        f"(처리 {len(todo)}개, 이미 완료 {stats['skipped']}개, 작업자 {workers}개)"
+    )
+    if not todo:
+        return stats
+
+    queue: asyncio.Queue = asyncio.Queue()
+    for item in todo:
+        queue.put_nowait(item)
+    started_at = time.perf_counter()
+    done = 0
+
+    async def worker(searcher: LawSearchIntegrated, out):
+        nonlocal done
+        while True:
+            try:
+                item = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            item_started_at = time.perf_counter()
+            record: Dict[str, Any] = {"id": item["id"], "question": item["question"]}
+            try:
+                result = await searcher.crawl_and_extract_laws(
+                    item["question"], domains, num_results
+                )
+                record["success"] = bool(result.get("success"))
+                record["result"] = result
+            except Exception as e:
+                record["success"] = False
+                record["error"] = f"{type(e).__name__}: {e}"
+            record["elapsed"] = round(time.perf_counter() - item_started_at, 3)
+
+            # 한 줄씩 바로 기록 (이벤트 루프 안에서는 줄이 섞이지 않음)
+            out.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+            out.flush()
+
+            done += 1
+            stats["succeeded" if record["success"] else "failed"] += 1
+            print(
+                f"{'✅' if record['success'] else '❌'} [{done}/{len(todo)}] "
+                f"{item['id']} ({record['elapsed']:.1f}초)"
+            )
+
+    owns_searcher = searcher is None
+    if owns_searcher:
+        searcher = LawSearchIntegrated()
+    try:
+        await searcher.start()
+        with open(output_path, "a", encoding="utf-8") as out:
+            await asyncio.gather(
+                *(worker(searcher, out) for _ in range(min(workers, len(todo))))
+            )
+    finally:
+        if owns_searcher:
+            await searcher.close()
+
+    elapsed = time.perf_counter() - started_at
+    print(
+        f"📦 배치 완료: 성공 {stats['succeeded']}개, 실패 {stats['failed']}개 "
+        f"({elapsed:.1f}초, 질문당 {elapsed / len(todo):.2f}초)"
+    )
+    print(f"📊 캐시 통계: {searcher.cache_stats()}")
+    return stats
+
+
+async def main():
+    """질문 JSONL 파일을 일괄 처리"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="법령 질문 일괄 처리")
+    parser.add_argument("input", help="질문 JSONL 파일 (한 줄에 {id, question})")
+    parser.add_argument("output", help="결과 JSONL 파일 (있으면 이어서 처리)")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.getenv("BATCH_WORKERS", "4")),
+        help="동시에 처리할 질문 수 (기본: BATCH_WORKERS 환경변수, 4)",
+    )
+    parser.add_argument("--num-results", type=int, default=5, help="검색 결과 수")
+    parser.add_argument(
+        "--law-domains", action="store_true", help="법령 사이트로 검색 범위 제한"
+    )
+    parser.add_argument(
+        "--retry-failed", action="store_true", help="이전에 실패한 질문도 다시 처리"
+    )
+    args = parser.parse_args()
+
+    searcher = LawSearchIntegrated()
+    try:
+        await run_batch(
+            args.input,
+            args.output,
+            workers=args.workers,
+            domains=searcher.get_law_domains() if args.law_domains else None,
+            num_results=args.num_results,
+            retry_failed=args.retry_failed,
+            searcher=searcher,
+        )
+    finally:
+        await searcher.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,367 @@
+import os
+import json
+import time
+import zlib
+import asyncio
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+# 캐시에 없음을 나타내는 값 (None도 캐시할 수 있도록 별도 객체 사용)
+MISSING = object()
+
+
+def get_cache_path(name: str, cache_dir: str | None = None) -> Optional[str]:
+    """
+    영구 캐시 파일 경로를 반환합니다.
+
+    Args:
+        name: 캐시 이름 (파일명으로 사용)
+        cache_dir: 캐시 디렉터리 (없으면 LAW_CACHE_DIR 환경변수 사용)
+    Returns:
+        SQLite 파일 경로 (디렉터리가 설정되지 않았으면 None)
+    """
+    cache_dir = cache_dir or os.getenv("LAW_CACHE_DIR")
+    if not cache_dir:
+        return None
+    os.makedirs(cache_dir, exist_ok=True)
+    return os.path.join(cache_dir, f"{name}.sqlite3")
+
+
+def _expires_at(ttl: float | None) -> float | None:
+    return time.time() + ttl if ttl is not None else None
+
+
+def _json_size(value: Any) -> int:
+    """값을 JSON으로 직렬화한 UTF-8 바이트 수 (메모리 사용량 추정용)"""
+    return len(json.dumps(value, ensure_ascii=False).encode("utf-8"))
+
+
+class LRUCache:
+    """TTL이 있는 메모리 LRU 캐시"""
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl: float | None = None,
+        max_bytes: int | None = None,
+    ):
+        """
+        Args:
+            max_entries: 최대 항목 수
+            ttl: 기본 유효 시간(초, None이면 만료 없음)
+            max_bytes: 값 크기(JSON 직렬화 기준) 합계 상한 (None이면 제한 없음)
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        # key -> (value, 만료 시각)
+        self._data: "OrderedDict[str, Tuple[Any, float | None]]" = OrderedDict()
+        # max_bytes가 있을 때만 항목별 크기 기록
+        self._sizes: Dict[str, int] = {}
+        self.total_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get_entry(self, key: str) -> Tuple[Any, float | None]:
+        """(값, 만료 시각) 반환. 없거나 만료되었으면 (MISSING, None)"""
+        entry = self._data.get(key)
+        if entry is None:
+            return MISSING, None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.time():
+            self.delete(key)
+            return MISSING, None
+        self._data.move_to_end(key)
+        return value, expires_at
+
+    def get(self, key: str) -> Any:
+        return self.get_entry(key)[0]
+
+    def set_entry(self, key: str, value: Any, expires_at: float | None):
+        if self.max_bytes is not None:
+            size = _json_size(value)
+            if size > self.max_bytes:
+                # 혼자서도 상한을 넘는 값은 메모리에 두지 않음
+                self.delete(key)
+                return
+            self.total_bytes += size - self._sizes.get(key, 0)
+            self._sizes[key] = size
+        self._data[key] = (value, expires_at)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_entries or (
+            self.max_bytes is not None and self.total_bytes > self.max_bytes
+        ):
+            oldest, _ = self._data.popitem(last=False)
+            self.total_bytes -= self._sizes.pop(oldest, 0)
+
+    def set(self, key: str, value: Any, ttl: float | None = None):
+        self.set_entry(key, value, _expires_at(ttl if ttl is not None else self.ttl))
+
+    def delete(self, key: str):
+        self._data.pop(key, None)
+        self.total_bytes -= self._sizes.pop(key, 0)
+
+    def delete_prefix(self, prefix: str):
+        for key in [k for k in self._data if k.startswith(prefix)]:
+            self.delete(key)
+
+    def clear(self):
+        self._data.clear()
+        self._sizes.clear()
+        self.total_bytes = 0
+
+
+class SQLiteCache:
+    """SQLite 기반 영구 캐시 (값은 JSON으로 저장)
+
+    compress=True이면 값을 zlib으로 압축해 저장하고, max_bytes를 주면
+    저장된 값의 전체 크기가 그 이하가 되도록 오래 사용되지 않은 항목부터 제거합니다.
+    전체 크기는 저장/삭제할 때마다 갱신해 두고, 상한을 넘었을 때만 정리하며
+    한 번 정리할 때 max_bytes의 EVICT_RATIO까지 비워 저장마다 정리하지 않습니다.
+
+    읽기마다 쓰기가 생기지 않도록 마지막 사용 시각(accessed_at)은 touch_interval초가
+    지난 경우에만 갱신합니다. 비동기 코드에서는 TieredCache.aget/aset으로 스레드에서
+    호출하세요.
+    """
+
+    EVICT_RATIO = 0.9
+
+    def __init__(
+        self,
+        path: str,
+        table: str = "cache",
+        ttl: float | None = None,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        compress: bool = False,
+        touch_interval: float = 60.0,
+    ):
+        self.path = path
+        self.table = table
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.compress = compress
+        self.touch_interval = touch_interval
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        # WAL: 읽기가 쓰기를 기다리지 않고, 커밋마다 fsync하지 않음 (캐시이므로 충분)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._lock, self._conn:
+            self._conn.execute(f"""CREATE TABLE IF NOT EXISTS {table} (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    expires_at REAL,
+                    accessed_at REAL NOT NULL,
+                    size INTEGER NOT NULL DEFAULT 0
+                )""")
+            # size 컬럼이 없던 이전 버전의 캐시 파일 호환
+            columns = [
+                row[1] for row in self._conn.execute(f"PRAGMA table_info({table})")
+            ]
+            if "size" not in columns:
+                self._conn.execute(
+                    f"ALTER TABLE {table} ADD COLUMN size INTEGER NOT NULL DEFAULT 0"
+                )
+            self._conn.execute(
+                f"CREATE INDEX IF NOT EXISTS {table}_accessed ON {table} (accessed_at)"
+            )
+        # 저장된 값 크기 합계 (max_bytes가 있을 때만 추적)
+        self.total_bytes = self._sum_size() if max_bytes is not None else 0
+
+    def _sum_size(self, where: str = "", params: tuple = ()) -> int:
+        row = self._conn.execute(
+            f"SELECT COALESCE(SUM(size), 0) FROM {self.table} {where}", params
+        ).fetchone()
+        return row[0]
+
+    def __len__(self) -> int:
+        with self._lock:
+            row = self._conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()
+        return row[0]
+
+    def get_entry(self, key: str) -> Tuple[Any, float | None]:
+        """(값, 만료 시각) 반환. 없거나 만료되었으면 (MISSING, None)"""
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                f"SELECT value, expires_at, accessed_at FROM {self.table} WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return MISSING, None
+            value, expires_at, accessed_at = row
+            if expires_at is not None and expires_at <= now:
+                self._delete_where("WHERE key = ?", (key,))
+                return MISSING, None
+            if now - accessed_at >= self.touch_interval:
+                self._conn.execute(
+                    f"UPDATE {self.table} SET accessed_at = ? WHERE key = ?",
+                    (now, key),
+                )
+        return self._decode(value), expires_at
+
+    def get(self, key: str) -> Any:
+        return self.get_entry(key)[0]
+
+    def _encode(self, value: Any) -> str | bytes:
+        data = json.dumps(value, ensure_ascii=False)
+        return zlib.compress(data.encode("utf-8")) if self.compress else data
+
+    @staticmethod
+    def _decode(data: str | bytes) -> Any:
+        # 압축 여부는 저장된 타입으로 구분 (압축 설정을 바꿔도 기존 항목을 읽을 수 있음)
+        if isinstance(data, bytes):
+            data = zlib.decompress(data).decode("utf-8")
+        return json.loads(data)
+
+    def set_entry(self, key: str, value: Any, expires_at: float | None):
+        data = self._encode(value)
+        size = len(data) if isinstance(data, bytes) else len(data.encode("utf-8"))
+        with self._lock, self._conn:
+            if self.max_bytes is not None:
+                self.total_bytes += size - self._sum_size("WHERE key = ?", (key,))
+            self._conn.execute(
+                f"""INSERT OR REPLACE INTO {self.table}
+                    (key, value, expires_at, accessed_at, size) VALUES (?, ?, ?, ?, ?)""",
+                (key, data, expires_at, time.time(), size),
+            )
+            if self.max_entries is not None:
+                # 가장 오래 사용되지 않은 항목부터 제거
+                self._delete_where(
+                    f"""WHERE key IN (
+                        SELECT key FROM {self.table} ORDER BY accessed_at DESC
+                        LIMIT -1 OFFSET ?
+                    )""",
+                    (self.max_entries,),
+                )
+            if self.max_bytes is not None and self.total_bytes > self.max_bytes:
+                # 최근 사용 순으로 누적 크기가 max_bytes * EVICT_RATIO를 넘는 항목 제거
+                self._conn.execute(
+                    f"""DELETE FROM {self.table} WHERE key IN (
+                        SELECT key FROM (
+                            SELECT key, SUM(size) OVER (
+                                ORDER BY accessed_at DESC, key
+                            ) AS total
+                            FROM {self.table}
+                        ) WHERE total > ?
+                    )""",
+                    (int(self.max_bytes * self.EVICT_RATIO),),
+                )
+                # 다른 프로세스가 같은 파일에 쓴 경우도 있으므로 정리 후 다시 계산
+                self.total_bytes = self._sum_size()
+
+    def _delete_where(self, where: str, params: tuple = ()):
+        """조건에 맞는 항목을 삭제하고 크기 합계를 갱신 (잠금/트랜잭션 안에서 호출)"""
+        if self.max_bytes is not None:
+            self.total_bytes -= self._sum_size(where, params)
+        self._conn.execute(f"DELETE FROM {self.table} {where}", params)
+
+    def set(self, key: str, value: Any, ttl: float | None = None):
+        self.set_entry(key, value, _expires_at(ttl if ttl is not None else self.ttl))
+
+    def delete(self, key: str):
+        with self._lock, self._conn:
+            self._delete_where("WHERE key = ?", (key,))
+
+    def delete_prefix(self, prefix: str):
+        escaped = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        with self._lock, self._conn:
+            self._delete_where("WHERE key LIKE ? ESCAPE '\\'", (escaped + "%",))
+
+    def clear(self):
+        with self._lock, self._conn:
+            self._conn.execute(f"DELETE FROM {self.table}")
+            self.total_bytes = 0
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class TieredCache:
+    """메모리 LRU + (선택) SQLite 2단 캐시
+
+    get()은 메모리 → 디스크 순으로 찾고, 디스크에서 찾은 값은 메모리로 올립니다.
+    적중/실패 횟수는 stats()로 확인할 수 있습니다.
+    """
+
+    def __init__(self, memory: LRUCache, disk: SQLiteCache | None = None):
+        self.memory = memory
+        self.disk = disk
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+
+    def get(self, key: str) -> Any:
+        """캐시된 값 반환 (없으면 MISSING)"""
+        value, _ = self.memory.get_entry(key)
+        if value is MISSING and self.disk is not None:
+            value = self._promote(key, *self.disk.get_entry(key))
+        return self._count(value)
+
+    async def aget(self, key: str) -> Any:
+        """get()과 같지만 디스크 조회는 스레드에서 실행 (이벤트 루프를 막지 않음)"""
+        value, _ = self.memory.get_entry(key)
+        if value is MISSING and self.disk is not None:
+            entry = await asyncio.to_thread(self.disk.get_entry, key)
+            value = self._promote(key, *entry)
+        return self._count(value)
+
+    def _promote(self, key: str, value: Any, expires_at: float | None) -> Any:
+        """디스크에서 찾은 값을 메모리로 올림"""
+        if value is not MISSING:
+            self.disk_hits += 1
+            self.memory.set_entry(key, value, expires_at)
+        return value
+
+    def _count(self, value: Any) -> Any:
+        if value is MISSING:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(self, key: str, value: Any, ttl: float | None = None):
+        self.memory.set(key, value, ttl)
+        if self.disk is not None:
+            self.disk.set(key, value, ttl)
+
+    async def aset(self, key: str, value: Any, ttl: float | None = None):
+        """set()과 같지만 디스크 저장은 스레드에서 실행 (이벤트 루프를 막지 않음)"""
+        self.memory.set(key, value, ttl)
+        if self.disk is not None:
+            await asyncio.to_thread(self.disk.set, key, value, ttl)
+
+    def delete(self, key: str):
+        self.memory.delete(key)
+        if self.disk is not None:
+            self.disk.delete(key)
+
+    def delete_prefix(self, prefix: str):
+        self.memory.delete_prefix(prefix)
+        if self.disk is not None:
+            self.disk.delete_prefix(prefix)
+
+    def clear(self):
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "disk_hits": self.disk_hits,
+            "hit_rate": self.hits / total if total else 0.0,
+            "memory_entries": len(self.memory),
+        }
+
+    def close(self):
+        if self.disk is not None:
+            self.disk.close()
@@ -4,23 +4,179 @@ import json
 import urllib.parse
 import asyncio
 import aiohttp
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, AsyncIterator, Awaitable, Callable
 from dotenv import load_dotenv
 
+from law_cache import MISSING, LRUCache, SQLiteCache, TieredCache, get_cache_path
+
 load_dotenv()
 
 
 class LawContentFetcher:
     """법령 조문 내용을 가져오는 클래스"""
 
-    def __init__(self):
+    def __init__(
+        self,
+        max_connections_per_host: int = 8,
+        keepalive_timeout: float = 30.0,
+        dns_cache_ttl: int = 300,
+        request_timeout: float = 15.0,
+        max_concurrent_requests: int = 5,
+        cache_dir: str | None = None,
+        law_id_ttl: float = 7 * 24 * 3600,
+        law_id_negative_ttl: float = 3600,
+        article_ttl: float = 7 * 24 * 3600,
+        article_cache_size: int = 512,
+        article_disk_cache_size: int = 20000,
+        bulk_threshold: int | None = 5,
+        law_index_cache_size: int = 16,
+    ):
         self.LAW_ACCESS_OC = os.getenv("LAW_API_KEY", "YOUR_LAW_API_KEY")
         self.base_url = "https://www.law.go.kr"
 
+        # law.go.kr 연결을 재사용하기 위한 세션 설정 (start() 또는 첫 요청 시 생성)
+        self.max_connections_per_host = max_connections_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self.request_timeout = request_timeout
+        self._session: Optional[aiohttp.ClientSession] = None
+        # fetch_law_articles_content에서 동시에 조회할 조문 수 기본값
+        self.max_concurrent_requests = max_concurrent_requests
+
+        # 법령명 -> 법령 ID 캐시 (cache_dir 또는 LAW_CACHE_DIR 설정 시 SQLite에도 저장)
+        # 찾을 수 없는 법령명은 None으로 짧게(law_id_negative_ttl) 캐시
+        self.law_id_negative_ttl = law_id_negative_ttl
+        law_id_cache_path = get_cache_path("law_ids", cache_dir)
+        self.law_id_cache = TieredCache(
+            LRUCache(max_entries=2048, ttl=law_id_ttl),
+            (
+                SQLiteCache(law_id_cache_path, table="law_ids", ttl=law_id_ttl)
+                if law_id_cache_path
+                else None
+            ),
+        )
+
+        # (법령 ID, 조문번호, 시행일자) -> 포매팅된 조문 내용 캐시
+        # 개정 공포 시 invalidate_law()로 해당 법령의 조문을 모두 무효화
+        article_cache_path = get_cache_path("articles", cache_dir)
+        self.article_cache = TieredCache(
+            LRUCache(max_entries=article_cache_size, ttl=article_ttl),
+            (
+                SQLiteCache(
+                    article_cache_path,
+                    table="articles",
+                    ttl=article_ttl,
+                    max_entries=article_disk_cache_size,
+                )
+                if article_cache_path
+                else None
+            ),
+        )
+
+        # 법령 전문 일괄 조회: 한 법령에서 bulk_threshold개 이상 조문을 요청하면
+        # 조문별 호출 대신 전문을 한 번 받아 법령 ID -> {조문번호: 조문} 색인으로 보관
+        self.bulk_threshold = bulk_threshold
+        self._law_indexes = LRUCache(max_entries=law_index_cache_size, ttl=article_ttl)
+
+        # 진행 중인 동일 요청 공유 (single-flight): key -> Task
+        self._inflight: Dict[Any, asyncio.Task] = {}
+        # 공유 작업별 기다리는 호출자 수 (모두 취소되면 공유 작업도 취소)
+        self._inflight_waiters: Dict[asyncio.Task, int] = {}
+
+    async def __aenter__(self) -> "LawContentFetcher":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def start(self):
+        """커넥션 풀을 가진 세션 생성 (이미 열려 있으면 그대로 사용)"""
+        if self._session is not None and not self._session.closed:
+            return
+
+        connector = aiohttp.TCPConnector(
+            limit_per_host=self.max_connections_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            use_dns_cache=True,
+            ttl_dns_cache=self.dns_cache_ttl,
+        )
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.request_timeout),
+        )
+
+    async def close(self):
+        """세션과 커넥션 풀 정리"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """공유 세션 반환 (start() 없이 사용한 경우 첫 요청 시 생성, close()로 정리)"""
+        if self._session is None or self._session.closed:
+            await self.start()
+        return self._session
+
+    def invalidate_law(self, law_id: str):
+        """법령 개정 시 해당 법령 ID의 캐시된 조문을 모두 삭제"""
+        self.article_cache.delete_prefix(f"{law_id}:")
+        self._law_indexes.delete(law_id)
+
+    def cache_stats(self) -> Dict[str, Dict[str, Any]]:
+        """캐시 적중/실패 통계"""
+        return {
+            "law_id": self.law_id_cache.stats(),
+            "article": self.article_cache.stats(),
+        }
+
+    async def _single_flight(
+        self, key: Any, factory: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """같은 key의 요청이 진행 중이면 새로 호출하지 않고 그 결과를 함께 기다림
+
+        기다리던 호출자 하나가 취소되어도 공유 작업은 계속 진행하지만, 기다리는
+        호출자가 모두 취소되면 (예: 클라이언트 연결 종료) 공유 작업도 취소합니다.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+
+            def _done(finished: asyncio.Task):
+                if self._inflight.get(key) is finished:
+                    del self._inflight[key]
+
+            task.add_done_callback(_done)
+
+        self._inflight_waiters[task] = self._inflight_waiters.get(task, 0) + 1
+        try:
+            # 기다리던 호출자 하나가 취소되어도 공유 작업은 계속 진행
+            return await asyncio.shield(task)
+        finally:
+            self._inflight_waiters[task] -= 1
+            if not self._inflight_waiters[task]:
+                del self._inflight_waiters[task]
+                if not task.done():
+                    task.cancel()
+
     async def get_law_article_content(
-        self, law_name: str, article_num: str
+        self, law_name: str, article_num: str, ef_yd: Optional[str] = None
     ) -> Dict[str, Any]:
-        """법령명과 조문번호로 해당 조문의 내용을 가져오기"""
+        """법령명과 조문번호로 해당 조문의 내용을 가져오기
+
+        ef_yd: 시행일자(YYYYMMDD). 없으면 현행 조문
+        같은 조문을 동시에 요청하면 하나의 API 호출 결과를 공유합니다.
+        """
+        return await self._single_flight(
+            ("article", law_name, article_num, ef_yd),
+            lambda: self._fetch_law_article_content(law_name, article_num, ef_yd),
+        )
+
+    async def _fetch_law_article_content(
+        self, law_name: str, article_num: str, ef_yd: Optional[str]
+    ) -> Dict[str, Any]:
+        """get_law_article_content의 실제 조회"""
         try:
             # API 키 확인
             if self.LAW_ACCESS_OC == "YOUR_LAW_API_KEY":
@@ -35,7 +191,7 @@ class LawContentFetcher:
             jo_num = self._convert_article_to_jo_num(article_num)
 
             # 3. 조문 API 호출
-            law_content = await self._get_law_article_by_id(law_id, jo_num)
+            law_content = await self._get_law_article_by_id(law_id, jo_num, ef_yd)
             if not law_content:
                 return {
                     "error": f"조문 정보를 찾을 수 없습니다: {law_name} 제{article_num}조"
@@ -44,6 +200,8 @@ class LawContentFetcher:
             return {
                 "law_name": law_name,
                 "article_num": article_num,
+                "law_id": law_id,
+                "jo_num": jo_num,
                 "content": law_content,
                 "success": True,
             }
@@ -52,59 +210,116 @@ class LawContentFetcher:
             return {"error": f"법령 내용 가져오기 오류: {str(e)}"}
 
     async def _get_law_id(self, law_name: str) -> Optional[str]:
-        """법령명으로 법령 ID 조회"""
+        """법령명으로 법령 ID 조회 (캐시 우선)"""
+        cache_key = " ".join(law_name.split())
+        cached = await self.law_id_cache.aget(cache_key)
+        if cached is not MISSING:
+            return cached
+
+        # 같은 법령의 여러 조문을 동시에 조회해도 ID 검색은 한 번만
+        return await self._single_flight(
+            ("law_id", cache_key), lambda: self._resolve_law_id(cache_key)
+        )
+
+    async def _resolve_law_id(self, law_name: str) -> Optional[str]:
+        """API로 법령 ID를 검색하고 결과를 캐시"""
         try:
-            search_url = f"https://www.law.go.kr/DRF/lawSearch.do?OC={self.LAW_ACCESS_OC}&target=law&type=JSON&query={urllib.parse.quote(law_name)}"
+            law_id = await self._search_law_id(law_name)
+        except Exception as e:
+            # 일시적인 오류는 캐시하지 않음
+            print(f"법령 ID 조회 오류: {e}")
+            return None
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(search_url) as resp:
-                    if resp.status != 200:
-                        print(f"API 호출 실패: {resp.status} - {search_url}")
-                        return None
-
-                    # Content-Type 확인
-                    content_type = resp.headers.get("content-type", "")
-                    if "application/json" not in content_type:
-                        print(f"JSON이 아닌 응답: {content_type}")
-                        return None
-
-                    search_data = await resp.json()
-
-            # JSON 구조에서 일련번호(ID) 추출
-            if search_data and isinstance(search_data, dict):
-                for k in search_data:
-                    if k.startswith("law") and isinstance(search_data[k], dict):
-                        # 법령ID(6자리) 또는 법령일련번호(6~7자리) 모두 가능
-                        law_id = search_data[k].get("법령ID") or search_data[k].get(
-                            "법령일련번호"
-                        )
-                        if law_id:
-                            return law_id
-
-            # XML fallback (JSON이 비어있을 때)
-            search_url_xml = f"https://www.law.go.kr/DRF/lawSearch.do?OC={self.LAW_ACCESS_OC}&target=law&type=XML&query={urllib.parse.quote(law_name)}"
-
-            async with aiohttp.ClientSession() as session:
-                async with session.get(search_url_xml) as resp:
-                    if resp.status != 200:
-                        return None
+        await self.law_id_cache.aset(
+            law_name, law_id, None if law_id else self.law_id_negative_ttl
+        )
+        return law_id
 
-                    xml_text = await resp.text()
+    async def _search_law_id(self, law_name: str) -> Optional[str]:
+        """법제처 API로 법령 ID 검색 (없으면 None, API 호출 실패 시 예외)"""
+        search_url = f"https://www.law.go.kr/DRF/lawSearch.do?OC={self.LAW_ACCESS_OC}&target=law&type=JSON&query={urllib.parse.quote(law_name)}"
 
-            import xml.etree.ElementTree as ET
+        session = await self._get_session()
+        async with session.get(search_url) as resp:
+            if resp.status != 200:
+                raise RuntimeError(f"API 호출 실패: {resp.status} - {search_url}")
 
-            root = ET.fromstring(xml_text)
+            # Content-Type 확인
+            content_type = resp.headers.get("content-type", "")
+            if "application/json" not in content_type:
+                raise RuntimeError(f"JSON이 아닌 응답: {content_type}")
 
-            for law_elem in root.findall("law"):
-                id_elem = law_elem.find("법령ID")
-                if id_elem is not None:
-                    return id_elem.text
+            search_data = await resp.json()
 
-            return None
+        # JSON 구조에서 일련번호(ID) 추출
+        if search_data and isinstance(search_data, dict):
+            for k in search_data:
+                if k.startswith("law") and isinstance(search_data[k], dict):
+                    # 법령ID(6자리) 또는 법령일련번호(6~7자리) 모두 가능
+                    law_id = search_data[k].get("법령ID") or search_data[k].get(
+                        "법령일련번호"
+                    )
+                    if law_id:
+                        return law_id
+
+        # XML fallback (JSON이 비어있을 때)
+        search_url_xml = f"https://www.law.go.kr/DRF/lawSearch.do?OC={self.LAW_ACCESS_OC}&target=law&type=XML&query={urllib.parse.quote(law_name)}"
+
+        async with session.get(search_url_xml) as resp:
+            if resp.status != 200:
+                raise RuntimeError(f"API 호출 실패: {resp.status} - {search_url_xml}")
+
+            xml_text = await resp.text()
+
+        import xml.etree.ElementTree as ET
+
+        root = ET.fromstring(xml_text)
+
+        for law_elem in root.findall("law"):
+            id_elem = law_elem.find("법령ID")
+            if id_elem is not None:
+                return id_elem.text
+
+        return None
+
+    async def fetch_law_names(self, page_size: int = 100) -> List[str]:
+        """법제처 API에서 현행 법령명(법률·시행령·시행규칙) 전체 목록 가져오기"""
+        law_names = []
+        page = 1
+
+        try:
+            session = await self._get_session()
+            while True:
+                search_url = f"https://www.law.go.kr/DRF/lawSearch.do?OC={self.LAW_ACCESS_OC}&target=law&type=JSON&display={page_size}&page={page}"
+
+                async with session.get(search_url) as resp:
+                    if resp.status != 200:
+                        print(f"API 호출 실패: {resp.status} - {search_url}")
+                        break
+                    search_data = await resp.json(content_type=None)
+
+                result = (search_data or {}).get("LawSearch", {})
+                laws = result.get("law", [])
+                if isinstance(laws, dict):
+                    laws = [laws]
+                if not laws:
+                    break
+
+                for law in laws:
+                    name = law.get("법령명한글", "").strip()
+                    if name:
+                        law_names.append(name)
+
+                total = int(result.get("totalCnt", 0) or 0)
+                if page * page_size >= total:
+                    break
+                page += 1
 
         except Exception as e:
-            print(f"법령 ID 조회 오류: {e}")
-            return None
+            print(f"법령명 목록 조회 오류: {e}")
+
+        # 순서를 유지하며 중복 제거
+        return list(dict.fromkeys(law_names))
 
     def _convert_article_to_jo_num(self, article_num: str) -> str:
         """조문번호를 6자리 형식으로 변환"""
@@ -172,18 +387,51 @@ class LawContentFetcher:
 
         return formatted_text.strip()
 
-    async def _get_law_article_by_id(self, law_id: str, jo_num: str) -> Optional[Dict]:
-        """법령 ID와 조문번호로 조문 내용 조회"""
+    def _article_url(self, law_id: str, jo_num: str, ef_yd: Optional[str]) -> str:
+        """조문 단위 조회 API URL"""
+        law_url = f"https://www.law.go.kr/DRF/lawService.do?OC={self.LAW_ACCESS_OC}&target=lawjosub&type=JSON&ID={law_id}&JO={jo_num}"
+        if ef_yd:
+            law_url += f"&efYd={ef_yd}"
+        return law_url
+
+    def _parse_article_unit(self, jo: Dict, basic: Dict, law_url: str) -> Dict:
+        """조문단위 JSON을 포매팅된 조문 정보로 변환"""
+        # 항이 하나뿐이면 리스트가 아닌 객체로 내려옴
+        content_data = jo.get("항", [])
+        if isinstance(content_data, dict):
+            content_data = [content_data]
+
+        return {
+            "title": jo.get("조문제목", ""),
+            "law_name": basic.get("법령명_한글", ""),
+            "content": self._format_law_content(content_data),
+            "url": law_url,
+        }
+
+    async def _get_law_article_by_id(
+        self, law_id: str, jo_num: str, ef_yd: Optional[str] = None
+    ) -> Optional[Dict]:
+        """법령 ID와 조문번호로 조문 내용 조회 (캐시 → 법령 전문 색인 → 조문 API 순)"""
+        cache_key = f"{law_id}:{jo_num}:{ef_yd or 'current'}"
+        cached = await self.article_cache.aget(cache_key)
+        if cached is not MISSING:
+            return cached
+
+        if not ef_yd:
+            law_index = self._law_indexes.get(law_id)
+            if law_index is not MISSING and jo_num in law_index:
+                return law_index[jo_num]
+
         try:
-            law_url = f"https://www.law.go.kr/DRF/lawService.do?OC={self.LAW_ACCESS_OC}&target=lawjosub&type=JSON&ID={law_id}&JO={jo_num}"
+            law_url = self._article_url(law_id, jo_num, ef_yd)
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(law_url) as resp:
-                    if resp.status != 200:
-                        print(f"조문 API 호출 실패: {resp.status}")
-                        return None
+            session = await self._get_session()
+            async with session.get(law_url) as resp:
+                if resp.status != 200:
+                    print(f"조문 API 호출 실패: {resp.status}")
+                    return None
 
-                    law_data = await resp.json()
+                law_data = await resp.json()
 
             if not law_data or "법령" not in law_data or "조문" not in law_data["법령"]:
                 return None
@@ -192,41 +440,187 @@ class LawContentFetcher:
             jo = law_data["법령"]["조문"].get("조문단위", {})
 
             # 조문 내용을 텍스트로 포매팅
-            content_data = jo.get("항", [])
-            formatted_content = self._format_law_content(content_data)
-
-            return {
-                "title": jo.get("조문제목", ""),
-                "law_name": basic.get("법령명_한글", ""),
-                "content": formatted_content,
-                "url": law_url,
-            }
+            article = self._parse_article_unit(jo, basic, law_url)
+            # 포매팅까지 끝난 결과를 저장 (조회 실패는 캐시하지 않음)
+            await self.article_cache.aset(cache_key, article)
+            return article
 
         except Exception as e:
             print(f"조문 내용 조회 오류: {e}")
             return None
 
-    async def fetch_law_articles_content(self, articles: List[Dict]) -> List[Dict]:
-        """extract_law_articles 결과에서 법령 내용을 가져오기"""
-        results = []
+    async def _load_law_index(self, law_id: str) -> Optional[Dict[str, Dict]]:
+        """법령 전문을 한 번 받아 {조문번호(6자리): 조문 정보} 색인 생성"""
+        law_index = self._law_indexes.get(law_id)
+        if law_index is not MISSING:
+            return law_index
+
+        return await self._single_flight(
+            ("law_index", law_id), lambda: self._fetch_law_index(law_id)
+        )
+
+    async def _fetch_law_index(self, law_id: str) -> Optional[Dict[str, Dict]]:
+        """lawService.do (JO 없이)로 법령 전문 조회 후 조문별로 파싱"""
+        try:
+            law_url = f"https://www.law.go.kr/DRF/lawService.do?OC={self.LAW_ACCESS_OC}&target=law&type=JSON&ID={law_id}"
+
+            session = await self._get_session()
+            async with session.get(law_url) as resp:
+                if resp.status != 200:
+                    print(f"법령 전문 API 호출 실패: {resp.status}")
+                    return None
+
+                law_data = await resp.json()
+
+            if not law_data or "법령" not in law_data or "조문" not in law_data["법령"]:
+                return None
+
+            basic = law_data["법령"].get("기본정보", {})
+            units = law_data["법령"]["조문"].get("조문단위", [])
+            if isinstance(units, dict):
+                units = [units]
+
+            law_index = {}
+            for jo in units:
+                # 장/절 제목("전문")은 조문이 아님
+                if jo.get("조문여부") == "전문":
+                    continue
+                num = re.sub(r"[^0-9]", "", str(jo.get("조문번호", "")))
+                if not num:
+                    continue
+                branch = re.sub(r"[^0-9]", "", str(jo.get("조문가지번호", ""))) or "0"
+                jo_num = f"{int(num):04d}{int(branch):02d}"
+                law_index[jo_num] = self._parse_article_unit(
+                    jo, basic, self._article_url(law_id, jo_num, None)
+                )
+
+            self._law_indexes.set(law_id, law_index)
+            print(f"📚 법령 전문 색인 완료: {law_id} ({len(law_index)}개 조문)")
+            return law_index
+
+        except Exception as e:
+            print(f"법령 전문 조회 오류: {e}")
+            return None
+
+    async def get_law_articles(self, law_name: str) -> Optional[Dict[str, Any]]:
+        """
+        법령 전문의 모든 조문을 가져옵니다 (법령 전문 색인 사용).
+
+        Args:
+            law_name: 법령명
+        Returns:
+            {"law_id", "law_name", "articles": {조문번호(6자리): 조문 정보}}
+            (API 키가 없거나 법령/전문을 찾을 수 없으면 None)
+        """
+        if self.LAW_ACCESS_OC == "YOUR_LAW_API_KEY":
+            return None
+        law_id = await self._get_law_id(law_name)
+        if not law_id:
+            return None
+        law_index = await self._load_law_index(law_id)
+        if law_index is None:
+            return None
+        return {"law_id": law_id, "law_name": law_name, "articles": law_index}
+
+    async def _prefetch_bulk_laws(self, articles: List[Dict]):
+        """조문 요청이 bulk_threshold개 이상인 법령은 전문을 미리 한 번에 조회"""
+        if not self.bulk_threshold or self.LAW_ACCESS_OC == "YOUR_LAW_API_KEY":
+            return
 
+        requested: Dict[str, set] = {}
         for article in articles:
             law_name = article.get("law_name", "")
             article_num = article.get("article_num", "")
-
             if law_name and article_num:
-                print(f"🔍 법령 내용 조회 중: {law_name} 제{article_num}조")
-                content = await self.get_law_article_content(law_name, article_num)
-                results.append({"original_article": article, "content": content})
-            else:
-                results.append(
-                    {
-                        "original_article": article,
-                        "content": {"error": "법령명 또는 조문번호가 없습니다."},
-                    }
+                requested.setdefault(" ".join(law_name.split()), set()).add(
+                    self._convert_article_to_jo_num(article_num)
                 )
 
-        return results
+        async def prefetch(law_name: str):
+            law_id = await self._get_law_id(law_name)
+            if law_id:
+                await self._load_law_index(law_id)
+
+        bulk_laws = [
+            law_name
+            for law_name, jo_nums in requested.items()
+            if len(jo_nums) >= self.bulk_threshold
+        ]
+        if bulk_laws:
+            await asyncio.gather(*(prefetch(law_name) for law_name in bulk_laws))
+
+    async def _fetch_article_result(
+        self, article: Dict, semaphore: asyncio.Semaphore
+    ) -> Dict:
+        """조문 하나를 조회해 {"original_article", "content"} 형태로 반환 (예외는 error로 변환)"""
+        law_name = article.get("law_name", "")
+        article_num = article.get("article_num", "")
+
+        if not (law_name and article_num):
+            return {
+                "original_article": article,
+                "content": {"error": "법령명 또는 조문번호가 없습니다."},
+            }
+
+        async with semaphore:
+            print(f"🔍 법령 내용 조회 중: {law_name} 제{article_num}조")
+            try:
+                content = await self.get_law_article_content(law_name, article_num)
+            except Exception as e:
+                content = {"error": f"법령 내용 가져오기 오류: {str(e)}"}
+        return {"original_article": article, "content": content}
+
+    async def fetch_law_articles_content(
+        self, articles: List[Dict], concurrency: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        extract_law_articles 결과에서 법령 내용을 가져오기
+
+        Args:
+            articles: 조회할 조문 정보 리스트
+            concurrency: 동시에 조회할 최대 조문 수
+                (기본값: max_concurrent_requests, 1이면 순차 조회)
+        Returns:
+            입력 순서와 같은 순서의 조회 결과 리스트 (일부 실패해도 나머지는 계속 조회)
+        """
+        semaphore = asyncio.Semaphore(
+            max(1, concurrency or self.max_concurrent_requests)
+        )
+
+        # 한 법령의 조문을 많이 요청하면 전문 한 번으로 대체 (실패 시 조문별 조회)
+        await self._prefetch_bulk_laws(articles)
+
+        return list(
+            await asyncio.gather(
+                *(self._fetch_article_result(a, semaphore) for a in articles)
+            )
+        )
+
+    async def iter_law_articles_content(
+        self, articles: List[Dict], semaphore: Optional[asyncio.Semaphore] = None
+    ) -> AsyncIterator[Dict]:
+        """
+        fetch_law_articles_content와 같지만 조회가 끝나는 순서대로 결과를 내보냅니다.
+
+        Args:
+            articles: 조회할 조문 정보 리스트
+            semaphore: 동시 조회 수 제한 (여러 호출이 한도를 공유할 때 전달,
+                기본값: 호출마다 max_concurrent_requests)
+        """
+        semaphore = semaphore or asyncio.Semaphore(self.max_concurrent_requests)
+        await self._prefetch_bulk_laws(articles)
+
+        tasks = [
+            asyncio.create_task(self._fetch_article_result(a, semaphore))
+            for a in articles
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # 소비자가 중간에 멈추거나 취소되면 남은 조회도 취소
+            for task in tasks:
+                task.cancel()
 
 
 async def main():
@@ -258,8 +652,8 @@ async def main():
 
     # 2. 법령 내용 가져오기
     print("2️⃣ 법령 내용 가져오기")
-    fetcher = LawContentFetcher()
-    results = await fetcher.fetch_law_articles_content(articles)
+    async with LawContentFetcher() as fetcher:
+        results = await fetcher.fetch_law_articles_content(articles)
 
     for i, result in enumerate(results, 1):
         original = result["original_article"]
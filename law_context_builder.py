@@ -0,0 +1,310 @@
+import os
+import re
+import hashlib
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+try:
+    import tiktoken
+except ImportError:  # tiktoken이 없으면 바이트 수로 토큰 수 추정
+    tiktoken = None
+
+
+@lru_cache(maxsize=None)
+def _get_encoding(model: str | None):
+    if tiktoken is None:
+        return None
+    try:
+        return (
+            tiktoken.encoding_for_model(model)
+            if model
+            else tiktoken.get_encoding("cl100k_base")
+        )
+    except KeyError:
+        # 모르는 모델명이면 기본 인코딩 사용
+        return _get_encoding(None) if model else None
+    except Exception as e:
+        # 인코딩 파일을 받을 수 없는 환경 (오프라인 등)
+        print(f"⚠️  tiktoken 인코딩을 불러올 수 없어 토큰 수를 추정합니다: {e}")
+        return None
+
+
+def count_tokens(text: str, model: str | None = None) -> int:
+    """
+    텍스트의 토큰 수를 셉니다.
+
+    tiktoken을 쓸 수 없으면 UTF-8 3바이트당 1토큰으로 추정합니다
+    (한글은 대략 글자당 1토큰이라 조금 넉넉하게 잡힘).
+    """
+    encoding = _get_encoding(model)
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+    return (len(text.encode("utf-8")) + 2) // 3
+
+
+def _bigrams(text: str) -> Set[str]:
+    """공백/문장부호를 뺀 글자 2-gram (형태소 분석 없이 한국어 어휘 겹침 측정용)"""
+    compact = re.sub(r"[\W_]+", "", text.lower())
+    return {compact[i : i + 2] for i in range(len(compact) - 1)}
+
+
+def _shingles(text: str, size: int = 5) -> Set[str]:
+    compact = re.sub(r"\s+", "", text)
+    if len(compact) <= size:
+        return {compact} if compact else set()
+    return {compact[i : i + size] for i in range(len(compact) - size + 1)}
+
+
+class ContextBuilder:
+    """토큰 예산 안에서 LLM 문맥을 구성
+
+    크롤링한 페이지는 문단 단위 조각으로 나누고 조문은 조문 하나를 한 조각으로 해서,
+    질문과의 어휘 겹침으로 순위를 매기고, 이미 고른 조각과 거의 같은 내용은 버린 뒤,
+    max_tokens를 넘지 않을 때까지 관련도 순으로 담아 한 번에 이어붙입니다.
+    """
+
+    def __init__(
+        self,
+        max_tokens: int | None = None,
+        model: str | None = None,
+        passage_tokens: int = 400,
+        article_weight: float = 1.5,
+        duplicate_threshold: float = 0.8,
+        relevance_threshold: float = 0.3,
+    ):
+        """
+        Args:
+            max_tokens: 문맥 토큰 예산 (없으면 MAX_CONTEXT_LENGTH 환경변수, 기본 8000)
+            model: 토큰 계산에 쓸 모델명 (tiktoken 인코딩 선택)
+            passage_tokens: 페이지 조각 하나의 최대 토큰 수
+            article_weight: 조문 조각 점수 가중치 (조문이 검색 페이지보다 근거로서 우선)
+            duplicate_threshold: 조각의 이 비율 이상이 이미 고른 조각에 들어 있으면 중복으로 봄
+            relevance_threshold: 페이지 조각이 관련 있다고 볼 최소 점수
+                (예산 때문에 빠진 관련 조각 수 "overflow" 계산용, 조문은 항상 관련 있음)
+        """
+        self.max_tokens = (
+            max_tokens
+            if max_tokens is not None
+            else int(os.getenv("MAX_CONTEXT_LENGTH", "8000"))
+        )
+        self.model = model
+        self.passage_tokens = passage_tokens
+        self.article_weight = article_weight
+        self.duplicate_threshold = duplicate_threshold
+        self.relevance_threshold = relevance_threshold
+
+    def count_tokens(self, text: str) -> int:
+        return count_tokens(text, self.model)
+
+    def split_passages(self, text: str) -> List[str]:
+        """빈 줄 기준 문단을 passage_tokens 이하 조각으로 묶기 (너무 긴 문단은 줄 단위로 자름)"""
+        passages: List[str] = []
+        current: List[str] = []
+        current_tokens = 0
+
+        def flush():
+            nonlocal current, current_tokens
+            if current:
+                passages.append("\n".join(current))
+            current, current_tokens = [], 0
+
+        for block in re.split(r"\n\s*\n", text):
+            lines = [line for line in block.split("\n") if line.strip()]
+            for line, tokens in self._split_long_line(lines):
+                if current and current_tokens + tokens > self.passage_tokens:
+                    flush()
+                current.append(line)
+                current_tokens += tokens
+            # 문단 경계에서는 조각이 절반 이상 찼으면 끊음
+            if current_tokens >= self.passage_tokens // 2:
+                flush()
+        flush()
+        return passages
+
+    def _split_long_line(self, lines: List[str]):
+        """(줄, 토큰 수)를 내보내되 passage_tokens보다 긴 줄은 문장/글자 단위로 나눔"""
+        for line in lines:
+            tokens = self.count_tokens(line)
+            if tokens <= self.passage_tokens:
+                yield line, tokens
+                continue
+            for sentence in re.split(r"(?<=[.!?。])\s+", line):
+                sentence_tokens = self.count_tokens(sentence)
+                # 문장 하나도 너무 길면 토큰 비율만큼 글자 수로 자름
+                step = max(
+                    1, len(sentence) * self.passage_tokens // max(1, sentence_tokens)
+                )
+                for i in range(0, len(sentence), step):
+                    piece = sentence[i : i + step]
+                    yield piece, self.count_tokens(piece)
+
+    def make_chunks(
+        self,
+        pages: List[Tuple[str, str]],
+        law_contents: List[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """
+        페이지와 조문 조회 결과를 문맥 조각으로 변환
+
+        Args:
+            pages: (URL, 정리된 텍스트) 리스트
+            law_contents: fetch_law_articles_content 형태의 조문 조회 결과
+        Returns:
+            {"kind", "source", "key", "text", "header"} 조각 리스트
+        """
+        chunks: List[Dict[str, Any]] = []
+        for law in law_contents:
+            content = law.get("content", {})
+            if not content.get("success"):
+                continue
+            text = content["content"].get("content", "")
+            if not text:
+                continue
+            original = law.get("original_article", {})
+            law_name = content.get("law_name") or original.get("law_name")
+            article_num = content.get("article_num") or original.get("article_num")
+            source = f"{law_name} 제{article_num}조"
+            chunks.append(
+                {
+                    "kind": "article",
+                    "source": source,
+                    "key": original.get("key") or source,
+                    "text": text,
+                    "header": f"--- 법령 조문: {source} ---",
+                }
+            )
+
+        for url, text in pages:
+            for i, passage in enumerate(self.split_passages(text)):
+                chunks.append(
+                    {
+                        "kind": "page",
+                        "source": url,
+                        "key": f"{url}#{i}",
+                        "text": passage,
+                        "header": f"--- {url} ---",
+                    }
+                )
+        return chunks
+
+    def score(self, query_bigrams: Set[str], chunk: Dict[str, Any]) -> float:
+        """질문 2-gram 중 조각에 나오는 비율 (조문은 가중치 적용)"""
+        if not query_bigrams:
+            return 0.0
+        overlap = len(query_bigrams & _bigrams(chunk["text"])) / len(query_bigrams)
+        if chunk["kind"] == "article":
+            # 조문은 관련도가 0이어도 페이지 조각보다 먼저 고려
+            overlap = (overlap + 0.1) * self.article_weight
+        return overlap
+
+    def build(
+        self,
+        query: str,
+        pages: List[Tuple[str, str]],
+        law_contents: List[Dict[str, Any]],
+        max_tokens: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        질문에 맞춰 토큰 예산 안의 문맥을 만듭니다.
+
+        Args:
+            query: 사용자 질문
+            pages: (URL, 정리된 텍스트) 리스트
+            law_contents: 조문 조회 결과 리스트
+            max_tokens: 이번 호출의 토큰 예산 (없으면 self.max_tokens)
+        Returns:
+            {"context": 문맥 문자열, "chunks": 고른 조각, "tokens": 토큰 수,
+             "dropped": 예산/중복으로 뺀 조각 수,
+             "overflow": 관련 있지만 예산 때문에 뺀 조각 수}
+        """
+        budget = max_tokens if max_tokens is not None else self.max_tokens
+        chunks = self.make_chunks(pages, law_contents)
+        query_bigrams = _bigrams(query)
+        scores = [self.score(query_bigrams, chunk) for chunk in chunks]
+        ranked = sorted(range(len(chunks)), key=lambda i: (-scores[i], i))
+
+        selected: List[Dict[str, Any]] = []
+        seen_hashes: Set[str] = set()
+        seen_shingles: Set[str] = set()
+        used_tokens = 0
+        overflow = 0
+        for i in ranked:
+            chunk = chunks[i]
+            normalized = " ".join(chunk["text"].split())
+            digest = hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+            if digest in seen_hashes:
+                continue
+            shingles = _shingles(normalized)
+            if (
+                shingles
+                and len(shingles & seen_shingles) / len(shingles)
+                >= self.duplicate_threshold
+            ):
+                continue
+
+            # 조각 사이 구분자까지 포함해서 계산
+            part = f"\n\n{chunk['header']}\n\n{chunk['text']}"
+            tokens = self.count_tokens(part)
+            # 예산을 넘는 조각은 건너뛰고 더 작은 조각으로 남은 예산을 채움
+            if used_tokens + tokens > budget:
+                if chunk["kind"] == "article" or scores[i] >= self.relevance_threshold:
+                    overflow += 1
+                continue
+
+            selected.append({**chunk, "tokens": tokens, "content_hash": digest})
+            seen_hashes.add(digest)
+            seen_shingles |= shingles
+            used_tokens += tokens
+
+        context = "\n\n".join(f"{c['header']}\n\n{c['text']}" for c in selected)
+        return {
+            "context": context,
+            "chunks": selected,
+            "tokens": used_tokens,
+            "dropped": len(chunks) - len(selected),
+            "overflow": overflow,
+        }
+
+    def split_groups(
+        self,
+        chunks: List[Dict[str, Any]],
+        max_tokens: int,
+        max_groups: Optional[int] = None,
+    ) -> List[str]:
+        """
+        고른 조각들을 max_tokens 이하의 문맥 여러 개로 나눕니다 (map-reduce용).
+
+        문맥이 max_groups개가 되면 더 만들지 않고, 뒤의 조각은 남은 자리가 있는
+        문맥에 넣되 어디에도 들어가지 않으면 버립니다 (관련도가 낮은 조각부터 빠짐).
+
+        Args:
+            chunks: build() 결과의 조각 리스트 (관련도 순)
+            max_tokens: 문맥 하나의 토큰 예산
+            max_groups: 최대 문맥 수 (None이면 제한 없음)
+        Returns:
+            관련도 순서를 유지한 문맥 문자열 리스트
+        """
+        groups: List[List[str]] = []
+        group_tokens: List[int] = []
+        for chunk in chunks:
+            part = f"{chunk['header']}\n\n{chunk['text']}"
+            if groups and group_tokens[-1] + chunk["tokens"] <= max_tokens:
+                target = len(groups) - 1
+            elif max_groups is None or len(groups) < max_groups:
+                groups.append([])
+                group_tokens.append(0)
+                target = len(groups) - 1
+            else:
+                target = next(
+                    (
+                        i
+                        for i, tokens in enumerate(group_tokens)
+                        if tokens + chunk["tokens"] <= max_tokens
+                    ),
+                    None,
+                )
+                if target is None:
+                    continue
+            groups[target].append(part)
+            group_tokens[target] += chunk["tokens"]
+        return ["\n\n".join(group) for group in groups]
@@ -0,0 +1,281 @@
+import os
+import json
+import math
+import mmap
+import heapq
+import asyncio
+from collections import Counter
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+
+def _article_num(jo_num: str) -> str:
+    """6자리 조문번호를 조문 표기로 변환 (예: "001600" -> "16", "001602" -> "16의2")"""
+    num, branch = int(jo_num[:4]), int(jo_num[4:] or 0)
+    return f"{num}의{branch}" if branch else str(num)
+
+
+def _article_key(law_name: str, article_num: str) -> str:
+    # extract_law_articles의 key와 같은 형식
+    return f"{' '.join(law_name.split())}_{article_num}"
+
+
+class LawCorpus:
+    """로컬 법령 코퍼스: 조문 저장소(mmap) + BM25 역색인
+
+    corpus_dir 구성:
+        articles.bin  조문별 JSON 레코드를 이어붙인 파일 (mmap으로 필요한 조문만 읽음)
+        index.json    조문 위치, 조문 key, 문서 길이, 형태소별 posting 목록
+    """
+
+    ARTICLES_FILE = "articles.bin"
+    INDEX_FILE = "index.json"
+    VERSION = 1
+
+    def __init__(
+        self,
+        corpus_dir: str,
+        tokenize: Callable[[str], List[str]] | None = None,
+        k1: float = 1.5,
+        b: float = 0.75,
+    ):
+        """
+        Args:
+            corpus_dir: 코퍼스 디렉터리 (build_law_corpus로 생성)
+            tokenize: 질문 토큰화 함수 (기본값: law_tokenizer.tokenize)
+            k1, b: BM25 파라미터
+        """
+        if tokenize is None:
+            from law_tokenizer import tokenize
+        self.corpus_dir = corpus_dir
+        self.tokenize = tokenize
+        self.k1 = k1
+        self.b = b
+
+        with open(os.path.join(corpus_dir, self.INDEX_FILE), encoding="utf-8") as f:
+            index = json.load(f)
+        if index.get("version") != self.VERSION:
+            raise ValueError(f"지원하지 않는 코퍼스 버전입니다: {index.get('version')}")
+        # 문서 ID -> (위치, 길이)
+        self._offsets: List[List[int]] = index["offsets"]
+        # 조문 key -> 문서 ID
+        self._keys: Dict[str, int] = index["keys"]
+        self._doc_lengths: List[int] = index["doc_lengths"]
+        # 형태소 -> [[문서 ID, 빈도], ...]
+        self._postings: Dict[str, List[List[int]]] = index["postings"]
+        self.laws: List[str] = index["laws"]
+        self._avgdl = (
+            sum(self._doc_lengths) / len(self._doc_lengths) if self._doc_lengths else 0
+        )
+
+        self._file = open(os.path.join(corpus_dir, self.ARTICLES_FILE), "rb")
+        # 빈 파일은 mmap할 수 없음
+        self._mmap = (
+            mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            if os.fstat(self._file.fileno()).st_size
+            else None
+        )
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def close(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+
+    def _read(self, doc_id: int) -> Dict[str, Any]:
+        offset, length = self._offsets[doc_id]
+        return json.loads(self._mmap[offset : offset + length].decode("utf-8"))
+
+    def _result(
+        self, record: Dict[str, Any], score: float | None = None
+    ) -> Dict[str, Any]:
+        """fetch_law_articles_content와 같은 형태의 조회 결과로 변환"""
+        article_num = _article_num(record["jo_num"])
+        result = {
+            "original_article": {
+                "law_name": record["law_name"],
+                "article_num": article_num,
+                "key": _article_key(record["law_name"], article_num),
+                "reference_type": "코퍼스검색",
+            },
+            "content": {
+                "law_name": record["law_name"],
+                "article_num": article_num,
+                "law_id": record["law_id"],
+                "jo_num": record["jo_num"],
+                "content": {
+                    "title": record["title"],
+                    "law_name": record["law_name"],
+                    "content": record["content"],
+                    "url": record["url"],
+                },
+                "success": True,
+            },
+        }
+        if score is not None:
+            result["score"] = score
+        return result
+
+    def get_article(self, law_name: str, article_num: str) -> Optional[Dict[str, Any]]:
+        """법령명과 조문번호로 조문 조회 (코퍼스에 없으면 None)"""
+        doc_id = self._keys.get(_article_key(law_name, article_num))
+        if doc_id is None:
+            return None
+        return self._result(self._read(doc_id))
+
+    def search(self, query: str, top_k: int = 10) -> List[Dict[str, Any]]:
+        """
+        BM25로 질문과 관련된 조문을 찾습니다.
+
+        Args:
+            query: 질문 (또는 키워드)
+            top_k: 반환할 최대 조문 수
+        Returns:
+            점수 내림차순 조회 결과 리스트 (각 결과에 "score" 포함)
+        """
+        n_docs = len(self._offsets)
+        if not n_docs:
+            return []
+
+        scores: Dict[int, float] = {}
+        for term in set(self.tokenize(query)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log((n_docs - len(postings) + 0.5) / (len(postings) + 0.5) + 1)
+            for doc_id, tf in postings:
+                norm = self.k1 * (
+                    1 - self.b + self.b * self._doc_lengths[doc_id] / self._avgdl
+                )
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (self.k1 + 1) / (
+                    tf + norm
+                )
+
+        best = heapq.nlargest(top_k, scores.items(), key=lambda item: item[1])
+        return [self._result(self._read(doc_id), score) for doc_id, score in best]
+
+
+async def build_law_corpus(
+    fetcher,
+    law_names: Iterable[str],
+    corpus_dir: str,
+    tokenize_batch: Callable[[List[str]], List[List[str]]] | None = None,
+) -> LawCorpus:
+    """
+    법령 전문을 가져와 로컬 코퍼스를 만듭니다 (기존 코퍼스는 교체).
+
+    Args:
+        fetcher: LawContentFetcher
+        law_names: 코퍼스에 넣을 법령명들
+        corpus_dir: 코퍼스 디렉터리
+        tokenize_batch: 조문 토큰화 함수 (기본값: law_tokenizer.tokenize_batch)
+    Returns:
+        새로 만든 코퍼스
+    """
+    if tokenize_batch is None:
+        from law_tokenizer import tokenize_batch
+
+    law_names = list(law_names)
+    laws = await asyncio.gather(*(fetcher.get_law_articles(name) for name in law_names))
+
+    records = []
+    indexed_laws = []
+    for law_name, law in zip(law_names, laws):
+        if not law:
+            print(f"❌ 법령 전문을 가져오지 못했습니다: {law_name}")
+            continue
+        for jo_num, article in sorted(law["articles"].items()):
+            records.append(
+                {
+                    "law_id": law["law_id"],
+                    "law_name": article.get("law_name") or law["law_name"],
+                    "jo_num": jo_num,
+                    "title": article.get("title", ""),
+                    "content": article.get("content", ""),
+                    "url": article.get("url", ""),
+                }
+            )
+        indexed_laws.append(law_name)
+        print(f"📚 코퍼스 추가: {law_name} ({len(law['articles'])}개 조문)")
+
+    # 법령명과 조문 제목도 검색되도록 함께 토큰화
+    token_lists = tokenize_batch(
+        [f"{r['law_name']} {r['title']}\n{r['content']}" for r in records]
+    )
+
+    os.makedirs(corpus_dir, exist_ok=True)
+    offsets, keys, doc_lengths = [], {}, []
+    postings: Dict[str, List[List[int]]] = {}
+    articles_path = os.path.join(corpus_dir, LawCorpus.ARTICLES_FILE)
+    with open(f"{articles_path}.tmp", "wb") as f:
+        for doc_id, (record, tokens) in enumerate(zip(records, token_lists)):
+            data = json.dumps(record, ensure_ascii=False).encode("utf-8")
+            offsets.append([f.tell(), len(data)])
+            f.write(data)
+            keys[_article_key(record["law_name"], _article_num(record["jo_num"]))] = (
+                doc_id
+            )
+            doc_lengths.append(len(tokens))
+            for term, tf in Counter(tokens).items():
+                postings.setdefault(term, []).append([doc_id, tf])
+
+    index_path = os.path.join(corpus_dir, LawCorpus.INDEX_FILE)
+    with open(f"{index_path}.tmp", "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "version": LawCorpus.VERSION,
+                "laws": indexed_laws,
+                "offsets": offsets,
+                "keys": keys,
+                "doc_lengths": doc_lengths,
+                "postings": postings,
+            },
+            f,
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+    os.replace(f"{articles_path}.tmp", articles_path)
+    os.replace(f"{index_path}.tmp", index_path)
+    print(
+        f"✅ 코퍼스 저장: {corpus_dir} (조문 {len(records)}개, 형태소 {len(postings)}개)"
+    )
+    return LawCorpus(corpus_dir)
+
+
+def load_law_corpus(corpus_dir: str | None = None) -> Optional[LawCorpus]:
+    """
+    로컬 법령 코퍼스를 불러옵니다.
+
+    Args:
+        corpus_dir: 코퍼스 디렉터리 (없으면 LAW_CORPUS_DIR 환경변수 사용)
+    Returns:
+        코퍼스 (디렉터리가 설정되지 않았거나 코퍼스가 없으면 None)
+    """
+    corpus_dir = corpus_dir or os.getenv("LAW_CORPUS_DIR")
+    if not corpus_dir or not os.path.exists(
+        os.path.join(corpus_dir, LawCorpus.INDEX_FILE)
+    ):
+        return None
+    return LawCorpus(corpus_dir)
+
+
+async def main():
+    """법령명들을 받아 로컬 코퍼스 생성"""
+    import sys
+    from law_content_fetcher import LawContentFetcher
+
+    law_names = sys.argv[1:]
+    if not law_names:
+        print("사용법: python law_corpus.py 법령명 [법령명 ...]")
+        return
+
+    corpus_dir = os.getenv("LAW_CORPUS_DIR", "law_corpus")
+    async with LawContentFetcher() as fetcher:
+        corpus = await build_law_corpus(fetcher, law_names, corpus_dir)
+    corpus.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,119 @@
+import os
+import asyncio
+from collections import deque
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class LawNameDictionary:
+    """공식 법령명 목록으로 만든 Aho-Corasick 오토마톤
+
+    법령명은 공백을 제거한 형태로 등록되고, 텍스트를 훑을 때도 공백은 건너뛰므로
+    "건축법 시행령"과 "건축법시행령"을 같은 법령명으로 인식합니다.
+    """
+
+    def __init__(self, law_names: Iterable[str]):
+        # 상태 0이 루트. goto[state][char] -> state
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        # 상태에서 끝나는 가장 긴 법령명: (공백 제외 길이, 공식 법령명)
+        self._longest: List[Optional[Tuple[int, str]]] = [None]
+        self._size = 0
+
+        for name in law_names:
+            name = " ".join(name.split())
+            if name:
+                self._add(name)
+        self._build_fail_links()
+
+    def __len__(self) -> int:
+        return self._size
+
+    @classmethod
+    def from_file(cls, path: str) -> "LawNameDictionary":
+        """한 줄에 법령명 하나씩 적힌 파일에서 사전 생성"""
+        with open(path, encoding="utf-8") as f:
+            return cls(line.strip() for line in f)
+
+    def _add(self, name: str):
+        key = "".join(name.split())
+        state = 0
+        for char in key:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._longest.append(None)
+                self._goto[state][char] = next_state
+            state = next_state
+        if self._longest[state] is None:
+            self._size += 1
+        self._longest[state] = (len(key), name)
+
+    def _build_fail_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                # 자기 자신이 법령명이 아니면 fail 링크 쪽의 가장 긴 법령명을 물려받음
+                if self._longest[next_state] is None:
+                    self._longest[next_state] = self._longest[self._fail[next_state]]
+                queue.append(next_state)
+
+    def step(self, state: int, char: str) -> int:
+        """현재 상태에서 문자 하나를 읽은 다음 상태"""
+        while state and char not in self._goto[state]:
+            state = self._fail[state]
+        return self._goto[state].get(char, 0)
+
+    def longest_match(self, state: int) -> Optional[Tuple[int, str]]:
+        """상태에서 끝나는 가장 긴 법령명 (공백 제외 길이, 공식 법령명)"""
+        return self._longest[state]
+
+
+@lru_cache(maxsize=None)
+def _load_law_name_dictionary(path: str) -> LawNameDictionary:
+    return LawNameDictionary.from_file(path)
+
+
+def load_law_name_dictionary(path: str | None = None) -> Optional[LawNameDictionary]:
+    """
+    법령명 사전을 불러옵니다. 같은 경로는 프로세스당 한 번만 읽습니다.
+
+    Args:
+        path: 법령명 목록 파일 경로 (없으면 LAW_NAMES_PATH 환경변수 사용)
+    Returns:
+        법령명 사전 (경로가 설정되지 않았거나 파일이 없으면 None)
+    """
+    path = path or os.getenv("LAW_NAMES_PATH")
+    if not path or not os.path.exists(path):
+        return None
+    return _load_law_name_dictionary(os.path.abspath(path))
+
+
+async def main():
+    """법제처 API에서 법령명 목록을 받아 파일로 저장"""
+    import sys
+    from law_content_fetcher import LawContentFetcher
+
+    output_path = sys.argv[1] if len(sys.argv) > 1 else "law_names.txt"
+
+    async with LawContentFetcher() as fetcher:
+        law_names = await fetcher.fetch_law_names()
+    if not law_names:
+        print("❌ 법령명 목록을 가져오지 못했습니다.")
+        return
+
+    with open(output_path, "w", encoding="utf-8") as f:
+        for name in law_names:
+            f.write(f"{name}\n")
+    print(f"✅ 법령명 {len(law_names)}개 저장: {output_path}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,162 @@
+import time
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+
+class ReferenceGraph:
+    """조문 참조 그래프 (노드: 조문, 간선: 참조하는 조문 → 참조된 조문)
+
+    검색 결과 페이지에서 찾은 조문이 깊이 0이고, 조문 내용에서 찾은 참조를 따라갈
+    때마다 깊이가 1씩 늘어납니다. 이미 방문한 조문은 다시 조회하지 않고 간선만
+    기록하므로 순환 참조가 있어도 탐색이 끝납니다.
+
+    조회가 동시에 진행되므로 같은 조문이 더 깊은 경로로 먼저 발견될 수 있습니다.
+    나중에 더 얕은 깊이로 다시 발견되면 깊이를 낮추고, 이미 조회한 조문이면 기록해 둔
+    참조를 그 깊이에서 다시 따라가므로 결과가 조회 완료 순서에 좌우되지 않습니다.
+    """
+
+    def __init__(
+        self,
+        max_depth: int = 3,
+        max_nodes: int = 100,
+        time_budget: Optional[float] = None,
+    ):
+        """
+        Args:
+            max_depth: 참조를 따라갈 최대 깊이 (0이면 참조를 따라가지 않음)
+            max_nodes: 그래프에 담을 최대 조문 수
+            time_budget: 참조 탐색 시간 제한(초, start() 기준, None이면 제한 없음)
+        """
+        self.max_depth = max_depth
+        self.max_nodes = max_nodes
+        self.time_budget = time_budget
+        self.nodes: Dict[str, Dict[str, Any]] = {}
+        self.edges: List[Tuple[str, str]] = []
+        self._edge_set: Set[Tuple[str, str]] = set()
+        self._index: Dict[str, int] = {}
+        # 조회한 조문 key -> 그 조문이 참조하는 조문들 (깊이가 낮아지면 다시 따라감)
+        self._references: Dict[str, List[Dict[str, Any]]] = {}
+        self._deadline: Optional[float] = None
+        # 예산 때문에 방문하지 못한 조문이 있었는지
+        self.truncated = False
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.nodes
+
+    def start(self):
+        """시간 제한 측정 시작"""
+        if self.time_budget is not None:
+            self._deadline = time.monotonic() + self.time_budget
+
+    def expired(self) -> bool:
+        return self._deadline is not None and time.monotonic() >= self._deadline
+
+    def can_expand(self, depth: int) -> bool:
+        """깊이 depth의 조문에서 참조를 더 따라갈 수 있는지"""
+        return depth < self.max_depth
+
+    def index(self, key: str) -> int:
+        """조문이 그래프에 추가된 순번"""
+        return self._index[key]
+
+    def depth(self, key: str) -> int:
+        """조문의 현재 깊이 (더 얕은 경로가 발견되면 낮아짐)"""
+        return self.nodes[key]["depth"]
+
+    def visit(
+        self, article: Dict[str, Any], depth: int, parent: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        조문을 그래프에 추가합니다.
+
+        Args:
+            article: 조문 정보 (extract_law_articles / extract_referenced_articles 결과)
+            depth: 탐색 깊이
+            parent: 이 조문을 참조한 조문의 key (깊이 0이면 None)
+        Returns:
+            새로 추가되어 조회해야 하는 조문 리스트. 새 조문이면 [article],
+            이미 조회한 조문이 더 얕은 깊이로 다시 발견되면 그 참조를 따라가며 새로
+            추가된 조문들 (이미 방문했거나 깊이/노드 수/시간 제한을 넘으면 빈 리스트)
+        """
+        key = article["key"]
+        node = self.nodes.get(key)
+        if node is not None:
+            self._add_edge(parent, key)
+            if depth >= node["depth"]:
+                return []
+            # 더 얕은 깊이로 다시 발견: 이미 조회했으면 참조를 그 깊이에서 다시 따라감
+            # (아직 조회 중이면 조회가 끝날 때 낮아진 깊이로 따라감)
+            node["depth"] = depth
+            return self.expand(key)
+
+        # 페이지에서 직접 찾은 조문(깊이 0)은 시간 제한과 관계없이 추가
+        if (
+            depth > self.max_depth
+            or len(self.nodes) >= self.max_nodes
+            or (depth > 0 and self.expired())
+        ):
+            self.truncated = True
+            return []
+
+        self._index[key] = len(self.nodes)
+        self.nodes[key] = {
+            "key": key,
+            "law_name": article.get("law_name"),
+            "article_num": article.get("article_num"),
+            "depth": depth,
+            "success": None,
+        }
+        self._add_edge(parent, key)
+        return [article]
+
+    def _add_edge(self, parent: Optional[str], key: str):
+        if parent is None or parent == key or (parent, key) in self._edge_set:
+            return
+        self._edge_set.add((parent, key))
+        self.edges.append((parent, key))
+
+    def mark_fetched(
+        self,
+        key: str,
+        success: bool,
+        references: Optional[List[Dict[str, Any]]] = None,
+    ):
+        """
+        조문 조회 결과 기록
+
+        Args:
+            key: 조문 key
+            success: 조회 성공 여부
+            references: 조회한 조문이 참조하는 조문들 (나중에 깊이가 낮아지면 따라감)
+        """
+        if key in self.nodes:
+            self.nodes[key]["success"] = success
+            if references is not None:
+                self._references[key] = references
+
+    def expand(self, key: str) -> List[Dict[str, Any]]:
+        """
+        조회한 조문의 참조를 현재 깊이에서 따라갑니다.
+
+        Returns:
+            새로 추가되어 조회해야 하는 조문 리스트 (더 따라갈 수 없으면 빈 리스트)
+        """
+        depth = self.depth(key)
+        if not self.can_expand(depth):
+            return []
+        new_articles: List[Dict[str, Any]] = []
+        for ref in self._references.get(key, []):
+            new_articles += self.visit(ref, depth + 1, parent=key)
+        return new_articles
+
+    def to_dict(self) -> Dict[str, Any]:
+        """캐시/시각화용 직렬화 (JSON으로 저장 가능)"""
+        return {
+            "nodes": list(self.nodes.values()),
+            "edges": [{"from": src, "to": dst} for src, dst in self.edges],
+            "max_depth": self.max_depth,
+            "max_nodes": self.max_nodes,
+            "truncated": self.truncated,
+        }
@@ -0,0 +1,201 @@
+import os
+import json
+import time
+import asyncio
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from law_article_extractor import extract_referenced_articles
+
+
+class ReferenceIndex:
+    """조문별 참조 색인: (법령 ID, 조문번호) -> 그 조문이 참조하는 조문 목록
+
+    조문 안의 참조는 법령이 개정되기 전까지 바뀌지 않으므로, 법령 전문을 한 번
+    훑어 extract_referenced_articles 결과를 미리 저장해 두고 질문마다 정규식을
+    다시 돌리는 대신 색인을 조회합니다.
+
+    파일에는 법령마다 참조 대상 법령명 목록과 조문별 [대상 번호, 조문번호] 쌍만
+    저장합니다.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: str | None = None):
+        self.path = path
+        # 법령 ID -> {"law_name", "built_at", "targets": [법령명], "refs": {조문번호: [[대상, 조], ...]}}
+        self._laws: Dict[str, Dict[str, Any]] = {}
+        # "법령 ID:조문번호" -> ((법령명, 조문번호), ...)
+        self._neighbors: Dict[str, Tuple[Tuple[str, str], ...]] = {}
+
+    def __len__(self) -> int:
+        return len(self._laws)
+
+    def __contains__(self, law_id: str) -> bool:
+        return law_id in self._laws
+
+    @classmethod
+    def load(cls, path: str) -> "ReferenceIndex":
+        """색인 파일 읽기 (파일이 없으면 빈 색인)"""
+        index = cls(path)
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == cls.VERSION:
+                for law_id, law in data.get("laws", {}).items():
+                    index._set_law(law_id, law)
+        return index
+
+    def save(self, path: str | None = None):
+        """색인 파일 저장 (임시 파일에 쓴 뒤 교체)"""
+        path = path or self.path
+        if not path:
+            raise ValueError("색인 파일 경로가 없습니다.")
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"version": self.VERSION, "laws": self._laws},
+                f,
+                ensure_ascii=False,
+                separators=(",", ":"),
+            )
+        os.replace(tmp_path, path)
+        self.path = path
+
+    def _set_law(self, law_id: str, law: Dict[str, Any]):
+        self.remove_law(law_id)
+        self._laws[law_id] = law
+        targets = law["targets"]
+        for jo_num, refs in law["refs"].items():
+            self._neighbors[f"{law_id}:{jo_num}"] = tuple(
+                (targets[target], article_num) for target, article_num in refs
+            )
+
+    def remove_law(self, law_id: str):
+        """법령 개정 시 해당 법령의 색인 삭제"""
+        law = self._laws.pop(law_id, None)
+        if law is None:
+            return
+        for jo_num in law["refs"]:
+            self._neighbors.pop(f"{law_id}:{jo_num}", None)
+
+    def add_law(self, law_id: str, law_name: str, articles: Dict[str, Dict]):
+        """
+        법령 하나의 조문들에서 참조를 추출해 색인에 추가합니다.
+
+        Args:
+            law_id: 법령 ID
+            law_name: 법령명 ("법 제X조" 해석 기준)
+            articles: {조문번호(6자리): 조문 정보} (LawContentFetcher.get_law_articles 결과)
+        """
+        targets: List[str] = []
+        target_ids: Dict[str, int] = {}
+        refs: Dict[str, List[List[Any]]] = {}
+        for jo_num, article in articles.items():
+            jo_refs = []
+            for ref in extract_referenced_articles(
+                article.get("content", ""), article.get("law_name") or law_name
+            ):
+                target = target_ids.setdefault(ref["law_name"], len(targets))
+                if target == len(targets):
+                    targets.append(ref["law_name"])
+                jo_refs.append([target, ref["article_num"]])
+            # 참조가 없는 조문도 기록해야 "색인됨, 참조 없음"과 "색인 안 됨"을 구분
+            refs[jo_num] = jo_refs
+
+        self._set_law(
+            law_id,
+            {
+                "law_name": law_name,
+                "built_at": time.time(),
+                "targets": targets,
+                "refs": refs,
+            },
+        )
+
+    def neighbors(self, law_id: str, jo_num: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        조문이 참조하는 조문 목록 (extract_referenced_articles와 같은 형태)
+
+        Args:
+            law_id: 법령 ID
+            jo_num: 조문번호 (6자리, 예: "001100")
+        Returns:
+            참조 조문 리스트 (색인에 없는 조문이면 None)
+        """
+        neighbors = self._neighbors.get(f"{law_id}:{jo_num}")
+        if neighbors is None:
+            return None
+        return [
+            {
+                "law_name": law_name,
+                "article_num": article_num,
+                "key": f"{law_name}_{article_num}",
+                "reference_type": "법령참조",
+            }
+            for law_name, article_num in neighbors
+        ]
+
+
+async def build_reference_index(
+    fetcher, law_names: Iterable[str], index: ReferenceIndex
+) -> ReferenceIndex:
+    """
+    법령 전문을 가져와 참조 색인을 만듭니다.
+
+    Args:
+        fetcher: LawContentFetcher
+        law_names: 색인할 법령명들
+        index: 결과를 추가할 색인
+    Returns:
+        index (실패한 법령은 건너뜀)
+    """
+
+    async def add(law_name: str):
+        law = await fetcher.get_law_articles(law_name)
+        if not law:
+            print(f"❌ 법령 전문을 가져오지 못했습니다: {law_name}")
+            return
+        index.add_law(law["law_id"], law["law_name"], law["articles"])
+        print(f"📚 참조 색인 완료: {law_name} ({len(law['articles'])}개 조문)")
+
+    await asyncio.gather(*(add(law_name) for law_name in law_names))
+    return index
+
+
+def load_reference_index(path: str | None = None) -> Optional[ReferenceIndex]:
+    """
+    참조 색인을 불러옵니다.
+
+    Args:
+        path: 색인 파일 경로 (없으면 LAW_REFERENCE_INDEX_PATH 환경변수 사용)
+    Returns:
+        참조 색인 (경로가 설정되지 않았거나 파일이 없으면 None)
+    """
+    path = path or os.getenv("LAW_REFERENCE_INDEX_PATH")
+    if not path or not os.path.exists(path):
+        return None
+    return ReferenceIndex.load(path)
+
+
+async def main():
+    """법령명들을 받아 참조 색인 파일을 만들거나 갱신"""
+    import sys
+    from law_content_fetcher import LawContentFetcher
+
+    law_names = sys.argv[1:]
+    if not law_names:
+        print("사용법: python law_reference_index.py 법령명 [법령명 ...]")
+        return
+
+    path = os.getenv("LAW_REFERENCE_INDEX_PATH", "law_reference_index.json")
+    index = ReferenceIndex.load(path)
+    async with LawContentFetcher() as fetcher:
+        await build_reference_index(fetcher, law_names, index)
+    index.save(path)
+    print(f"✅ 참조 색인 저장: {path} (법령 {len(index)}개)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,23 +1,41 @@
 import asyncio
 import os
-import time
 import re
-from typing import List, Dict, Any
+import json
+import time
+import hashlib
+import logging
+import unicodedata
+from typing import List, Dict, Any, AsyncIterator, Optional, Tuple
+from urllib.parse import urlparse
+import aiohttp
+from bs4 import BeautifulSoup
 from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig
-from tavily import TavilyClient
+from tavily import AsyncTavilyClient
 from dotenv import load_dotenv
 
 
 # LLM용
-from openai import OpenAI
+from openai import AsyncOpenAI
 
 # 로컬 모듈 import
 from law_article_extractor import (
     extract_law_articles,
-    extract_all_articles_with_references,
     extract_referenced_articles,
 )
+from law_cache import MISSING, LRUCache, SQLiteCache, TieredCache, get_cache_path
 from law_content_fetcher import LawContentFetcher
+from law_corpus import load_law_corpus
+from law_context_builder import ContextBuilder
+from law_name_dictionary import load_law_name_dictionary
+from law_reference_graph import ReferenceGraph
+from law_reference_index import load_reference_index
+from law_tokenizer import (
+    extract_keyword_terms,
+    extract_keyword_terms_batch,
+    is_kiwi_loaded,
+    warm_up,
+)
 
 load_dotenv()
 
@@ -25,22 +43,283 @@ load_dotenv()
 class LawSearchIntegrated:
     """통합 법령 검색 및 조문 내용 가져오기 클래스"""
 
-    def __init__(self):
+    # HTTP 경로로 추출한 텍스트가 이보다 짧으면 브라우저로 다시 크롤링
+    MIN_STATIC_TEXT_LENGTH = 200
+    # map 단계에서 관련 내용이 없을 때의 답변 (reduce에서 제외)
+    NO_RELEVANT_CONTENT = "관련 내용 없음"
+
+    def __init__(
+        self,
+        max_concurrent_crawls: int = 3,
+        crawl_delay: float = 1.0,
+        http_timeout: float = 15.0,
+        search_hedge_delay: float = 2.0,
+        search_deadline: float = 15.0,
+        merge_search_results: bool = False,
+        cache_dir: str | None = None,
+        search_cache_ttl: float = 24 * 3600,
+        search_cache_use_keywords: bool = True,
+        answer_cache_ttl: float = 7 * 24 * 3600,
+        page_cache_ttl: float = 3600,
+        page_cache_max_age: float = 7 * 24 * 3600,
+        page_cache_max_bytes: int = 256 * 1024 * 1024,
+        page_cache_memory_bytes: int = 32 * 1024 * 1024,
+        max_reference_depth: int | None = None,
+        max_reference_nodes: int = 100,
+        reference_time_budget: float | None = 20.0,
+        max_context_tokens: int | None = None,
+        answer_mode: str = "auto",
+        map_reduce_threshold: int | None = None,
+        max_map_chunks: int | None = None,
+        max_concurrent_llm_calls: int = 3,
+        llm_client: Any = None,
+        retrieval_source: str | None = None,
+        corpus_top_k: int = 10,
+    ):
         self.tavily_api_key = os.getenv("TAVILY_API_KEY")
         self.google_cse_api_key = os.getenv("GOOGLE_CSE_API_KEY")
         self.google_cse_engine_id = os.getenv("GOOGLE_CSE_ENGINE_ID")
-        self.law_fetcher = LawContentFetcher()
+        self.tavily_client = (
+            AsyncTavilyClient(api_key=self.tavily_api_key)
+            if self.tavily_api_key
+            else None
+        )
+        # 검색 헤징: CSE가 search_hedge_delay초 안에 응답하지 않으면 Tavily도 시작
+        # 검색 단계 전체는 search_deadline초 안에 끝냄
+        self.search_hedge_delay = search_hedge_delay
+        self.search_deadline = search_deadline
+        self.merge_search_results = merge_search_results
+        self.law_fetcher = LawContentFetcher(cache_dir=cache_dir)
+
+        # 정규화된 질문 + 도메인 -> 검색 결과 URL 캐시 (LAW_CACHE_DIR 설정 시 SQLite에도 저장)
+        self.search_cache_use_keywords = search_cache_use_keywords
+        search_cache_path = get_cache_path("search", cache_dir)
+        self.search_cache = TieredCache(
+            LRUCache(max_entries=1024, ttl=search_cache_ttl),
+            (
+                SQLiteCache(
+                    search_cache_path,
+                    table="search",
+                    ttl=search_cache_ttl,
+                    max_entries=20000,
+                )
+                if search_cache_path
+                else None
+            ),
+        )
+        # URL -> 정리된 페이지 텍스트 + ETag/Last-Modified 캐시
+        # page_cache_ttl초 동안은 그대로 쓰고, 그 뒤에는 조건부 요청으로 재검증
+        # 메모리에는 page_cache_memory_bytes, 디스크에는 압축해서 page_cache_max_bytes 이하로 저장
+        self.page_cache_ttl = page_cache_ttl
+        page_cache_path = get_cache_path("pages", cache_dir)
+        self.page_cache = TieredCache(
+            LRUCache(
+                max_entries=256,
+                ttl=page_cache_max_age,
+                max_bytes=page_cache_memory_bytes,
+            ),
+            (
+                SQLiteCache(
+                    page_cache_path,
+                    table="pages",
+                    ttl=page_cache_max_age,
+                    max_bytes=page_cache_max_bytes,
+                    compress=True,
+                )
+                if page_cache_path
+                else None
+            ),
+        )
+        # (질문, 모델, 문맥 조각 key+내용 해시) -> LLM 답변 캐시
+        # 조문 내용이 바뀌면 키가 달라지므로 예전 답변은 쓰이지 않고 TTL/LRU로 정리됨
+        answer_cache_path = get_cache_path("answers", cache_dir)
+        self.answer_cache = TieredCache(
+            LRUCache(max_entries=512, ttl=answer_cache_ttl),
+            (
+                SQLiteCache(
+                    answer_cache_path,
+                    table="answers",
+                    ttl=answer_cache_ttl,
+                    max_entries=5000,
+                )
+                if answer_cache_path
+                else None
+            ),
+        )
+        # 조문 참조 탐색 한도 (깊이는 MAX_REFERENCE_DEPTH 환경변수로도 설정 가능)
+        self.max_reference_depth = (
+            max_reference_depth
+            if max_reference_depth is not None
+            else int(os.getenv("MAX_REFERENCE_DEPTH", "3"))
+        )
+        self.max_reference_nodes = max_reference_nodes
+        self.reference_time_budget = reference_time_budget
+        # 미리 만든 조문 참조 색인 (LAW_REFERENCE_INDEX_PATH가 설정된 경우에만 사용)
+        self.reference_index = load_reference_index()
+        # 조문 검색 방식: "web"(검색 API + 크롤링) 또는 "corpus"(로컬 코퍼스 BM25)
+        # 없으면 RETRIEVAL_SOURCE 환경변수, 기본 "web"
+        self.retrieval_source = retrieval_source or os.getenv("RETRIEVAL_SOURCE", "web")
+        if self.retrieval_source not in ("web", "corpus"):
+            raise ValueError(f"알 수 없는 검색 방식: {self.retrieval_source}")
+        self.corpus_top_k = corpus_top_k
+        # 로컬 법령 코퍼스 (LAW_CORPUS_DIR가 설정된 경우에만 사용)
+        self.law_corpus = load_law_corpus()
+        # 공식 법령명 사전 (LAW_NAMES_PATH가 설정된 경우에만 사전 모드로 추출)
+        self.law_names = load_law_name_dictionary()
         self.openai_api_key = os.getenv("OPENAI_API_KEY")
         self.openai_model = os.getenv("OPENAI_MODEL")
-        if self.openai_api_key:
-            self.openai_client = OpenAI(api_key=self.openai_api_key)
+        self.llm_model = self.openai_model or "gpt-3.5-turbo-16k"
+        # llm_client: AsyncOpenAI 호환 클라이언트 (테스트용 대역 등)
+        if llm_client is not None:
+            self.openai_client = llm_client
+        elif self.openai_api_key:
+            self.openai_client = AsyncOpenAI(api_key=self.openai_api_key)
         else:
             self.openai_client = None
+        # LLM 문맥 토큰 예산 (없으면 MAX_CONTEXT_LENGTH 환경변수, 기본 8000)
+        self.context_builder = ContextBuilder(
+            max_tokens=max_context_tokens, model=self.openai_model
+        )
+        # 답변 방식: "auto"(문맥이 map_reduce_threshold 토큰을 넘으면 map-reduce),
+        # "single", "map_reduce"
+        if answer_mode not in ("auto", "single", "map_reduce"):
+            raise ValueError(f"알 수 없는 답변 방식: {answer_mode}")
+        self.answer_mode = answer_mode
+        self.map_reduce_threshold = (
+            map_reduce_threshold
+            if map_reduce_threshold is not None
+            else self.context_builder.max_tokens
+        )
+        # map-reduce에서 부분 질의 최대 개수 (MAX_CHUNKS_PER_QUESTION 환경변수로도 설정)
+        self.max_map_chunks = (
+            max_map_chunks
+            if max_map_chunks is not None
+            else int(os.getenv("MAX_CHUNKS_PER_QUESTION", "5"))
+        )
+        self._llm_semaphore = asyncio.Semaphore(max_concurrent_llm_calls)
+
+        # 크롤러는 인스턴스당 한 번만 띄워서 재사용 (브라우저 컨텍스트 유지)
+        self.max_concurrent_crawls = max_concurrent_crawls
+        # 같은 호스트에 대한 요청 간 최소 간격(초)
+        self.crawl_delay = crawl_delay
+        self._crawler: Optional[AsyncWebCrawler] = None
+        self._crawler_lock = asyncio.Lock()
+        self._crawl_semaphore = asyncio.Semaphore(max_concurrent_crawls)
+        self._host_locks: Dict[str, asyncio.Lock] = {}
+        self._host_last_request: Dict[str, float] = {}
+
+        # 도메인별 크롤링 방식 (get_crawl_strategies 참고, 인스턴스별로 수정 가능)
+        self.crawl_strategies = self.get_crawl_strategies()
+        # 정적 페이지용 HTTP 세션 (첫 요청 시 생성)
+        self.http_timeout = http_timeout
+        self._http_session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self) -> "LawSearchIntegrated":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def start(self):
+        """공유 리소스 준비 (법제처 API 세션, 헤드리스 브라우저, 형태소 분석기)
+
+        로컬 코퍼스 검색(retrieval_source="corpus")은 크롤링하지 않으므로
+        브라우저를 띄우지 않습니다.
+        """
+        await self.law_fetcher.start()
+        # Kiwi 모델 로딩(수 초)은 브라우저 시작과 겹쳐서 실행
+        resources = [self._ensure_tokenizer()]
+        if self.retrieval_source == "web":
+            resources.append(self._get_crawler())
+        await asyncio.gather(*resources)
+
+    async def close(self):
+        """공유 리소스 정리"""
+        await self.law_fetcher.close()
+        if self._crawler is not None:
+            await self._crawler.close()
+            self._crawler = None
+        if self._http_session is not None and not self._http_session.closed:
+            await self._http_session.close()
+        self._http_session = None
+
+    async def _get_http_session(self) -> aiohttp.ClientSession:
+        """정적 페이지 크롤링용 공유 HTTP 세션"""
+        if self._http_session is None or self._http_session.closed:
+            self._http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit_per_host=4, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=self.http_timeout),
+                headers={"User-Agent": "Mozilla/5.0 (compatible; law-search-bot)"},
+            )
+        return self._http_session
+
+    async def _get_crawler(self) -> AsyncWebCrawler:
+        """공유 크롤러 반환 (처음 호출 시 브라우저 시작)"""
+        async with self._crawler_lock:
+            if self._crawler is None:
+                # Crawl4AI 로그 출력 억제
+                # 모든 로그 레벨을 ERROR로 설정
+                logging.getLogger().setLevel(logging.ERROR)
+                logging.getLogger("crawl4ai").setLevel(logging.ERROR)
+                logging.getLogger("urllib3").setLevel(logging.ERROR)
+                logging.getLogger("requests").setLevel(logging.ERROR)
+
+                crawler = AsyncWebCrawler(config=BrowserConfig(headless=True))
+                await crawler.start()
+                self._crawler = crawler
+            return self._crawler
+
+    def cache_stats(self) -> Dict[str, Dict[str, Any]]:
+        """캐시 적중/실패 통계"""
+        return {
+            **self.law_fetcher.cache_stats(),
+            "search": self.search_cache.stats(),
+            "pages": self.page_cache.stats(),
+            "answers": self.answer_cache.stats(),
+        }
+
+    def normalize_query(self, query: str) -> str:
+        """캐시 키용 질문 정규화 (유니코드 정규화, 소문자, 문장부호/공백 정리)"""
+        query = unicodedata.normalize("NFKC", query).lower()
+        query = re.sub(r"[^\w\s]", " ", query)
+        return " ".join(query.split())
+
+    def _search_cache_key(
+        self, query: str, domains: List[str] | None, num_results: int
+    ) -> str:
+        """검색 결과 캐시 키: 정규화된 질문(또는 키워드 집합) + 도메인 필터 + 결과 수"""
+        if self.search_cache_use_keywords:
+            keywords = self.normalize_query(self.extract_keywords(query)).split()
+            normalized = " ".join(sorted(set(keywords)))
+        else:
+            normalized = self.normalize_query(query)
+        domain_filter = ",".join(sorted(domains or []))
+        return f"{normalized}|{domain_filter}|{num_results}"
+
+    async def _ensure_tokenizer(self):
+        """Kiwi 모델이 아직 없으면 작업 스레드에서 불러옴 (이벤트 루프를 수 초간 막지 않도록)"""
+        if not is_kiwi_loaded():
+            await asyncio.to_thread(warm_up)
 
     def extract_keywords(self, query: str) -> str:
-        """질문에서 키워드 추출 (현재는 원본 질문 반환)"""
-        # TODO: 향후 kiwipiepy 등 한국어 형태소 분석기 추가 예정
-        return query
+        """
+        질문에서 검색 키워드 추출 (kiwipiepy 형태소 분석)
+
+        명사(붙어 있는 명사는 "건축법"처럼 합침), 어근, 외국어, 조문번호만 남기고
+        조사/어미/의문사는 버립니다. 키워드가 없으면 원본 질문을 반환합니다.
+        처음 호출하면 Kiwi 모델을 불러오므로, 이벤트 루프에서는 start() 또는
+        _ensure_tokenizer()로 미리 불러온 뒤 호출합니다 (retrieve/search_urls는 자동).
+        """
+        keywords = extract_keyword_terms(query)
+        return " ".join(keywords) if keywords else query
+
+    def extract_keywords_batch(self, queries: List[str]) -> List[str]:
+        """여러 질문의 키워드를 한 번에 추출 (extract_keywords와 같은 결과, 입력 순서 유지)"""
+        return [
+            " ".join(keywords) if keywords else query
+            for query, keywords in zip(queries, extract_keyword_terms_batch(queries))
+        ]
 
     def _select_best_law_name(self, query: str, laws: List[Dict[str, str]]) -> str:
         """사용자 질문과 가장 관련성이 높은 법령명을 선택"""
@@ -89,17 +368,15 @@ class LawSearchIntegrated:
 
         return best_law["law_name"]
 
-    def tavily_search(
+    async def tavily_search(
         self, query: str, domains: List[str] | None = None, num_results: int = 5
     ) -> List[str]:
-        """Tavily API를 사용하여 검색 결과 가져오기"""
+        """Tavily API(비동기 클라이언트)를 사용하여 검색 결과 가져오기"""
         try:
-            if not self.tavily_api_key:
+            if not self.tavily_client:
                 print("⚠️  TAVILY_API_KEY 환경변수가 설정되지 않았습니다.")
                 return []
 
-            client = TavilyClient(api_key=self.tavily_api_key)
-
             # 검색 파라미터 설정
             search_params = {
                 "query": query,
@@ -115,7 +392,7 @@ class LawSearchIntegrated:
                 search_params["include_domains"] = domains
                 print(f"🔍 지정된 도메인에서 검색: {', '.join(domains)}")
 
-            response = client.search(**search_params)
+            response = await self.tavily_client.search(**search_params)
 
             urls = []
             if "results" in response:
@@ -129,10 +406,10 @@ class LawSearchIntegrated:
             print(f"Tavily 검색 중 오류: {e}")
             return []
 
-    def google_cse_search(
+    async def google_cse_search(
         self, query: str, domains: List[str] | None = None, num_results: int = 5
     ) -> List[str]:
-        """Google Custom Search Engine API를 사용하여 검색 결과 가져오기"""
+        """Google Custom Search Engine API를 사용하여 검색 결과 가져오기 (공유 HTTP 세션)"""
         try:
             if not self.google_cse_api_key or not self.google_cse_engine_id:
                 print(
@@ -140,9 +417,6 @@ class LawSearchIntegrated:
                 )
                 return []
 
-            import requests
-            from urllib.parse import quote_plus
-
             # 검색 쿼리 구성
             search_query = query
             if domains:
@@ -159,10 +433,12 @@ class LawSearchIntegrated:
                 "num": min(num_results, 10),  # Google CSE는 최대 10개 결과
             }
 
-            response = requests.get(base_url, params=params, timeout=10)
-            response.raise_for_status()
-
-            data = response.json()
+            session = await self._get_http_session()
+            async with session.get(
+                base_url, params=params, timeout=aiohttp.ClientTimeout(total=10)
+            ) as response:
+                response.raise_for_status()
+                data = await response.json()
             urls = []
 
             if "items" in data:
@@ -179,35 +455,131 @@ class LawSearchIntegrated:
             print(f"Google CSE 검색 중 오류: {e}")
             return []
 
-    def search_urls(
+    async def search_urls(
         self,
         original_query: str,
         extracted_query: str,
         domains: List[str] | None = None,
         num_results: int = 5,
+        hedge_delay: float | None = None,
+        deadline: float | None = None,
+        merge: bool | None = None,
     ) -> List[str]:
-        """Google CSE는 원본 쿼리, Tavily는 추출된 키워드로 검색"""
-        # Google CSE 우선
-        if self.google_cse_api_key and self.google_cse_engine_id:
-            print("🔍 Google CSE API로 검색 중... (원본 쿼리 사용)")
-            urls = self.google_cse_search(original_query, domains, num_results)
-            if urls:
-                return urls
-            else:
-                print("⚠️  Google CSE 검색 실패, Tavily API로 fallback...")
-
-        # Tavily fallback
-        if self.tavily_api_key:
-            print("🔍 Tavily API로 검색 중... (추출된 키워드 사용)")
-            urls = self.tavily_search(extracted_query, domains, num_results)
-            if urls:
-                return urls
-            else:
-                print("⚠️  Tavily 검색 실패")
+        """
+        Google CSE는 원본 쿼리, Tavily는 추출된 키워드로 검색
+
+        Google CSE를 먼저 시작하고, hedge_delay초 안에 결과가 없으면 Tavily를
+        동시에 시작해 먼저 도착한 비어있지 않은 결과를 사용합니다 (나머지는 취소).
+        비어있지 않은 결과는 정규화된 질문 기준으로 캐시됩니다 (search_cache).
+
+        Args:
+            hedge_delay: Tavily 시작 전 CSE 응답 대기 시간 (기본값: search_hedge_delay)
+            deadline: 검색 단계 전체 제한 시간 (기본값: search_deadline)
+            merge: True이면 두 결과를 모두 기다려 합침 (기본값: merge_search_results)
+
+        Returns:
+            URL 리스트 (제한 시간 안에 결과가 없으면 빈 리스트)
+        """
+        # 캐시 키의 키워드 추출 전에 형태소 분석기 준비
+        await self._ensure_tokenizer()
+        use_cse = bool(self.google_cse_api_key and self.google_cse_engine_id)
+        use_tavily = self.tavily_client is not None
+        if not use_cse and not use_tavily:
+            raise ValueError(
+                "검색 API 키가 설정되지 않았습니다. GOOGLE_CSE_API_KEY와 GOOGLE_CSE_ENGINE_ID 또는 TAVILY_API_KEY 중 하나를 설정해주세요."
+            )
 
-        raise ValueError(
-            "검색 API 키가 설정되지 않았습니다. GOOGLE_CSE_API_KEY와 GOOGLE_CSE_ENGINE_ID 또는 TAVILY_API_KEY 중 하나를 설정해주세요."
+        cache_key = self._search_cache_key(original_query, domains, num_results)
+        cached = await self.search_cache.aget(cache_key)
+        if cached is not MISSING:
+            print(f"🔍 검색 캐시 사용: {len(cached)}개 URL")
+            return cached
+
+        urls = await self._search_providers(
+            original_query,
+            extracted_query,
+            domains,
+            num_results,
+            hedge_delay,
+            deadline,
+            merge,
+            use_cse,
+            use_tavily,
         )
+        # 빈 결과는 일시적인 실패일 수 있으므로 캐시하지 않음
+        if urls:
+            await self.search_cache.aset(cache_key, urls)
+        return urls
+
+    async def _search_providers(
+        self,
+        original_query: str,
+        extracted_query: str,
+        domains: List[str] | None,
+        num_results: int,
+        hedge_delay: float | None,
+        deadline: float | None,
+        merge: bool | None,
+        use_cse: bool,
+        use_tavily: bool,
+    ) -> List[str]:
+        """Google CSE / Tavily 헤징 검색 (search_urls 참고)"""
+        hedge_delay = self.search_hedge_delay if hedge_delay is None else hedge_delay
+        deadline = self.search_deadline if deadline is None else deadline
+        merge = self.merge_search_results if merge is None else merge
+
+        collected: List[List[str]] = []
+        pending = set()
+        try:
+            async with asyncio.timeout(deadline):
+                # Google CSE 우선
+                if use_cse:
+                    print("🔍 Google CSE API로 검색 중... (원본 쿼리 사용)")
+                    pending.add(
+                        asyncio.create_task(
+                            self.google_cse_search(original_query, domains, num_results)
+                        )
+                    )
+                    done, pending = await asyncio.wait(pending, timeout=hedge_delay)
+                    for task in done:
+                        urls = task.result()
+                        if urls and not merge:
+                            return urls
+                        collected.append(urls)
+                    if use_tavily and pending:
+                        print("⏱️  Google CSE 응답 지연, Tavily API 동시 검색...")
+                    elif use_tavily:
+                        print("⚠️  Google CSE 검색 실패, Tavily API로 fallback...")
+
+                # Tavily (hedge 또는 fallback)
+                if use_tavily:
+                    print("🔍 Tavily API로 검색 중... (추출된 키워드 사용)")
+                    pending.add(
+                        asyncio.create_task(
+                            self.tavily_search(extracted_query, domains, num_results)
+                        )
+                    )
+
+                while pending:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        urls = task.result()
+                        if urls and not merge:
+                            return urls
+                        collected.append(urls)
+        except TimeoutError:
+            print(f"⚠️  검색 제한 시간({deadline}초) 초과")
+        finally:
+            for task in pending:
+                task.cancel()
+
+        # 합치기 모드이거나 모든 검색이 빈 결과인 경우
+        merged = list(dict.fromkeys(url for urls in collected for url in urls))
+        if not merged:
+            print("⚠️  검색 결과 없음")
+        return merged[:num_results]
 
     def clean_markdown_text(self, text: str) -> str:
         """마크다운 텍스트에서 URL 링크 제거"""
@@ -231,19 +603,682 @@ class LawSearchIntegrated:
 
         return text
 
+    def _extract_markdown(self, result: Any) -> Optional[str]:
+        """크롤링 결과에서 마크다운 텍스트 추출"""
+        markdown_content = None
+        # result 처리 - CrawlResultContainer._results 내부 접근
+        # _results 안전 접근
+        results_list = None
+        if isinstance(result, dict) and "_results" in result:
+            results_list = result["_results"]
+        else:
+            results_list = getattr(result, "_results", None)
+        if results_list and isinstance(results_list, list):
+            for item in results_list:
+                item_dict = item
+                if not isinstance(item, dict) and hasattr(item, "__dict__"):
+                    item_dict = item.__dict__
+                if isinstance(item_dict, dict):
+                    for key in ["markdown", "content", "text"]:
+                        if key in item_dict and item_dict[key]:
+                            markdown_content = item_dict[key]
+                            break
+                if not markdown_content:
+                    for key in ["markdown", "content", "text"]:
+                        val = getattr(item, key, None)
+                        if val:
+                            markdown_content = val
+                            break
+                if markdown_content:
+                    break
+        return markdown_content
+
+    def _extract_response_headers(self, result: Any) -> Dict[str, str]:
+        """크롤링 결과에서 응답 헤더 추출 (없으면 빈 dict)"""
+        results_list = getattr(result, "_results", None) or [result]
+        for item in results_list:
+            headers = getattr(item, "response_headers", None)
+            if headers:
+                return dict(headers)
+        return {}
+
+    def _page_entry(
+        self, text: str, headers: Any, cached: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """페이지 캐시 항목 생성 (응답에 검증자가 없으면 기존 값 유지)"""
+        headers = {k.lower(): v for k, v in (headers or {}).items()}
+        cached = cached or {}
+        return {
+            "text": text,
+            "etag": headers.get("etag") or cached.get("etag"),
+            "last_modified": headers.get("last-modified")
+            or cached.get("last_modified"),
+            "fetched_at": time.time(),
+        }
+
+    def _conditional_headers(self, cached: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """캐시된 검증자로 조건부 요청 헤더 구성"""
+        headers = {}
+        if cached and cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached and cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+        return headers
+
+    async def _revalidate_page(self, url: str, cached: Dict[str, Any]) -> bool:
+        """조건부 요청으로 캐시된 페이지가 바뀌지 않았는지(304) 확인
+
+        호스트 요청 간격은 여기서 지키므로, 바뀐 페이지(200)를 바로 이어서 브라우저로
+        받을 때는 다시 기다리지 않습니다. 200 응답의 본문은 읽지 않고 연결을 닫습니다.
+        """
+        headers = self._conditional_headers(cached)
+        if not headers:
+            return False
+        await self._wait_for_host(url)
+        try:
+            session = await self._get_http_session()
+            async with session.get(url, headers=headers) as resp:
+                not_modified = resp.status == 304
+                if not not_modified:
+                    resp.close()
+        except Exception as e:
+            print(f"페이지 재검증 실패 ({url}): {e}")
+            return False
+        if not_modified:
+            print(f"📦 페이지 변경 없음 (304): {url}")
+        return not_modified
+
+    async def _wait_for_host(self, url: str):
+        """같은 호스트에 대한 요청 간격을 crawl_delay 이상으로 유지 (이벤트 루프는 막지 않음)"""
+        host = urlparse(url).netloc
+        lock = self._host_locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            loop = asyncio.get_running_loop()
+            last_request = self._host_last_request.get(host)
+            if last_request is not None:
+                wait = last_request + self.crawl_delay - loop.time()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+            self._host_last_request[host] = loop.time()
+
+    def _crawl_strategy(self, url: str) -> str:
+        """URL의 도메인에 해당하는 크롤링 방식 (가장 구체적인 도메인 우선, 기본값 "browser")"""
+        host = (urlparse(url).hostname or "").lower()
+        matched = [
+            domain
+            for domain in self.crawl_strategies
+            if host == domain or host.endswith("." + domain)
+        ]
+        if not matched:
+            return "browser"
+        return self.crawl_strategies[max(matched, key=len)]
+
+    def _html_to_text(self, html: str) -> str:
+        """HTML에서 본문 텍스트 추출 (lxml 파서)"""
+        soup = BeautifulSoup(html, "lxml")
+        for tag in soup(["script", "style", "noscript", "header", "footer", "nav"]):
+            tag.decompose()
+
+        lines = (line.strip() for line in soup.get_text("\n").splitlines())
+        return "\n".join(line for line in lines if line)
+
+    async def _fetch_static_page(
+        self, url: str, cached: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        aiohttp로 페이지를 받아 텍스트를 추출합니다.
+
+        cached가 있으면 조건부 요청을 보내고, 304 응답이면 캐시된 텍스트를 그대로 씁니다.
+
+        Returns:
+            페이지 캐시 항목 (실패하거나 내용이 거의 없으면 None)
+        """
+        try:
+            session = await self._get_http_session()
+            async with session.get(
+                url, headers=self._conditional_headers(cached)
+            ) as resp:
+                if resp.status == 304 and cached:
+                    print(f"📦 페이지 변경 없음 (304): {url}")
+                    return self._page_entry(cached["text"], resp.headers, cached)
+                content_type = resp.headers.get("content-type", "")
+                if resp.status != 200 or not any(
+                    t in content_type for t in ("html", "xml", "text/plain")
+                ):
+                    return None
+                html = await resp.text(errors="replace")
+                headers = resp.headers
+        except Exception as e:
+            print(f"HTTP 크롤링 실패 ({url}): {e}")
+            return None
+
+        text = self.clean_markdown_text(self._html_to_text(html))
+        # 자바스크립트로 본문을 채우는 페이지는 브라우저로 다시 시도
+        if len(text) < self.MIN_STATIC_TEXT_LENGTH:
+            return None
+        return self._page_entry(text, headers)
+
+    async def _crawl_with_browser(
+        self, url: str, wait_for_host: bool = True
+    ) -> Optional[Dict[str, Any]]:
+        """Crawl4AI(헤드리스 브라우저)로 크롤링하여 페이지 캐시 항목 반환
+
+        wait_for_host가 False이면 호스트 요청 간격을 기다리지 않음 (직전에 기다린 경우)
+        """
+        # 링크 제거를 위한 CrawlerRunConfig 설정
+        config = CrawlerRunConfig(
+            exclude_external_links=True,
+            exclude_internal_links=True,
+            exclude_social_media_links=True,
+            exclude_all_images=True,
+        )
+
+        try:
+            crawler = await self._get_crawler()
+            if wait_for_host:
+                await self._wait_for_host(url)
+            async with self._crawl_semaphore:
+                result = await crawler.arun(url=url, config=config)
+        except Exception as e:
+            print(f"크롤링 실패 ({url}): {e}")
+            return None
+
+        try:
+            markdown_content = self._extract_markdown(result)
+            headers = self._extract_response_headers(result)
+        except Exception as e:
+            print(f"결과 처리 중 오류: {e}")
+            return None
+
+        if not markdown_content:
+            print(f"크롤링 결과에서 텍스트를 추출할 수 없습니다: {url}")
+            return None
+        return self._page_entry(self.clean_markdown_text(markdown_content), headers)
+
+    async def _crawl_url(self, url: str, index: int, total: int) -> Optional[str]:
+        """
+        URL 하나를 도메인별 방식으로 크롤링하여 정리된 텍스트를 반환합니다 (실패 시 None).
+
+        page_cache_ttl 안에 받은 페이지는 요청 없이 캐시를 쓰고, 그보다 오래된 페이지는
+        ETag/Last-Modified 조건부 요청으로 재검증합니다.
+        """
+        print(f"크롤링 중 ({index}/{total}): {url}")
+
+        cached = await self.page_cache.aget(url)
+        if cached is MISSING:
+            cached = None
+        elif time.time() - cached["fetched_at"] < self.page_cache_ttl:
+            print(f"📦 페이지 캐시 사용: {url}")
+            return cached["text"]
+
+        page = None
+        # HTTP 요청/조건부 요청에서 이미 호스트 요청 간격을 지켰는지
+        waited = False
+        if self._crawl_strategy(url) == "http":
+            await self._wait_for_host(url)
+            waited = True
+            page = await self._fetch_static_page(url, cached)
+            if not page:
+                print(f"⚠️  HTTP 크롤링 결과 부족, 브라우저로 재시도: {url}")
+        elif cached and self._conditional_headers(cached):
+            if await self._revalidate_page(url, cached):
+                page = self._page_entry(cached["text"], {}, cached)
+            waited = True
+
+        if not page:
+            page = await self._crawl_with_browser(url, wait_for_host=not waited)
+        if not page:
+            # 다시 받지 못하면 오래된 캐시라도 사용
+            return cached["text"] if cached else None
+
+        await self.page_cache.aset(url, page)
+        return page["text"]
+
+    def _article_references(
+        self, article: Dict[str, Any], content: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """조회된 조문이 참조하는 조문 (참조 색인 우선, 색인에 없으면 정규식으로 추출)"""
+        if self.reference_index is not None:
+            refs = self.reference_index.neighbors(
+                content.get("law_id"), content.get("jo_num")
+            )
+            if refs is not None:
+                return refs
+        # 조문 내용의 "법 제X조"는 그 조문이 속한 법령을 기준으로 해석
+        content_text = content["content"].get("content", "")
+        return extract_referenced_articles(content_text, article["law_name"])
+
+    def new_reference_graph(self) -> ReferenceGraph:
+        """인스턴스 설정(깊이/노드 수/시간 제한)으로 빈 참조 그래프 생성"""
+        return ReferenceGraph(
+            max_depth=self.max_reference_depth,
+            max_nodes=self.max_reference_nodes,
+            time_budget=self.reference_time_budget,
+        )
+
+    async def stream_law_contents(
+        self, query: str, urls: List[str], graph: Optional[ReferenceGraph] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        크롤링 → 법령 추출 → 조문 조회를 단계별로 기다리지 않고 겹쳐서 실행합니다.
+
+        페이지가 크롤링되는 대로 법령을 추출해 처음 보는 조문을 바로 조회하고,
+        조회된 조문 내용에서 찾은 참조 조문도 이어서 조회합니다. 참조는 그래프의
+        max_depth까지 너비 우선으로 따라가며, 조문 하나에서 찾은 참조들은 함께
+        동시에 조회합니다. 방문한 조문은 다시 조회하지 않고, 노드 수/시간 제한을
+        넘으면 더 이상 확장하지 않습니다.
+
+        Args:
+            query: 사용자 질문 (페이지별 기준 법령 선택용)
+            urls: 크롤링할 URL 리스트
+            graph: 탐색 결과를 기록할 참조 그래프 (없으면 new_reference_graph())
+        Yields:
+            도착 순서대로
+            {"type": "page", "index": URL 순번, "url": URL, "text": 정리된 텍스트} 또는
+            {"type": "article", "order": 발견 순번, "depth": 참조 깊이,
+             "result": 조문 조회 결과}
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        # 방문한 조문 (중복 조회 및 순환 방지)
+        graph = graph if graph is not None else self.new_reference_graph()
+        graph.start()
+        # 페이지들이 동시에 찾은 조문도 전체 동시 조회 수 한도를 공유
+        semaphore = asyncio.Semaphore(self.law_fetcher.max_concurrent_requests)
+        tasks: List[asyncio.Task] = []
+        pending = 0
+
+        def on_done(task: asyncio.Task):
+            if not task.cancelled() and task.exception():
+                print(f"파이프라인 작업 오류: {task.exception()}")
+            # 작업 하나가 끝났음을 알림 (자식 작업은 이보다 먼저 등록됨)
+            queue.put_nowait(None)
+
+        def spawn(coro):
+            nonlocal pending
+            pending += 1
+            task = asyncio.create_task(coro)
+            task.add_done_callback(on_done)
+            tasks.append(task)
+
+        def schedule(
+            articles: List[Dict[str, Any]], depth: int, parent: Optional[str] = None
+        ):
+            new_articles = [
+                new_article
+                for article in articles
+                for new_article in graph.visit(article, depth, parent)
+            ]
+            if new_articles:
+                spawn(fetch(new_articles))
+
+        async def fetch(articles: List[Dict[str, Any]]):
+            async for result in self.law_fetcher.iter_law_articles_content(
+                articles, semaphore
+            ):
+                article = result["original_article"]
+                content = result.get("content", {})
+                success = bool(content.get("success"))
+                # 참조는 깊이와 관계없이 기록 (나중에 더 얕은 경로로 발견되면 따라감)
+                graph.mark_fetched(
+                    article["key"],
+                    success,
+                    self._article_references(article, content) if success else None,
+                )
+                # 조회하는 동안 더 얕은 경로로 발견되었을 수 있으므로 그래프의 깊이 사용
+                depth = graph.depth(article["key"])
+                queue.put_nowait(
+                    {
+                        "type": "article",
+                        "order": graph.index(article["key"]),
+                        "depth": depth,
+                        "result": result,
+                    }
+                )
+                new_refs = graph.expand(article["key"])
+                if new_refs:
+                    print(
+                        f"📋 {article['law_name']} 제{article['article_num']}조에서 "
+                        f"추가 참조 발견: {len(new_refs)}개 (깊이 {depth + 1})"
+                    )
+                    spawn(fetch(new_refs))
+
+        async def crawl(url: str, index: int):
+            text = await self._crawl_url(url, index, len(urls))
+            if not text:
+                return
+            queue.put_nowait({"type": "page", "index": index, "url": url, "text": text})
+
+            # 페이지마다 질문과 가장 관련 있는 법령을 기준으로 "법 제X조" 참조 해석
+            direct_laws = extract_law_articles(text, self.law_names)
+            current_law_name = self._select_best_law_name(query, direct_laws)
+            referenced_laws = (
+                extract_referenced_articles(text, current_law_name)
+                if current_law_name
+                else []
+            )
+            print(
+                f"📋 {url}: 법령 {len(direct_laws) + len(referenced_laws)}개 추출 "
+                f"(직접: {len(direct_laws)}개, 참조: {len(referenced_laws)}개)"
+            )
+            if current_law_name:
+                print(f"📋 기준 법령: {current_law_name}")
+            schedule(direct_laws + referenced_laws, depth=0)
+
+        for index, url in enumerate(urls, 1):
+            spawn(crawl(url, index))
+
+        try:
+            while pending:
+                event = await queue.get()
+                if event is None:
+                    pending -= 1
+                    continue
+                yield event
+        finally:
+            # 소비자가 중간에 멈추면 남은 작업 취소
+            for task in tasks:
+                task.cancel()
+
+    def _answer_prompt(self, query: str, rag_context: str) -> str:
+        """문맥 전체로 한 번에 답하는 프롬프트"""
+        return f"""
+아래는 법령 및 관련 조문 내용입니다. 이 내용을 참고하여 사용자의 질문에 대해 법적 근거와 함께 명확하게 답변해 주세요. 답변은 최대한 법령 내용을 인용하는 방식으로 작성해주세요.
+
+[법령 및 조문]
+{rag_context}
+
+[질문]
+{query}
+
+[답변]
+"""
+
+    def _map_prompt(self, query: str, rag_context: str) -> str:
+        """문맥 일부로 부분 답변을 만드는 프롬프트 (map 단계)"""
+        return f"""
+아래는 법령 및 관련 조문 내용의 일부입니다. 이 내용만을 근거로 사용자의 질문과 관련된 사항을 조문 번호와 함께 간결하게 정리해 주세요. 관련된 내용이 없으면 "{self.NO_RELEVANT_CONTENT}"이라고만 답해주세요.
+
+[법령 및 조문]
+{rag_context}
+
+[질문]
+{query}
+
+[부분 답변]
+"""
+
+    def _reduce_prompt(self, query: str, partial_answers: List[str]) -> str:
+        """부분 답변들을 하나로 통합하는 프롬프트 (reduce 단계)"""
+        partials = "\n\n".join(
+            f"[부분 답변 {i}]\n{answer}" for i, answer in enumerate(partial_answers, 1)
+        )
+        return f"""
+아래는 법령 및 조문 내용을 나누어 각각 정리한 부분 답변들입니다. 이 부분 답변들을 통합하여 사용자의 질문에 대해 법적 근거와 함께 명확하게 답변해 주세요. 서로 겹치는 내용은 한 번만 쓰고, 답변은 최대한 법령 내용을 인용하는 방식으로 작성해주세요.
+
+{partials}
+
+[질문]
+{query}
+
+[답변]
+"""
+
+    def _completion_args(self, prompt: str, max_tokens: int) -> Dict[str, Any]:
+        return {
+            "model": self.llm_model,
+            "messages": [
+                {"role": "system", "content": "당신은 법률 전문가입니다."},
+                {"role": "user", "content": prompt},
+            ],
+            "temperature": 0.2,
+            "max_tokens": max_tokens,
+        }
+
+    async def _complete(self, prompt: str, max_tokens: int = 800) -> Optional[str]:
+        """LLM 호출 한 번 (비동기 클라이언트, 생성 중에도 다른 요청은 계속 진행)"""
+        async with self._llm_semaphore:
+            response = await self.openai_client.chat.completions.create(
+                **self._completion_args(prompt, max_tokens)
+            )
+        content = response.choices[0].message.content
+        return content.strip() if content else None
+
+    async def _stream_complete(
+        self, prompt: str, max_tokens: int = 800
+    ) -> AsyncIterator[str]:
+        """LLM 호출 한 번을 스트리밍으로 받아 생성되는 대로 텍스트 조각을 내보냄
+
+        스트림은 별도 작업이 받아 큐에 넣으므로, LLM 호출 슬롯(_llm_semaphore)은
+        생성이 끝나면 바로 반납됩니다. 소비자가 느리거나 중간에 떠나도 슬롯을
+        붙잡고 있지 않고, 소비자가 멈추면(aclose/취소) 스트림도 닫습니다.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        end = object()
+
+        async def receive():
+            try:
+                async with self._llm_semaphore:
+                    stream = await self.openai_client.chat.completions.create(
+                        **self._completion_args(prompt, max_tokens), stream=True
+                    )
+                    async with stream:
+                        async for chunk in stream:
+                            if chunk.choices and chunk.choices[0].delta.content:
+                                queue.put_nowait(chunk.choices[0].delta.content)
+            finally:
+                queue.put_nowait(end)
+
+        receiver = asyncio.create_task(receive())
+        try:
+            while True:
+                token = await queue.get()
+                if token is end:
+                    break
+                yield token
+            # 스트림 오류는 소비자에게 전달
+            await receiver
+        finally:
+            receiver.cancel()
+
+    def select_answer_mode(self, built: Dict[str, Any]) -> str:
+        """답변 방식 선택: "single"(한 번 호출) 또는 "map_reduce"
+
+        answer_mode가 "auto"이면 구성된 문맥이 map_reduce_threshold 토큰을 넘을 때
+        map-reduce를 씁니다.
+        """
+        if self.answer_mode != "auto":
+            return self.answer_mode
+        if built["tokens"] > self.map_reduce_threshold and len(built["chunks"]) > 1:
+            return "map_reduce"
+        return "single"
+
+    def _answer_cache_key(
+        self, query: str, built: Dict[str, Any], answer_mode: str
+    ) -> str:
+        """답변 캐시 키
+
+        정규화된 질문, 모델, 답변 방식, 프롬프트에 들어간 조각들의 (key, 내용 해시)
+        집합을 합친 해시입니다. 조문 내용이 바뀌면 키도 바뀝니다.
+        """
+        fingerprint = sorted(
+            f"{chunk['key']}={chunk['content_hash']}" for chunk in built["chunks"]
+        )
+        payload = json.dumps(
+            [self.normalize_query(query), self.llm_model, answer_mode, fingerprint],
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def generate_answer(
+        self, query: str, built: Dict[str, Any], answer_mode: str | None = None
+    ) -> Optional[str]:
+        """
+        구성된 문맥으로 LLM 답변을 생성합니다.
+
+        Args:
+            query: 사용자 질문
+            built: ContextBuilder.build 결과
+            answer_mode: "single" 또는 "map_reduce" (없으면 select_answer_mode)
+        Returns:
+            LLM 답변 (생성하지 못하면 None)
+        """
+        answer_mode = answer_mode or self.select_answer_mode(built)
+        cache_key = self._answer_cache_key(query, built, answer_mode)
+        cached = await self.answer_cache.aget(cache_key)
+        if cached is not MISSING:
+            print("💬 답변 캐시 사용")
+            return cached
+
+        if answer_mode == "map_reduce":
+            answer = await self._map_reduce_answer(query, built["chunks"])
+        else:
+            answer = await self._complete(self._answer_prompt(query, built["context"]))
+        if answer:
+            await self.answer_cache.aset(cache_key, answer)
+        return answer
+
+    async def stream_generated_answer(
+        self, query: str, built: Dict[str, Any], answer_mode: str | None = None
+    ) -> AsyncIterator[str]:
+        """
+        generate_answer와 같지만 답변을 생성되는 대로 조각 단위로 내보냅니다.
+
+        map-reduce에서는 부분 답변을 모두 받은 뒤 통합(reduce) 호출을 스트리밍합니다.
+        캐시된 답변은 한 번에 내보내고, 끝까지 생성된 답변만 캐시합니다.
+        """
+        answer_mode = answer_mode or self.select_answer_mode(built)
+        cache_key = self._answer_cache_key(query, built, answer_mode)
+        cached = await self.answer_cache.aget(cache_key)
+        if cached is not MISSING:
+            print("💬 답변 캐시 사용")
+            yield cached
+            return
+
+        if answer_mode == "map_reduce":
+            partial_answers = await self._map_answers(query, built["chunks"])
+            if len(partial_answers) <= 1:
+                for answer in partial_answers:
+                    await self.answer_cache.aset(cache_key, answer)
+                    yield answer
+                return
+            prompt = self._reduce_prompt(query, partial_answers)
+        else:
+            prompt = self._answer_prompt(query, built["context"])
+
+        tokens = []
+        async for token in self._stream_complete(prompt):
+            tokens.append(token)
+            yield token
+        answer = "".join(tokens).strip()
+        if answer:
+            await self.answer_cache.aset(cache_key, answer)
+
+    async def _map_reduce_answer(
+        self, query: str, chunks: List[Dict[str, Any]]
+    ) -> Optional[str]:
+        """문맥을 나눠 부분 질의를 동시에 실행(map)한 뒤 한 번 더 호출해 통합(reduce)"""
+        partial_answers = await self._map_answers(query, chunks)
+        if not partial_answers:
+            return None
+        if len(partial_answers) == 1:
+            return partial_answers[0]
+        return await self._complete(self._reduce_prompt(query, partial_answers))
+
+    async def _map_answers(self, query: str, chunks: List[Dict[str, Any]]) -> List[str]:
+        """문맥 조각들을 예산 단위로 나눠 부분 답변을 동시에 생성 (관련 내용 없는 답변 제외)"""
+        groups = self.context_builder.split_groups(
+            chunks, self.context_builder.max_tokens, max_groups=self.max_map_chunks
+        )
+        print(f"🧠 map-reduce 답변: 부분 질의 {len(groups)}개")
+
+        async def map_one(group_context: str) -> Optional[str]:
+            try:
+                return await self._complete(self._map_prompt(query, group_context))
+            except Exception as e:
+                print(f"부분 답변 생성 오류: {e}")
+                return None
+
+        partials = await asyncio.gather(*(map_one(group) for group in groups))
+        return [
+            answer
+            for answer in partials
+            if answer and self.NO_RELEVANT_CONTENT not in answer
+        ]
+
     async def crawl_and_extract_laws(
         self, query: str, domains: List[str] | None = None, num_results: int = 5
     ) -> Dict[str, Any]:
         """검색 → 크롤링 → 법령 추출 → 조문 내용 가져오기 + LLM 답변"""
+        results = await self.retrieve(query, domains, num_results)
+        built = results.pop("context", None)
+        if not results["success"]:
+            return results
+
+        # 7. LLM 답변 생성 (문맥이 한 번에 넣기에 크면 map-reduce)
+        # 법령 추출 결과가 없으면 LLM 답변 차단
+        # if self.openai_client and (direct_laws or referenced_laws):
+        if self.openai_client:
+            results["answer_mode"] = self.select_answer_mode(built)
+            try:
+                results["llm_answer"] = await self.generate_answer(
+                    query, built, results["answer_mode"]
+                )
+                # print(f"DEBUG: LLM 답변: {results['llm_answer']}")
+            except Exception as e:
+                print(f"LLM 답변 생성 오류: {e}")
+                results["llm_answer"] = None
+
+        return results
+
+    async def stream_answer(
+        self, query: str, domains: List[str] | None = None, num_results: int = 5
+    ) -> AsyncIterator[str]:
+        """
+        검색부터 답변까지 실행하고 LLM 답변을 생성되는 대로 조각 단위로 내보냅니다.
+
+        Args:
+            query: 사용자 질문
+            domains: 검색할 도메인 리스트
+            num_results: 검색 결과 수
+        Yields:
+            답변 텍스트 조각
+        Raises:
+            RuntimeError: LLM 클라이언트가 없거나 검색/크롤링에 실패한 경우
+        """
+        if not self.openai_client:
+            raise RuntimeError("OPENAI_API_KEY 환경변수가 설정되지 않았습니다.")
+        results = await self.retrieve(query, domains, num_results)
+        if not results["success"]:
+            raise RuntimeError(results["error"])
+
+        async for token in self.stream_generated_answer(query, results["context"]):
+            yield token
+
+    async def retrieve(
+        self, query: str, domains: List[str] | None = None, num_results: int = 5
+    ) -> Dict[str, Any]:
+        """
+        검색 → 크롤링 → 법령 추출 → 조문 내용 가져오기 → 문맥 구성 (LLM 호출 전까지)
+
+        Returns:
+            crawl_and_extract_laws와 같은 형태의 결과 (llm_answer는 None)
+            성공하면 "context"에 ContextBuilder.build 결과 포함
+        """
 
         print(f"🔍 검색 시작: '{query}'")
 
+        # start()를 부르지 않았으면 여기서 Kiwi 모델을 불러옴 (키워드 추출, 코퍼스 검색용)
+        await self._ensure_tokenizer()
+
+        if self.retrieval_source == "corpus":
+            return self._retrieve_from_corpus(query)
+
         # 1. 키워드 추출
         search_query = self.extract_keywords(query)
 
         # 2. Google CSE 또는 Tavily API로 URL 수집
         try:
-            urls = self.search_urls(query, search_query, domains, num_results)
+            urls = await self.search_urls(query, search_query, domains, num_results)
         except ValueError as e:
             return {
                 "success": False,
@@ -310,90 +1345,38 @@ class LawSearchIntegrated:
 
         print(f"📄 {len(filtered_urls)}개의 URL을 크롤링합니다.")
 
-        # 2. 크롤링하여 텍스트 수집
-        all_text = ""
-
-        # 링크 제거를 위한 CrawlerRunConfig 설정
-        config = CrawlerRunConfig(
-            exclude_external_links=True,
-            exclude_internal_links=True,
-            exclude_social_media_links=True,
-            exclude_all_images=True,
-        )
-
-        # Crawl4AI 로그 출력 억제
-        import logging
+        # 2~5. 크롤링 → 법령 추출 → 조문 내용 가져오기 (스트리밍 파이프라인)
         import sys
 
-        # 모든 로그 레벨을 ERROR로 설정
-        logging.getLogger().setLevel(logging.ERROR)
-        logging.getLogger("crawl4ai").setLevel(logging.ERROR)
-        logging.getLogger("urllib3").setLevel(logging.ERROR)
-        logging.getLogger("requests").setLevel(logging.ERROR)
-
         SUPPRESS_STDOUT = False
         if SUPPRESS_STDOUT:
             # 표준 출력 리다이렉션 (임시)
             original_stdout = sys.stdout
             sys.stdout = open(os.devnull, "w")
 
-        async with AsyncWebCrawler(config=BrowserConfig(headless=True)) as crawler:
-            for i, url in enumerate(filtered_urls, 1):
-                try:
-                    print(f"크롤링 중 ({i}/{len(filtered_urls)}): {url}")
-                    result = await crawler.arun(url=url, config=config)
-
-                    # result 처리 - CrawlResultContainer._results 내부 접근
-                    try:
-                        markdown_content = None
-                        # _results 안전 접근
-                        results_list = None
-                        if isinstance(result, dict) and "_results" in result:
-                            results_list = result["_results"]
-                        else:
-                            results_list = getattr(result, "_results", None)
-                        if results_list and isinstance(results_list, list):
-                            for item in results_list:
-                                item_dict = item
-                                if not isinstance(item, dict) and hasattr(
-                                    item, "__dict__"
-                                ):
-                                    item_dict = item.__dict__
-                                if isinstance(item_dict, dict):
-                                    for key in ["markdown", "content", "text"]:
-                                        if key in item_dict and item_dict[key]:
-                                            markdown_content = item_dict[key]
-                                            break
-                                if not markdown_content:
-                                    for key in ["markdown", "content", "text"]:
-                                        val = getattr(item, key, None)
-                                        if val:
-                                            markdown_content = val
-                                            break
-                                if markdown_content:
-                                    break
-                        if markdown_content:
-                            cleaned_text = self.clean_markdown_text(markdown_content)
-                            all_text += f"\n\n--- {url} ---\n\n{cleaned_text}"
-                            # print(f"DEBUG: 텍스트 추출 성공, 길이: {len(cleaned_text)}")
-                        else:
-                            print(f"크롤링 결과에서 텍스트를 추출할 수 없습니다: {url}")
-                    except Exception as e:
-                        print(f"결과 처리 중 오류: {e}")
-                        continue
-
-                except Exception as e:
-                    print(f"크롤링 실패 ({url}): {e}")
-                    continue
-
-                # 요청 간격 조절
-                time.sleep(1)
+        loop = asyncio.get_running_loop()
+        started_at = loop.time()
+        pages: Dict[int, Tuple[str, str]] = {}
+        articles: List[Tuple[int, Dict[str, Any]]] = []
+        graph = self.new_reference_graph()
+        async for event in self.stream_law_contents(query, filtered_urls, graph):
+            if event["type"] == "page":
+                pages[event["index"]] = (event["url"], event["text"])
+            else:
+                if not articles:
+                    print(f"⏱️  첫 조문 도착: {loop.time() - started_at:.2f}초")
+                articles.append((event["order"], event["result"]))
 
         if SUPPRESS_STDOUT:
             # 표준 출력 복원
             sys.stdout.close()
             sys.stdout = original_stdout
 
+        # 도착 순서와 관계없이 검색 결과 순서대로 정렬
+        crawled_pages = [pages[index] for index in sorted(pages)]
+        all_text = "".join(
+            f"\n\n--- {url} ---\n\n{text}" for url, text in crawled_pages
+        )
         if not all_text.strip():
             return {
                 "success": False,
@@ -407,137 +1390,24 @@ class LawSearchIntegrated:
 
         print(f"📝 크롤링 완료: {len(all_text)} 문자")
 
-        # 3. 법령명과 조문번호 추출 (직접 언급 + 참조)
-        print("🔍 법령명과 조문번호 추출 중...")
-
-        # 법령명과 조문번호 추출
-        initial_laws = extract_law_articles(all_text)
-        current_law_name = None
-
-        if initial_laws:
-            # 사용자 질문과 가장 관련성이 높은 법령을 기준으로 선택
-            current_law_name = self._select_best_law_name(query, initial_laws)
-            print(f"📋 기준 법령: {current_law_name}")
-
-            # 디버그: 추출된 모든 법령 출력
-            print(f"🔍 추출된 법령들:")
-            for i, law in enumerate(initial_laws, 1):
-                print(f"  {i}. {law['law_name']} 제{law['article_num']}조")
-
-        # 직접 언급된 조항과 참조 조항 모두 추출
-        all_extracted = extract_all_articles_with_references(all_text, current_law_name)
-        extracted_laws = all_extracted["all_articles"]
-        direct_laws = all_extracted["direct_articles"]
-        referenced_laws = all_extracted["referenced_articles"]
-
+        # 조문은 발견 순서대로 정렬 (직접 언급 → 참조 → 조문 내 참조)
+        law_contents = [result for _, result in sorted(articles, key=lambda x: x[0])]
         print(
-            f"📋 추출된 법령: {len(extracted_laws)}개 (직접: {len(direct_laws)}개, 참조: {len(referenced_laws)}개)"
+            f"📖 조문 {len(law_contents)}개 조회 완료 "
+            f"(참조 그래프: 노드 {len(graph.nodes)}개, 간선 {len(graph.edges)}개"
+            + (", 한도 도달)" if graph.truncated else ")")
         )
-        for i, law in enumerate(direct_laws, 1):
-            print(f"  {i}. {law['law_name']} 제{law['article_num']}조 (직접 언급)")
-        for i, law in enumerate(referenced_laws, 1):
-            print(
-                f"  {len(direct_laws) + i}. {law['law_name']} 제{law['article_num']}조 (참조)"
-            )
-
-        # 4. 추출된 법령의 조문 내용 가져오기
-        law_contents = []
-        if extracted_laws:
-            print("📖 조문 내용 가져오기 중...")
-            # print(f"DEBUG: extracted_laws: {extracted_laws}")
-            law_contents = await self.law_fetcher.fetch_law_articles_content(
-                extracted_laws
-            )
-
-            # 5. 조문 내용에서 추가 참조 조항 추출
-            additional_references = []
-            for content_result in law_contents:
-                if (
-                    content_result.get("content", {}).get("success")
-                    and current_law_name
-                ):
-                    content_text = content_result["content"]["content"].get(
-                        "content", ""
-                    )
-                    if content_text:
-                        # 조문 내용에서 참조 추출
-                        content_refs = extract_referenced_articles(
-                            content_text, current_law_name
-                        )
-                        additional_references.extend(content_refs)
-
-            # 중복 제거
-            unique_additional_refs = []
-            seen_keys = set()
-            for ref in additional_references:
-                if ref["key"] not in seen_keys:
-                    unique_additional_refs.append(ref)
-                    seen_keys.add(ref["key"])
-
-            if unique_additional_refs:
-                print(
-                    f"📋 조문 내용에서 추가 참조 발견: {len(unique_additional_refs)}개"
-                )
-                for ref in unique_additional_refs:
-                    print(f"  - {ref['law_name']} 제{ref['article_num']}조")
-
-                # 추가 참조 조항을 referenced_laws에 합치기
-                referenced_laws.extend(unique_additional_refs)
-
-                # 추가 참조 조항의 내용도 가져오기
-                additional_contents = await self.law_fetcher.fetch_law_articles_content(
-                    unique_additional_refs
-                )
-                law_contents.extend(additional_contents)
 
-        # 6. RAG용 context 생성 (크롤링+법령 내용)
-        rag_context = all_text
-        for law in law_contents:
-            if law.get("content", {}).get("success"):
-                c = law["content"]["content"].get("content", "")
-                if c:
-                    rag_context += f"\n\n--- 법령 조문 ---\n\n{c}"
+        # 6. RAG용 context 생성 (크롤링+법령 내용을 토큰 예산 안에서 관련도 순으로)
+        built = self.build_context(query, crawled_pages, law_contents)
+        print(
+            f"🧩 문맥 구성: 조각 {len(built['chunks'])}개, {built['tokens']} 토큰 "
+            f"(제외 {built['dropped']}개)"
+        )
 
         # 디버그: 크롤링된 내용 출력
         print(f"\n🔍 크롤링된 내용 (처음 500자):\n{all_text[:500]}...")
 
-        # 7. LLM 답변 생성
-        llm_answer = None
-        # 법령 추출 결과가 없으면 LLM 답변 차단
-        # if self.openai_client and (direct_laws or referenced_laws):
-        if self.openai_client:
-            try:
-                prompt = f"""
-아래는 법령 및 관련 조문 내용입니다. 이 내용을 참고하여 사용자의 질문에 대해 법적 근거와 함께 명확하게 답변해 주세요. 답변은 최대한 법령 내용을 인용하는 방식으로 작성해주세요.
-
-[법령 및 조문]
-{rag_context}
-
-[질문]
-{query}
-
-[답변]
-"""
-                model_name = self.openai_model or "gpt-3.5-turbo-16k"
-                response = self.openai_client.chat.completions.create(
-                    model=model_name,
-                    messages=[
-                        {"role": "system", "content": "당신은 법률 전문가입니다."},
-                        {"role": "user", "content": prompt},
-                    ],
-                    temperature=0.2,
-                    max_tokens=800,
-                )
-                llm_answer = (
-                    response.choices[0].message.content.strip()
-                    if response.choices[0].message.content
-                    else None
-                )
-                # print(f"DEBUG: LLM 답변: {llm_answer}")
-            except Exception as e:
-                print(f"LLM 답변 생성 오류: {e}")
-                llm_answer = None
-
         return {
             "success": True,
             "search_query": query,
@@ -548,7 +1418,122 @@ class LawSearchIntegrated:
             # "direct_laws": direct_laws,
             # "referenced_laws": referenced_laws,
             "law_contents": law_contents,
-            "llm_answer": llm_answer,
+            "reference_graph": graph.to_dict(),
+            "context": built,
+            "answer_mode": None,
+            "llm_answer": None,
+        }
+
+    def build_context(
+        self,
+        query: str,
+        pages: List[Tuple[str, str]],
+        law_contents: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """
+        답변 방식에 맞는 토큰 예산으로 문맥을 구성합니다.
+
+        "auto"에서는 먼저 한 번 호출할 예산(max_tokens)으로 채우고, 관련 있는 조각이
+        예산 때문에 빠졌을 때만 부분 질의 수(max_map_chunks)만큼 더 담아
+        map-reduce로 넘깁니다. 대부분의 질문은 LLM 한 번 호출로 끝납니다.
+
+        Returns:
+            ContextBuilder.build 결과
+        """
+        if self.answer_mode != "map_reduce":
+            built = self.context_builder.build(query, pages, law_contents)
+            if self.answer_mode == "single" or not built["overflow"]:
+                return built
+            print(
+                f"🧩 관련 조각 {built['overflow']}개가 문맥 예산을 넘어 "
+                "map-reduce용으로 다시 구성합니다."
+            )
+        return self.context_builder.build(
+            query,
+            pages,
+            law_contents,
+            max_tokens=self.context_builder.max_tokens * self.max_map_chunks,
+        )
+
+    def _retrieve_from_corpus(self, query: str) -> Dict[str, Any]:
+        """
+        로컬 코퍼스에서 BM25로 조문을 찾고 참조 조문까지 모아 문맥을 구성합니다.
+
+        검색 API 호출과 크롤링 없이 디스크의 색인만 조회하므로, 참조 조문도
+        코퍼스에 있는 것만 따라갑니다 (깊이/노드 수 한도는 웹 검색과 같음).
+
+        Returns:
+            retrieve와 같은 형태의 결과 (crawled_content는 빈 문자열)
+        """
+        failure = {
+            "success": False,
+            "search_query": query,
+            "crawled_content": "",
+            "extracted_laws": [],
+            "law_contents": [],
+            "llm_answer": None,
+        }
+        if self.law_corpus is None:
+            return {
+                **failure,
+                "error": "로컬 코퍼스가 없습니다. LAW_CORPUS_DIR 환경변수를 확인해주세요.",
+            }
+
+        started_at = time.perf_counter()
+        hits = self.law_corpus.search(query, self.corpus_top_k)
+        if not hits:
+            return {**failure, "error": "코퍼스에서 관련 조문을 찾지 못했습니다."}
+
+        # 검색된 조문이 깊이 0, 참조를 따라 너비 우선으로 확장
+        # (단계별로 펼치므로 조문은 항상 가장 얕은 깊이에서 처음 발견됨)
+        graph = self.new_reference_graph()
+        graph.start()
+        law_contents: List[Dict[str, Any]] = []
+        frontier = [(hit, 0) for hit in hits if graph.visit(hit["original_article"], 0)]
+        while frontier:
+            next_frontier = []
+            for result, depth in frontier:
+                article = result["original_article"]
+                content = result["content"]
+                graph.mark_fetched(article["key"], True)
+                law_contents.append(result)
+                if not graph.can_expand(depth):
+                    continue
+                for ref in self._article_references(article, content):
+                    if not graph.visit(ref, depth + 1, parent=article["key"]):
+                        continue
+                    found = self.law_corpus.get_article(
+                        ref["law_name"], ref["article_num"]
+                    )
+                    if found is None:
+                        # 코퍼스에 없는 법령의 조문
+                        graph.mark_fetched(ref["key"], False)
+                        continue
+                    found["original_article"] = ref
+                    next_frontier.append((found, depth + 1))
+            frontier = next_frontier
+
+        print(
+            f"⚡ 코퍼스 검색: 조문 {len(law_contents)}개 "
+            f"(검색 {len(hits)}개, 참조 그래프 간선 {len(graph.edges)}개, "
+            f"{(time.perf_counter() - started_at) * 1000:.1f}ms)"
+        )
+
+        built = self.build_context(query, [], law_contents)
+        print(
+            f"🧩 문맥 구성: 조각 {len(built['chunks'])}개, {built['tokens']} 토큰 "
+            f"(제외 {built['dropped']}개)"
+        )
+
+        return {
+            "success": True,
+            "search_query": query,
+            "crawled_content": "",
+            "law_contents": law_contents,
+            "reference_graph": graph.to_dict(),
+            "context": built,
+            "answer_mode": None,
+            "llm_answer": None,
         }
 
     def get_law_domains(self) -> List[str]:
@@ -561,6 +1546,18 @@ class LawSearchIntegrated:
             # "klaw.go.kr",  # 한국법제연구원
         ]
 
+    def get_crawl_strategies(self) -> Dict[str, str]:
+        """도메인별 크롤링 방식 반환
+
+        "http": aiohttp + lxml로 바로 추출 (정적 페이지/DRF)
+        "browser": Crawl4AI 헤드리스 브라우저 (자바스크립트 필요)
+        목록에 없는 도메인은 "browser"로 크롤링합니다.
+        """
+        return {
+            "law.go.kr": "http",  # 국가법령정보센터
+            "news.naver.com": "browser",  # 네이버 뉴스
+        }
+
     def get_news_domains(self) -> List[str]:
         """뉴스 관련 도메인 목록 반환"""
         return [
@@ -662,16 +1659,15 @@ async def main():
     print(f"사용자 질문: {user_query}\n")
 
     # 통합 검색 실행
-    searcher = LawSearchIntegrated()
-
-    # 법령 사이트에서 검색
-    law_domains = searcher.get_law_domains()
-    # results = await searcher.crawl_and_extract_laws(user_query, law_domains, 5)
-    results = await searcher.crawl_and_extract_laws(user_query, None, 5)
-
-    # 결과 출력
-    formatted_output = searcher.format_results(results)
-    print(formatted_output)
+    async with LawSearchIntegrated() as searcher:
+        # 법령 사이트에서 검색
+        law_domains = searcher.get_law_domains()
+        # results = await searcher.crawl_and_extract_laws(user_query, law_domains, 5)
+        results = await searcher.crawl_and_extract_laws(user_query, None, 5)
+
+        # 결과 출력
+        formatted_output = searcher.format_results(results)
+        print(formatted_output)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,128 @@
+import re
+import time
+import threading
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterable, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from kiwipiepy import Kiwi
+
+# 검색에 쓰는 품사: 일반/고유명사, 어근, 외국어, 숫자, 동사/형용사 어간
+INDEX_TAGS = frozenset({"NNG", "NNP", "XR", "SL", "SN", "VV", "VA"})
+# 검색 키워드에 쓰는 품사: 일반/고유명사, 어근, 외국어
+KEYWORD_TAGS = frozenset({"NNG", "NNP", "XR", "SL"})
+# 질문에 흔하지만 검색에는 도움이 안 되는 명사
+KEYWORD_STOPWORDS = frozenset(
+    {"경우", "관련", "내용", "방법", "질문", "설명", "정도", "여부", "무엇", "문의"}
+)
+# 조문번호는 형태소로 쪼개지지 않게 통째로 키워드로 사용 (예: 제16조, 제14조의2)
+ARTICLE_PATTERN = re.compile(r"제\s*\d+\s*조(?:\s*의\s*\d+)?")
+
+_kiwi: Optional["Kiwi"] = None
+_kiwi_lock = threading.Lock()
+
+
+def is_kiwi_loaded() -> bool:
+    """Kiwi 모델을 이미 불러왔는지 (아니면 다음 분석이 모델 로딩으로 수 초 걸림)"""
+    return _kiwi is not None
+
+
+def get_kiwi() -> "Kiwi":
+    """프로세스에서 공유하는 Kiwi 인스턴스 (처음 호출할 때 모델을 불러옴)
+
+    kiwipiepy는 이때 import하므로, 형태소 분석을 쓰지 않는 경로(문맥 구성, 테스트 등)는
+    이 모듈을 import해도 kiwipiepy가 필요 없습니다.
+    """
+    global _kiwi
+    if _kiwi is None:
+        with _kiwi_lock:
+            if _kiwi is None:
+                from kiwipiepy import Kiwi
+
+                _kiwi = Kiwi()
+    return _kiwi
+
+
+def _index_terms(tokens) -> List[str]:
+    return [token.form.lower() for token in tokens if token.tag in INDEX_TAGS]
+
+
+def tokenize(text: str) -> List[str]:
+    """검색 색인용 형태소 (명사/어근/외국어/숫자/용언 어간)"""
+    if not text:
+        return []
+    return _index_terms(get_kiwi().tokenize(text))
+
+
+def _keyword_terms(text: str, tokens) -> List[str]:
+    """형태소 분석 결과에서 검색 키워드 추출 (텍스트 순서 유지, 중복 제거)"""
+    terms = [
+        (match.start(), re.sub(r"\s+", "", match.group()))
+        for match in ARTICLE_PATTERN.finditer(text)
+    ]
+    # 띄어쓰기 없이 붙은 명사는 하나의 용어로 합침 (예: 건축+법 -> 건축법, 용적+률 -> 용적률)
+    compound: List[str] = []
+    start = end = 0
+    for token in tokens:
+        if token.tag not in KEYWORD_TAGS:
+            if compound:
+                terms.append((start, "".join(compound)))
+                compound = []
+            continue
+        if compound and token.start == end:
+            compound.append(token.form)
+        else:
+            if compound:
+                terms.append((start, "".join(compound)))
+            compound = [token.form]
+            start = token.start
+        end = token.start + token.len
+    if compound:
+        terms.append((start, "".join(compound)))
+
+    keywords: List[str] = []
+    for _, term in sorted(terms, key=lambda item: item[0]):
+        term = term.lower()
+        # 한 글자 명사는 대부분 의미가 약함 ("법", "등")
+        if len(term) < 2 or term in KEYWORD_STOPWORDS or term in keywords:
+            continue
+        keywords.append(term)
+    return keywords
+
+
+@lru_cache(maxsize=4096)
+def _cached_keyword_terms(text: str) -> Tuple[str, ...]:
+    return tuple(_keyword_terms(text, get_kiwi().tokenize(text)))
+
+
+def extract_keyword_terms(text: str) -> List[str]:
+    """질문의 검색 키워드 (명사/복합명사, 어근, 외국어, 조문번호)"""
+    if not text:
+        return []
+    return list(_cached_keyword_terms(text))
+
+
+def extract_keyword_terms_batch(texts: Iterable[str]) -> List[List[str]]:
+    """여러 질문의 검색 키워드를 한 번의 형태소 분석 호출로 추출 (입력 순서 유지)"""
+    texts = list(texts)
+    if not texts:
+        return []
+    return [
+        _keyword_terms(text, tokens)
+        for text, tokens in zip(texts, get_kiwi().tokenize(texts))
+    ]
+
+
+def warm_up():
+    """Kiwi 모델을 미리 불러옴 (첫 질문에서 모델 로딩 시간을 기다리지 않도록)"""
+    started_at = time.perf_counter()
+    get_kiwi().tokenize("법령 검색 준비")
+    print(f"🔤 형태소 분석기 준비 완료 ({time.perf_counter() - started_at:.2f}초)")
+
+
+def tokenize_batch(texts: Iterable[str]) -> List[List[str]]:
+    """여러 텍스트를 한 번의 호출로 형태소 분석 (입력 순서 유지)"""
+    texts = list(texts)
+    if not texts:
+        return []
+    return [_index_terms(tokens) for tokens in get_kiwi().tokenize(texts)]
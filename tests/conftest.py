@@ -0,0 +1,22 @@
+import pytest
+
+
+@pytest.fixture
+def estimate_tokens():
+    """tiktoken 인코딩 다운로드 없이 항상 같은 결과가 나오는 토큰 수 추정"""
+    return lambda text: (len(text.encode("utf-8")) + 2) // 3
+
+
+@pytest.fixture(autouse=True)
+def offline_env(monkeypatch):
+    # 로컬 .env / 캐시 / 색인 설정이 테스트에 섞이지 않도록
+    for name in (
+        "LAW_CACHE_DIR",
+        "LAW_CORPUS_DIR",
+        "LAW_REFERENCE_INDEX_PATH",
+        "LAW_NAMES_PATH",
+        "MAX_CONTEXT_LENGTH",
+        "MAX_CHUNKS_PER_QUESTION",
+        "RETRIEVAL_SOURCE",
+    ):
+        monkeypatch.delenv(name, raising=False)
@@ -0,0 +1,77 @@
+import time
+
+import pytest
+
+import law_article_extractor
+from law_article_extractor import (
+    extract_all_articles_with_references,
+    extract_all_articles_with_references_batch,
+    extract_law_articles,
+    extract_law_articles_batch,
+)
+from law_name_dictionary import LawNameDictionary
+
+
+def test_extracts_law_articles():
+    text = "건축법 제16조에 따라 허가를 받은 자는, 같은 법 시행령 제27조를 본다."
+    articles = extract_law_articles(text)
+    assert [(a["law_name"], a["article_num"]) for a in articles] == [
+        ("건축법", "16"),
+        ("같은 법 시행령", "27"),
+    ]
+
+
+def test_long_text_without_punctuation_is_linear():
+    # 메뉴/표처럼 문장부호 없이 한글과 공백만 이어지는 텍스트 (약 200KB)
+    words = ["메뉴", "홈", "소개", "민원", "안내", "정보공개", "건축", "허가", "자료실"]
+    block = "\n".join(words[i % len(words)] for i in range(20000))
+    text = f"{block}\n건축법 제16조\n{block}"
+
+    started_at = time.perf_counter()
+    articles = extract_law_articles(text)
+    elapsed = time.perf_counter() - started_at
+
+    # 법령명 길이 제한이 없으면 수십 초 이상 걸림
+    assert elapsed < 5
+    assert [(a["law_name"], a["article_num"]) for a in articles] == [("건축법", "16")]
+
+
+def keys(articles):
+    return [a["key"] for a in articles]
+
+
+def test_batch_keeps_input_order_across_processes():
+    texts = [f"건축법 제{i}조에 따라" for i in range(1, 41)]
+    law_names = LawNameDictionary(["건축법"])
+
+    results = extract_law_articles_batch(
+        texts, law_names, max_workers=2, chunksize=3, min_batch_size=1
+    )
+
+    assert [keys(r) for r in results] == [[f"건축법_{i}"] for i in range(1, 41)]
+
+
+def test_small_batch_runs_in_process_without_touching_worker_state(monkeypatch):
+    def no_pool(*args, **kwargs):
+        raise AssertionError("적은 입력에는 프로세스 풀을 쓰지 않아야 함")
+
+    monkeypatch.setattr(law_article_extractor, "ProcessPoolExecutor", no_pool)
+    law_names = LawNameDictionary(["주택법"])
+    texts = ["주택법 제5조 및 건축법 제11조", "법 제3조를 준용"]
+
+    direct = extract_law_articles_batch(texts, law_names)
+    combined = extract_all_articles_with_references_batch(texts, "주택법", law_names)
+
+    # 사전 모드이므로 사전에 없는 건축법은 인식하지 않음
+    assert [keys(r) for r in direct] == [["주택법_5"], []]
+    assert combined == [
+        extract_all_articles_with_references(text, "주택법", law_names)
+        for text in texts
+    ]
+    # 현재 프로세스에서 처리할 때는 작업자용 전역 사전을 바꾸지 않음
+    assert law_article_extractor._worker_law_names is None
+
+
+def test_batch_rejects_mismatched_current_law_names():
+    with pytest.raises(ValueError):
+        extract_all_articles_with_references_batch(["a", "b"], ["건축법"])
@@ -0,0 +1,67 @@
+import asyncio
+import json
+
+import pytest
+
+from law_batch import run_batch
+
+
+class StubSearcher:
+    """LawSearchIntegrated 대역: 질문을 그대로 답변으로 돌려줌"""
+
+    def __init__(self):
+        self.questions = []
+
+    async def start(self):
+        pass
+
+    async def close(self):
+        pass
+
+    def cache_stats(self):
+        return {}
+
+    async def crawl_and_extract_laws(self, query, domains=None, num_results=5):
+        self.questions.append(query)
+        return {"success": True, "llm_answer": query}
+
+
+def write_questions(path, count):
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(count):
+            f.write(json.dumps({"id": f"q{i}", "question": f"질문 {i}"}) + "\n")
+
+
+@pytest.mark.parametrize("workers", [0, -1])
+def test_rejects_non_positive_workers(tmp_path, workers):
+    write_questions(tmp_path / "questions.jsonl", 1)
+    with pytest.raises(ValueError):
+        asyncio.run(
+            run_batch(
+                str(tmp_path / "questions.jsonl"),
+                str(tmp_path / "results.jsonl"),
+                workers=workers,
+                searcher=StubSearcher(),
+            )
+        )
+
+
+def test_resumes_after_interruption(tmp_path):
+    questions = tmp_path / "questions.jsonl"
+    results = tmp_path / "results.jsonl"
+    write_questions(questions, 5)
+    # 앞의 두 질문은 끝났고 세 번째 줄은 쓰다가 중단된 상태
+    results.write_text(
+        '{"id": "q0", "success": true}\n{"id": "q1", "success": true}\n{"id": "q2"',
+        encoding="utf-8",
+    )
+
+    searcher = StubSearcher()
+    stats = asyncio.run(
+        run_batch(str(questions), str(results), workers=2, searcher=searcher)
+    )
+
+    assert stats == {"total": 5, "skipped": 2, "succeeded": 3, "failed": 0}
+    assert sorted(searcher.questions) == ["질문 2", "질문 3", "질문 4"]
+    records = [json.loads(line) for line in results.read_text().splitlines()]
+    assert sorted(r["id"] for r in records) == ["q0", "q1", "q2", "q3", "q4"]
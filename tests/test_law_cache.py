@@ -0,0 +1,93 @@
+import asyncio
+
+from law_cache import MISSING, LRUCache, SQLiteCache, TieredCache
+
+
+def stored_bytes(cache: SQLiteCache) -> int:
+    return cache._sum_size()
+
+
+def test_sqlite_byte_cap_evicts_least_recently_used(tmp_path):
+    cache = SQLiteCache(str(tmp_path / "pages.sqlite3"), max_bytes=1000)
+    for i in range(10):
+        cache.set(f"page{i}", "가" * 100)
+
+    # 가장 최근 항목은 남고 오래된 항목부터 제거됨
+    assert cache.get("page9") is not MISSING
+    assert cache.get("page0") is MISSING
+    assert stored_bytes(cache) <= cache.max_bytes
+    assert cache.total_bytes == stored_bytes(cache)
+
+
+def test_sqlite_total_bytes_tracks_writes_and_deletes(tmp_path):
+    path = str(tmp_path / "pages.sqlite3")
+    cache = SQLiteCache(path, max_bytes=10**6)
+    cache.set("law:1", "가" * 100)
+    cache.set("law:2", "나" * 50)
+    cache.set("law:1", "다" * 10)  # 같은 key를 덮어쓰면 이전 크기를 뺌
+    cache.set("other", "라")
+    assert cache.total_bytes == stored_bytes(cache)
+
+    cache.delete_prefix("law:")
+    assert cache.total_bytes == stored_bytes(cache)
+    cache.delete("other")
+    assert cache.total_bytes == 0
+
+    cache.set("law:3", "마" * 20)
+    cache.close()
+    # 다시 열면 파일에 저장된 크기로 시작
+    reopened = SQLiteCache(path, max_bytes=10**6)
+    assert reopened.total_bytes == stored_bytes(reopened) > 0
+    reopened.clear()
+    assert reopened.total_bytes == 0
+
+
+def accessed_at(cache: SQLiteCache, key: str) -> float:
+    return cache._conn.execute(
+        f"SELECT accessed_at FROM {cache.table} WHERE key = ?", (key,)
+    ).fetchone()[0]
+
+
+def test_sqlite_reads_touch_accessed_at_only_after_interval(tmp_path):
+    cache = SQLiteCache(str(tmp_path / "law_ids.sqlite3"), touch_interval=3600)
+    cache.set("건축법", "001823")
+    written_at = accessed_at(cache, "건축법")
+
+    # 간격 안의 읽기는 쓰기(UPDATE + 커밋)를 만들지 않음
+    changes = cache._conn.total_changes
+    assert cache.get("건축법") == "001823"
+    assert cache._conn.total_changes == changes
+    assert accessed_at(cache, "건축법") == written_at
+
+    cache.touch_interval = 0
+    assert cache.get("건축법") == "001823"
+    assert accessed_at(cache, "건축법") > written_at
+
+
+def test_sqlite_uses_wal(tmp_path):
+    cache = SQLiteCache(str(tmp_path / "law_ids.sqlite3"))
+    assert cache._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_tiered_async_get_reads_disk_off_loop_and_promotes(tmp_path):
+    path = str(tmp_path / "articles.sqlite3")
+    SQLiteCache(path, table="articles").set(
+        "001823:001100:current", {"title": "제11조"}
+    )
+    cache = TieredCache(LRUCache(), SQLiteCache(path, table="articles"))
+
+    async def run():
+        await cache.aset("001823:001200:current", {"title": "제12조"})
+        return (
+            await cache.aget("001823:001100:current"),
+            await cache.aget("001823:001300:current"),
+        )
+
+    found, missing = asyncio.run(run())
+
+    assert found == {"title": "제11조"}
+    assert missing is MISSING
+    assert cache.memory.get("001823:001100:current") == {"title": "제11조"}
+    assert cache.disk.get("001823:001200:current") == {"title": "제12조"}
+    assert cache.stats()["disk_hits"] == 1
+    assert cache.stats()["misses"] == 1
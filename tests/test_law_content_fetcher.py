@@ -0,0 +1,156 @@
+import asyncio
+
+from law_content_fetcher import LawContentFetcher
+
+
+def make_article(num: int):
+    return {"law_name": "건축법", "article_num": str(num), "key": f"건축법_{num}"}
+
+
+class StubLookups:
+    """_fetch_law_article_content 대역: 시작/완료/취소된 조회를 기록"""
+
+    def __init__(self, delay: float = 0.01):
+        self.delay = delay
+        self.started = []
+        self.finished = []
+        self.cancelled = []
+
+    async def __call__(self, law_name, article_num, ef_yd):
+        self.started.append(article_num)
+        try:
+            await asyncio.sleep(self.delay * int(article_num))
+        except asyncio.CancelledError:
+            self.cancelled.append(article_num)
+            raise
+        self.finished.append(article_num)
+        return {"law_name": law_name, "article_num": article_num, "success": True}
+
+
+def make_fetcher(lookups: StubLookups) -> LawContentFetcher:
+    fetcher = LawContentFetcher(bulk_threshold=None)
+    fetcher._fetch_law_article_content = lookups
+    return fetcher
+
+
+def test_iter_cancels_remaining_lookups_when_consumer_stops():
+    lookups = StubLookups()
+    fetcher = make_fetcher(lookups)
+
+    async def run():
+        results = fetcher.iter_law_articles_content(
+            [make_article(i) for i in range(1, 6)]
+        )
+        first = await anext(results)
+        await results.aclose()
+        # 취소되지 않은 조회가 있으면 이 동안 끝남
+        await asyncio.sleep(0.1)
+        return first
+
+    first = asyncio.run(run())
+
+    assert first["original_article"]["key"] == "건축법_1"
+    assert lookups.finished == ["1"]
+    assert sorted(lookups.cancelled) == ["2", "3", "4", "5"]
+
+
+def test_iter_cancels_remaining_lookups_when_consumer_is_cancelled():
+    lookups = StubLookups()
+    fetcher = make_fetcher(lookups)
+
+    async def consume():
+        async for _ in fetcher.iter_law_articles_content(
+            [make_article(i) for i in range(1, 6)]
+        ):
+            pass
+
+    async def run():
+        consumer = asyncio.create_task(consume())
+        await asyncio.sleep(0.015)
+        consumer.cancel()
+        await asyncio.sleep(0.1)
+
+    asyncio.run(run())
+
+    assert lookups.finished == ["1"]
+    assert sorted(lookups.cancelled) == ["2", "3", "4", "5"]
+
+
+def test_single_flight_shares_one_call_between_concurrent_callers():
+    lookups = StubLookups()
+    fetcher = make_fetcher(lookups)
+
+    async def run():
+        return await asyncio.gather(
+            *(fetcher.get_law_article_content("건축법", "11") for _ in range(3)),
+            fetcher.get_law_article_content("건축법", "12"),
+        )
+
+    results = asyncio.run(run())
+
+    assert sorted(lookups.started) == ["11", "12"]
+    assert results[0] is results[1] is results[2]
+    assert not fetcher._inflight
+
+
+def test_single_flight_survives_one_cancelled_caller():
+    lookups = StubLookups()
+    fetcher = make_fetcher(lookups)
+
+    async def run():
+        first = asyncio.create_task(fetcher.get_law_article_content("건축법", "3"))
+        second = asyncio.create_task(fetcher.get_law_article_content("건축법", "3"))
+        await asyncio.sleep(0.005)
+        first.cancel()
+        return await second, first
+
+    result, first = asyncio.run(run())
+
+    assert first.cancelled()
+    assert result["success"]
+    # 공유 조회는 한 번만, 취소되지 않고 끝까지 진행
+    assert lookups.started == ["3"]
+    assert lookups.finished == ["3"]
+    assert lookups.cancelled == []
+
+
+def test_single_flight_cancels_shared_call_when_every_caller_leaves():
+    lookups = StubLookups()
+    fetcher = make_fetcher(lookups)
+
+    async def run():
+        callers = [
+            asyncio.create_task(fetcher.get_law_article_content("건축법", "3"))
+            for _ in range(2)
+        ]
+        await asyncio.sleep(0.005)
+        for caller in callers:
+            caller.cancel()
+        await asyncio.sleep(0.05)
+
+    asyncio.run(run())
+
+    assert lookups.cancelled == ["3"]
+    assert lookups.finished == []
+    assert not fetcher._inflight
+
+
+def test_law_id_lookup_is_coalesced_and_cached(monkeypatch):
+    fetcher = LawContentFetcher(bulk_threshold=None)
+    searches = []
+
+    async def search_law_id(law_name):
+        searches.append(law_name)
+        await asyncio.sleep(0.01)
+        return "001823"
+
+    monkeypatch.setattr(fetcher, "_search_law_id", search_law_id)
+
+    async def run():
+        ids = await asyncio.gather(
+            fetcher._get_law_id("건축법"), fetcher._get_law_id(" 건축법 ")
+        )
+        return ids + [await fetcher._get_law_id("건축법")]
+
+    assert asyncio.run(run()) == ["001823"] * 3
+    assert searches == ["건축법"]
@@ -0,0 +1,45 @@
+import pytest
+
+from law_context_builder import ContextBuilder
+
+
+@pytest.fixture
+def make_builder(estimate_tokens):
+    def make(**kwargs) -> ContextBuilder:
+        builder = ContextBuilder(**kwargs)
+        builder.count_tokens = estimate_tokens
+        return builder
+
+    return make
+
+
+def test_long_line_is_split_into_packable_passages(make_builder):
+    builder = make_builder(max_tokens=1000, passage_tokens=100)
+    # 문장부호 없이 한 줄로 이어진 긴 텍스트 (약 1000토큰)
+    line = "건축허가대상건축물" * 111
+
+    passages = builder.split_passages(line)
+
+    assert len(passages) > 1
+    assert all(builder.count_tokens(p) <= builder.passage_tokens for p in passages)
+    assert "".join(passages) == line
+
+    built = builder.build("건축허가", [("https://example.com", line)], [])
+    assert built["chunks"]
+    assert built["tokens"] <= builder.max_tokens
+
+
+def test_split_groups_respects_max_groups(make_builder):
+    builder = make_builder(max_tokens=8000)
+    chunks = [
+        {"header": f"--- {i} ---", "text": f"조각 {i}", "tokens": 401}
+        for i in range(99)
+    ]
+
+    assert len(builder.split_groups(chunks, 8000)) == 6
+
+    groups = builder.split_groups(chunks, 8000, max_groups=5)
+    assert len(groups) == 5
+    # 관련도가 높은 앞쪽 조각이 남고 뒤쪽 조각이 빠짐
+    assert "조각 0\n" in groups[0] + "\n"
+    assert "조각 98" not in "".join(groups)
@@ -0,0 +1,149 @@
+import asyncio
+import json
+import re
+
+import pytest
+
+from law_corpus import LawCorpus, build_law_corpus, load_law_corpus
+from law_search_integrated import LawSearchIntegrated
+
+LAWS = {
+    "건축법": {
+        "law_id": "001823",
+        "law_name": "건축법",
+        "articles": {
+            "000100": {
+                "title": "목적",
+                "content": "이 법은 건축물의 대지 구조 설비 기준 및 용도를 정한다.",
+            },
+            "001100": {
+                "title": "건축허가",
+                "content": "건축물 건축 시 허가 필요. 허가 사항 변경은 법 제16조에 따른다.",
+            },
+            "001600": {
+                "title": "허가와 신고사항의 변경",
+                "content": "허가 사항 변경 시 변경 허가 필요. 허가 취소 가능.",
+            },
+            "001602": {
+                "title": "건축물 안전영향평가",
+                "content": "안전영향평가를 실시한다.",
+            },
+        },
+    },
+    "주택법": {
+        "law_id": "009999",
+        "law_name": "주택법",
+        "articles": {
+            "001500": {"title": "사업계획의 승인", "content": "주택건설사업 계획 승인."}
+        },
+    },
+}
+
+
+def tokenize(text):
+    return re.findall(r"[가-힣A-Za-z0-9]+", text)
+
+
+def tokenize_batch(texts):
+    return [tokenize(text) for text in texts]
+
+
+class StubFetcher:
+    """LawContentFetcher 대역: 정해진 법령 전문을 돌려줌 (없는 법령은 None)"""
+
+    async def get_law_articles(self, law_name):
+        return LAWS.get(law_name)
+
+
+@pytest.fixture
+def corpus_dir(tmp_path):
+    path = str(tmp_path / "corpus")
+    built = asyncio.run(
+        build_law_corpus(
+            StubFetcher(), ["건축법", "주택법", "없는법"], path, tokenize_batch
+        )
+    )
+    built.close()
+    return path
+
+
+@pytest.fixture
+def corpus(corpus_dir):
+    corpus = LawCorpus(corpus_dir, tokenize=tokenize)
+    yield corpus
+    corpus.close()
+
+
+def test_build_then_load_round_trip(corpus_dir, corpus):
+    with open(f"{corpus_dir}/{LawCorpus.INDEX_FILE}", encoding="utf-8") as f:
+        index = json.load(f)
+
+    assert index["version"] == LawCorpus.VERSION
+    # 전문을 가져오지 못한 법령은 빠짐
+    assert corpus.laws == ["건축법", "주택법"]
+    assert len(corpus) == 5
+
+    article = corpus.get_article("건축법", "11")
+    assert article["original_article"]["key"] == "건축법_11"
+    assert article["content"]["jo_num"] == "001100"
+    assert article["content"]["content"]["title"] == "건축허가"
+    # 가지 조문 번호 (001602 -> 16의2)
+    assert corpus.get_article("건축법", "16의2")["content"]["jo_num"] == "001602"
+    assert corpus.get_article("건축법", "99") is None
+
+
+def test_bm25_ranks_by_term_frequency_and_length(corpus):
+    hits = corpus.search("허가", top_k=3)
+
+    keys = [hit["original_article"]["key"] for hit in hits]
+    scores = [hit["score"] for hit in hits]
+    # "허가"가 가장 많이 나오는 제16조, 그다음 제11조
+    assert keys == ["건축법_16", "건축법_11"]
+    assert scores == sorted(scores, reverse=True)
+    assert all(score > 0 for score in scores)
+
+
+def test_bm25_top_k_and_unknown_terms(corpus):
+    assert len(corpus.search("건축물 허가 주택", top_k=2)) == 2
+    assert corpus.search("존재하지않는단어") == []
+
+
+def test_empty_corpus(tmp_path):
+    path = str(tmp_path / "empty")
+    asyncio.run(build_law_corpus(StubFetcher(), [], path, tokenize_batch)).close()
+
+    corpus = LawCorpus(path, tokenize=tokenize)
+    assert len(corpus) == 0
+    assert corpus.search("허가") == []
+    corpus.close()
+
+
+def test_load_law_corpus_without_directory(tmp_path):
+    assert load_law_corpus(str(tmp_path / "missing")) is None
+
+
+def test_retrieve_from_corpus_follows_references(corpus, estimate_tokens):
+    searcher = LawSearchIntegrated(retrieval_source="corpus", corpus_top_k=1)
+    searcher.law_corpus = corpus
+    searcher.context_builder.count_tokens = estimate_tokens
+
+    results = searcher._retrieve_from_corpus("건축 허가 필요")
+
+    assert results["success"]
+    keys = [r["original_article"]["key"] for r in results["law_contents"]]
+    # BM25로 찾은 제11조(깊이 0)와 그 조문이 참조하는 제16조(깊이 1)
+    assert keys == ["건축법_11", "건축법_16"]
+    graph = results["reference_graph"]
+    assert {"from": "건축법_11", "to": "건축법_16"} in graph["edges"]
+    assert [node["depth"] for node in graph["nodes"]] == [0, 1]
+    assert "허가" in results["context"]["context"]
+
+
+def test_retrieve_from_corpus_without_corpus_or_hits(corpus):
+    searcher = LawSearchIntegrated(retrieval_source="corpus")
+    assert not searcher._retrieve_from_corpus("건축허가")["success"]
+
+    searcher.law_corpus = corpus
+    results = searcher._retrieve_from_corpus("존재하지않는단어")
+    assert not results["success"]
+    assert results["error"]
@@ -0,0 +1,68 @@
+from law_article_extractor import extract_law_articles
+from law_name_dictionary import LawNameDictionary, load_law_name_dictionary
+
+LAW_NAMES = LawNameDictionary(
+    ["건축법", "건축법 시행령", "건축물관리법", "주택법", "헌법"]
+)
+
+
+def pairs(text: str):
+    return [
+        (a["law_name"], a["article_num"]) for a in extract_law_articles(text, LAW_NAMES)
+    ]
+
+
+def walk(law_names: LawNameDictionary, text: str):
+    state = 0
+    for char in text:
+        state = law_names.step(state, char)
+    return law_names.longest_match(state)
+
+
+def test_longest_official_name_wins_with_or_without_spaces():
+    assert pairs("건축법시행령 제3조") == [("건축법 시행령", "3")]
+    assert pairs("건축법 시행령 제3조와 건축법 제11조") == [
+        ("건축법 시행령", "3"),
+        ("건축법", "11"),
+    ]
+    assert pairs("건축물 관리법 제12조") == [("건축물관리법", "12")]
+
+
+def test_name_inside_longer_word_is_rejected():
+    assert pairs("도시건축법 제2조") == []
+    # 실패 링크로 "헌법"까지 가도 앞 글자가 한글이면 무시
+    assert pairs("건축헌법 제1조") == []
+    assert pairs("건축 헌법 제1조") == [("헌법", "1")]
+
+
+def test_fail_link_recovers_after_partial_longer_name():
+    # "건축물"까지 "건축물관리법"을 따라가다 "건"에서 실패 링크로 돌아감
+    assert pairs("건축물 건축법 제5조") == [("건축법", "5")]
+
+
+def test_quoted_name_and_bracket_notes():
+    assert pairs("「주택법」제5조") == [("주택법", "5")]
+    assert pairs("주택법 [시행 2024. 1. 1.] 제5조") == [("주택법", "5")]
+
+
+def test_longest_match_is_inherited_through_fail_link():
+    law_names = LawNameDictionary(["가나다라", "나다"])
+    assert walk(law_names, "가나다") == (2, "나다")
+    assert walk(law_names, "가나다라") == (4, "가나다라")
+    assert walk(law_names, "가나") is None
+
+
+def test_names_are_normalized_and_counted_once():
+    law_names = LawNameDictionary(["건축법  시행령", "건축법 시행령", " ", ""])
+    assert len(law_names) == 1
+    assert walk(law_names, "건축법시행령") == (6, "건축법 시행령")
+
+
+def test_load_from_file(tmp_path):
+    path = tmp_path / "law_names.txt"
+    path.write_text("건축법\n\n주택법\n", encoding="utf-8")
+
+    law_names = load_law_name_dictionary(str(path))
+
+    assert len(law_names) == 2
+    assert load_law_name_dictionary(str(tmp_path / "missing.txt")) is None
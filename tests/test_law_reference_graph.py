@@ -0,0 +1,83 @@
+import time
+
+from law_reference_graph import ReferenceGraph
+
+
+def article(num: int):
+    return {"law_name": "건축법", "article_num": str(num), "key": f"건축법_{num}"}
+
+
+def test_cycle_is_visited_once_and_records_back_edge():
+    graph = ReferenceGraph(max_depth=5)
+
+    assert graph.visit(article(1), 0) == [article(1)]
+    assert graph.visit(article(2), 1, parent="건축법_1") == [article(2)]
+    # 제2조 -> 제1조 순환: 다시 조회하지 않고 간선만 기록
+    assert graph.visit(article(1), 2, parent="건축법_2") == []
+
+    assert len(graph) == 2
+    assert graph.edges == [("건축법_1", "건축법_2"), ("건축법_2", "건축법_1")]
+    assert graph.depth("건축법_1") == 0
+
+
+def test_depth_limit():
+    graph = ReferenceGraph(max_depth=1)
+
+    assert graph.can_expand(0)
+    assert not graph.can_expand(1)
+    assert graph.visit(article(1), 0)
+    assert graph.visit(article(2), 1, parent="건축법_1")
+    assert graph.visit(article(3), 2, parent="건축법_2") == []
+    assert "건축법_3" not in graph
+    assert graph.truncated
+
+
+def test_node_cap():
+    graph = ReferenceGraph(max_nodes=2)
+
+    assert graph.visit(article(1), 0)
+    assert graph.visit(article(2), 0)
+    assert graph.visit(article(3), 0) == []
+    assert len(graph) == 2
+    assert graph.truncated
+
+
+def test_time_budget_stops_references_but_not_page_articles():
+    graph = ReferenceGraph(time_budget=0)
+    graph.start()
+    time.sleep(0.001)
+
+    assert graph.expired()
+    # 페이지에서 직접 찾은 조문(깊이 0)은 시간 제한과 관계없이 추가
+    assert graph.visit(article(1), 0)
+    assert graph.visit(article(2), 1, parent="건축법_1") == []
+    assert graph.truncated
+
+
+def test_shallower_discovery_expands_fetched_article():
+    graph = ReferenceGraph(max_depth=1)
+    # 제1조(깊이 0) -> 제3조(깊이 1)로 먼저 발견되어 조회됨
+    graph.visit(article(1), 0)
+    graph.mark_fetched("건축법_1", True, [article(3)])
+    assert graph.expand("건축법_1") == [article(3)]
+    graph.mark_fetched("건축법_3", True, [article(5)])
+    # 깊이 1에서는 제3조의 참조(제5조)를 따라가지 않음
+    assert graph.expand("건축법_3") == []
+
+    # 다른 페이지에서 제3조를 직접 찾으면 깊이 0으로 낮아지고 참조를 따라감
+    assert graph.visit(article(3), 0) == [article(5)]
+    assert graph.depth("건축법_3") == 0
+    assert graph.depth("건축법_5") == 1
+    assert ("건축법_3", "건축법_5") in graph.edges
+
+
+def test_shallower_discovery_before_fetch_only_lowers_depth():
+    graph = ReferenceGraph(max_depth=1)
+    graph.visit(article(1), 0)
+    graph.visit(article(3), 1, parent="건축법_1")
+
+    # 아직 조회 중이면 깊이만 낮추고, 조회가 끝난 뒤 expand가 낮아진 깊이로 따라감
+    assert graph.visit(article(3), 0) == []
+    graph.mark_fetched("건축법_3", True, [article(5)])
+    assert graph.expand("건축법_3") == [article(5)]
+    assert graph.depth("건축법_5") == 1
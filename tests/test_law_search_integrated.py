@@ -0,0 +1,329 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from law_search_integrated import LawSearchIntegrated
+
+
+class StubStream:
+    """AsyncStream 대역: 답변을 글자 단위 조각으로 나눠 보냄"""
+
+    def __init__(self, content: str):
+        self.content = content
+        self.closed = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self.closed = True
+
+    async def __aiter__(self):
+        for char in self.content:
+            await asyncio.sleep(0)
+            delta = SimpleNamespace(content=char)
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=delta)])
+
+
+class StubLLMClient:
+    """AsyncOpenAI 대역: 호출된 프롬프트를 기록하고 정해진 답변을 돌려줌"""
+
+    def __init__(self):
+        self.prompts = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    async def create(self, stream=False, **kwargs):
+        prompt = kwargs["messages"][-1]["content"]
+        self.prompts.append(prompt)
+        if "[부분 답변]" in prompt:
+            content = f"부분 답변 내용 {len(self.map_prompts)}"
+        elif "[부분 답변 1]" in prompt:
+            content = "통합 답변"
+        else:
+            content = "단일 답변"
+        if stream:
+            return StubStream(content)
+        message = SimpleNamespace(content=content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+    @property
+    def map_prompts(self):
+        return [p for p in self.prompts if "[부분 답변]" in p]
+
+    @property
+    def reduce_prompts(self):
+        return [p for p in self.prompts if "[부분 답변 1]" in p]
+
+
+def make_article(num: int, text: str):
+    return {
+        "original_article": {
+            "law_name": "건축법",
+            "article_num": str(num),
+            "key": f"건축법_{num}",
+        },
+        "content": {
+            "law_name": "건축법",
+            "article_num": str(num),
+            "content": {"content": text},
+            "success": True,
+        },
+    }
+
+
+@pytest.fixture
+def searcher(estimate_tokens):
+    client = StubLLMClient()
+    searcher = LawSearchIntegrated(
+        max_context_tokens=1000, max_map_chunks=3, llm_client=client
+    )
+    searcher.context_builder.count_tokens = estimate_tokens
+    return searcher
+
+
+def test_auto_mode_answers_in_one_call_when_context_fits(searcher):
+    articles = [make_article(i, f"건축허가 요건 {i}항") for i in range(1, 4)]
+    built = searcher.build_context("건축허가 요건", [], articles)
+
+    assert built["overflow"] == 0
+    assert searcher.select_answer_mode(built) == "single"
+    assert asyncio.run(searcher.generate_answer("건축허가 요건", built)) == "단일 답변"
+    assert len(searcher.openai_client.prompts) == 1
+
+
+def test_auto_mode_uses_bounded_map_reduce_when_context_overflows(searcher):
+    # 조문 하나가 약 300토큰 -> 20개는 한 번 호출 예산(1000)을 크게 넘음
+    articles = [
+        make_article(i, f"제{i}조 건축허가 요건 " + "가" * 880) for i in range(1, 21)
+    ]
+    built = searcher.build_context("건축허가 요건", [], articles)
+
+    assert built["overflow"] > 0
+    assert searcher.select_answer_mode(built) == "map_reduce"
+    answer = asyncio.run(searcher.generate_answer("건축허가 요건", built))
+
+    client = searcher.openai_client
+    assert answer == "통합 답변"
+    # 부분 질의는 max_map_chunks개를 넘지 않고, 통합 호출은 한 번
+    assert len(client.map_prompts) == searcher.max_map_chunks
+    assert len(client.reduce_prompts) == 1
+    assert len(client.prompts) == searcher.max_map_chunks + 1
+    # 통합 프롬프트에 모든 부분 답변이 들어감
+    for i in range(1, searcher.max_map_chunks + 1):
+        assert f"부분 답변 내용 {i}" in client.reduce_prompts[0]
+
+
+def test_reference_depth_does_not_depend_on_fetch_order(searcher, monkeypatch):
+    # u1은 빨리 끝나고 제1조 -> 제3조 -> 제5조로 이어짐, u2는 늦게 제3조를 직접 인용
+    pages = {"u1": (0, "건축법 제1조에 따라"), "u2": (0.05, "건축법 제3조에 따라")}
+    references = {"1": "법 제3조에 따른 허가", "3": "법 제5조를 준용한다", "5": ""}
+
+    async def crawl_url(url, index, total):
+        delay, text = pages[url]
+        await asyncio.sleep(delay)
+        return text
+
+    async def iter_law_articles_content(articles, semaphore=None):
+        for article in articles:
+            num = article["article_num"]
+            content = {
+                "law_name": "건축법",
+                "article_num": num,
+                "content": {"content": references[num]},
+                "success": True,
+            }
+            yield {"original_article": article, "content": content}
+
+    monkeypatch.setattr(searcher, "_crawl_url", crawl_url)
+    monkeypatch.setattr(
+        searcher.law_fetcher, "iter_law_articles_content", iter_law_articles_content
+    )
+    searcher.max_reference_depth = 1
+    graph = searcher.new_reference_graph()
+
+    async def collect():
+        return [
+            event
+            async for event in searcher.stream_law_contents(
+                "건축허가", ["u1", "u2"], graph
+            )
+            if event["type"] == "article"
+        ]
+
+    events = asyncio.run(collect())
+
+    assert graph.depth("건축법_3") == 0
+    # 제3조가 깊이 0이므로 그 참조(제5조)도 깊이 1로 조회됨
+    assert graph.depth("건축법_5") == 1
+    assert sorted(e["result"]["original_article"]["key"] for e in events) == [
+        "건축법_1",
+        "건축법_3",
+        "건축법_5",
+    ]
+
+
+def test_http_fallback_to_browser_waits_for_host_once(searcher, monkeypatch):
+    waits = []
+
+    async def wait_for_host(url):
+        waits.append(url)
+
+    async def fetch_static_page(url, cached=None):
+        # 본문이 짧아 브라우저로 다시 시도하는 경우
+        return None
+
+    async def crawl_with_browser(url, wait_for_host=True):
+        if wait_for_host:
+            await searcher._wait_for_host(url)
+        return searcher._page_entry("브라우저로 받은 본문", {})
+
+    monkeypatch.setattr(searcher, "_wait_for_host", wait_for_host)
+    monkeypatch.setattr(searcher, "_fetch_static_page", fetch_static_page)
+    monkeypatch.setattr(searcher, "_crawl_with_browser", crawl_with_browser)
+    url = "https://www.law.go.kr/법령/건축법"
+
+    text = asyncio.run(searcher._crawl_url(url, 1, 1))
+
+    assert text == "브라우저로 받은 본문"
+    assert waits == [url]
+
+
+def test_stream_answer_yields_tokens_and_caches_full_answer(searcher):
+    built = searcher.build_context("건축허가 요건", [], [make_article(1, "허가 요건")])
+
+    async def collect():
+        return [
+            token
+            async for token in searcher.stream_generated_answer("건축허가 요건", built)
+        ]
+
+    tokens = asyncio.run(collect())
+
+    assert len(tokens) > 1
+    assert "".join(tokens) == "단일 답변"
+    # 끝까지 받은 답변은 캐시되어 다음 호출은 LLM을 부르지 않음
+    assert asyncio.run(collect()) == ["단일 답변"]
+    assert len(searcher.openai_client.prompts) == 1
+
+
+def test_abandoned_stream_does_not_hold_llm_slot(estimate_tokens):
+    searcher = LawSearchIntegrated(
+        max_concurrent_llm_calls=1, llm_client=StubLLMClient()
+    )
+    searcher.context_builder.count_tokens = estimate_tokens
+    built = searcher.build_context("건축허가 요건", [], [make_article(1, "허가 요건")])
+
+    async def run():
+        stream = searcher.stream_generated_answer("건축허가 요건", built)
+        first = await anext(stream)
+        # 소비자가 첫 조각만 받고 멈춰도 (닫지 않음) 슬롯은 생성이 끝나면 반납됨
+        answer = await asyncio.wait_for(searcher._complete("다른 질문"), 1)
+        await stream.aclose()
+        return first, answer
+
+    first, answer = asyncio.run(run())
+
+    assert first == "단"
+    assert answer == "단일 답변"
+
+
+class StubProvider:
+    """검색 API 대역: delay초 뒤 urls를 돌려주고 시작/취소를 기록"""
+
+    def __init__(self, urls, delay: float):
+        self.urls = urls
+        self.delay = delay
+        self.queries = []
+        self.cancelled = False
+
+    async def __call__(self, query, domains=None, num_results=5):
+        self.queries.append(query)
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return list(self.urls)
+
+
+@pytest.fixture
+def hedging_searcher():
+    return LawSearchIntegrated(search_hedge_delay=0.05, search_deadline=1.0)
+
+
+def run_search(searcher, monkeypatch, cse, tavily, merge=None, deadline=None):
+    monkeypatch.setattr(searcher, "google_cse_search", cse)
+    monkeypatch.setattr(searcher, "tavily_search", tavily)
+
+    async def run():
+        urls = await searcher._search_providers(
+            "건축허가를 받으려면?",
+            "건축허가",
+            domains=None,
+            num_results=5,
+            hedge_delay=None,
+            deadline=deadline,
+            merge=merge,
+            use_cse=True,
+            use_tavily=True,
+        )
+        # 취소된 작업이 정리될 시간을 줌
+        await asyncio.sleep(0)
+        return urls
+
+    return asyncio.run(run())
+
+
+def test_fast_cse_result_skips_tavily(hedging_searcher, monkeypatch):
+    cse = StubProvider(["https://cse/1"], delay=0)
+    tavily = StubProvider(["https://tavily/1"], delay=0)
+
+    assert run_search(hedging_searcher, monkeypatch, cse, tavily) == ["https://cse/1"]
+    assert cse.queries == ["건축허가를 받으려면?"]
+    assert tavily.queries == []
+
+
+def test_slow_cse_is_hedged_and_cancelled(hedging_searcher, monkeypatch):
+    cse = StubProvider(["https://cse/1"], delay=0.5)
+    tavily = StubProvider(["https://tavily/1"], delay=0)
+
+    assert run_search(hedging_searcher, monkeypatch, cse, tavily) == [
+        "https://tavily/1"
+    ]
+    # Tavily는 추출된 키워드로 검색하고, 늦은 CSE는 취소됨
+    assert tavily.queries == ["건축허가"]
+    assert cse.cancelled
+
+
+def test_empty_cse_result_falls_back_to_tavily(hedging_searcher, monkeypatch):
+    cse = StubProvider([], delay=0)
+    tavily = StubProvider(["https://tavily/1"], delay=0)
+
+    assert run_search(hedging_searcher, monkeypatch, cse, tavily) == [
+        "https://tavily/1"
+    ]
+
+
+def test_merge_waits_for_both_and_dedupes(hedging_searcher, monkeypatch):
+    cse = StubProvider(["https://a", "https://b"], delay=0.1)
+    tavily = StubProvider(["https://b", "https://c"], delay=0)
+
+    urls = run_search(hedging_searcher, monkeypatch, cse, tavily, merge=True)
+
+    # 도착 순서대로 합치고 중복 제거
+    assert urls == ["https://b", "https://c", "https://a"]
+    assert not cse.cancelled
+
+
+def test_deadline_cancels_both_and_returns_empty(hedging_searcher, monkeypatch):
+    cse = StubProvider(["https://cse/1"], delay=5)
+    tavily = StubProvider(["https://tavily/1"], delay=5)
+
+    started_at = time.perf_counter()
+    urls = run_search(hedging_searcher, monkeypatch, cse, tavily, deadline=0.2)
+
+    assert urls == []
+    assert time.perf_counter() - started_at < 1
+    assert cse.cancelled and tavily.cancelled